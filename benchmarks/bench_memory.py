@@ -0,0 +1,118 @@
+"""
+Memory used per function by its annotations and by @execute_annotations.
+
+    python benchmarks/bench_memory.py                            # print results as JSON
+    python benchmarks/bench_memory.py --output baseline.json     # store them as a baseline
+    python benchmarks/bench_memory.py --compare baseline.json    # fail if anything uses more memory
+"""
+import gc
+import sys
+import json
+import argparse
+import platform
+import tracemalloc
+
+from typing_exe.annotations import Assert, Modify, Sequence
+from typing_exe.decorators import execute_annotations
+
+
+def is_positive(a):
+    return a > 0
+
+
+def is_smaller(b, a):
+    return b < a
+
+
+# Every call defines a new function, like many modules with similar functions would
+def shared_validators():
+    def fct(a: Assert[is_positive], b: Sequence[Modify[abs], Assert[is_positive, is_smaller]], c: Assert[int] = 1):
+        return a + b + c
+    return fct
+
+
+def own_validators():
+    def fct(a: Assert[lambda a: a > 0], b: Modify[lambda b: b * 2], *, c: Assert[lambda c, a: c != a] = 1):
+        return a + b + c
+    return fct
+
+
+CASES = {
+    "shared_validators": shared_validators,
+    "own_validators": own_validators,
+}
+
+
+def measure(create, decorate, number):
+    # Returns the bytes per function that are needed to define it, and to decorate it
+    gc.collect()
+    tracemalloc.start()
+    try:
+        functions = [create() for _ in range(number)]
+        defined = tracemalloc.get_traced_memory()[0]
+        decorated = [decorate(fct) for fct in functions]
+        gc.collect()
+        total = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    del functions, decorated
+    return defined / number, (total - defined) / number
+
+
+def run_benchmarks(number):
+    results = {}
+    for name, create in CASES.items():
+        execute_annotations(create())   # Fill the caches that are shared by all functions
+
+        definition, generic = measure(create, execute_annotations(level="full"), number)
+        _, compiled = measure(create, execute_annotations(compiled=True, level="full"), number)
+        results[name] = {"definition": definition, "generic": generic, "compiled": compiled}
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "number": number,
+        "unit": "bytes per function",
+        "results": results,
+    }
+
+
+def compare(results, baseline, tolerance):
+    regressions = []
+    for name, sizes in results["results"].items():
+        for key, size in sizes.items():
+            expected = baseline["results"].get(name, {}).get(key)
+            if expected is not None and size > expected * (1 + tolerance):
+                regressions.append(f"{name}.{key}: {size:.0f} (baseline: {expected:.0f})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter   # Keeps the usage-examples
+    )
+    parser.add_argument("--number", type=int, default=2_000, help="functions per measurement")
+    parser.add_argument("--output", help="write the results to this file instead of stdout")
+    parser.add_argument("--compare", help="baseline to compare the results against")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="allowed relative increase")
+    arguments = parser.parse_args()
+
+    results = run_benchmarks(arguments.number)
+    if arguments.output:
+        with open(arguments.output, "w") as file:
+            json.dump(results, file, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+    if arguments.compare:
+        with open(arguments.compare) as file:
+            regressions = compare(results, json.load(file), arguments.tolerance)
+        for regression in regressions:
+            print(f"Regression: {regression}", file=sys.stderr)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+Per-call overhead of @execute_annotations compared to the undecorated function.
+
+    python benchmarks/bench_overhead.py                            # print results as JSON
+    python benchmarks/bench_overhead.py --output baseline.json     # store them as a baseline
+    python benchmarks/bench_overhead.py --compare baseline.json    # fail if anything got slower
+"""
+import sys
+import json
+import timeit
+import argparse
+import platform
+from concurrent.futures import ThreadPoolExecutor
+
+from typing_exe.annotations import Assert, Modify, Sequence
+from typing_exe.decorators import execute_annotations
+from typing_exe.early_return import EarlyReturn
+
+
+def positional_only(a: Assert[lambda a: a > 0], b: Modify[lambda b: b + 1], c, /):
+    return a + b + c
+
+
+def keyword_only(*, a: Assert[lambda a: a > 0], b: Modify[lambda b: b + 1], c):
+    return a + b + c
+
+
+def mixed(a: Assert[lambda a: a > 0], /, b: Modify[lambda b: b + 1], *, c: Assert[lambda c: c != 0]):
+    return a + b + c
+
+
+def many_defaults(
+        a: Assert[lambda a: a > 0],
+        b: Assert[lambda b: b > 0] = 1,
+        c: Modify[lambda c: c * 2] = 2,
+        d=3,
+        e=4,
+        f: Assert[lambda f: f is not None] = 5,
+        g: Modify[lambda g: g] = EarlyReturn(None)
+):
+    return a + b + c + d + e + f + g
+
+
+def early_return_default(
+        a: Assert[lambda a: a > 0],
+        b: Assert[lambda b: b > 0] = 1,
+        c: Modify[lambda c: c * 2] = 2,
+        d=3,
+        e=4,
+        f: Assert[lambda f: f is not None] = 5,
+        g: Modify[lambda g: g] = EarlyReturn(None)
+):
+    # Called without g, so the decorated variants return its EarlyReturn; the plain one can't add it up
+    return a + b + c + d + e + f
+
+
+def comparisons(
+        a,
+        b: Assert[lambda b, a: b > a],
+        c: Assert[lambda c, a, b: a < c < b * 10, lambda c, b: c != b]
+):
+    return a + b + c
+
+
+def long_sequence(
+        a: Sequence[
+            Assert[lambda a: a is not None],
+            Modify[lambda a: a + 1],
+            Assert[lambda a: a > 0],
+            Modify[lambda a: a * 2],
+            Assert[lambda a: a % 2 == 0],
+            Modify[lambda a: a - 1],
+            Assert[lambda a: a < 10 ** 9],
+            Modify[lambda a: abs(a)]
+        ]
+):
+    return a
+
+
+def return_value(a: int) -> Sequence[Assert[lambda r: r >= 0], Modify[lambda r: r + 1]]:
+    return a * 2
+
+
+CASES = {
+    "positional_only": (positional_only, (1, 2, 3), {}),
+    "keyword_only": (keyword_only, (), {"a": 1, "b": 2, "c": 3}),
+    "mixed": (mixed, (1, 2), {"c": 3}),
+    "many_defaults": (many_defaults, (1,), {"g": 7}),
+    "early_return_default": (early_return_default, (1,), {}),
+    "comparisons": (comparisons, (1, 2), {"c": 3}),
+    "long_sequence": (long_sequence, (1,), {}),
+    "return_value": (return_value, (1,), {}),
+}
+
+
+def time_call(fct, args, kwargs, number):
+    timer = timeit.Timer(lambda: fct(*args, **kwargs))
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e9   # ns per call
+
+
+def time_threaded(fct, args, kwargs, number, workers=8):
+    def work(_):
+        for _ in range(number // workers):
+            fct(*args, **kwargs)
+
+    def run():
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(work, range(workers)))
+
+    return min(timeit.repeat(run, repeat=3, number=1)) / number * 1e9
+
+
+def run_benchmarks(number):
+    results = {}
+    for name, (fct, args, kwargs) in CASES.items():
+        variants = {
+            "plain": fct,
+            "generic": execute_annotations(level="full")(fct),
+            "compiled": execute_annotations(compiled=True, level="full")(fct),
+        }
+        results[name] = {variant: time_call(f, args, kwargs, number) for variant, f in variants.items()}
+
+        if name == "mixed":
+            results["threaded"] = {
+                variant: time_threaded(f, args, kwargs, number) for variant, f in variants.items()
+            }
+
+    for timings in results.values():
+        timings["generic_overhead"] = timings["generic"] / timings["plain"]
+        timings["compiled_overhead"] = timings["compiled"] / timings["plain"]
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "number": number,
+        "unit": "ns per call",
+        "results": results,
+    }
+
+
+def compare(results, baseline, tolerance):
+    # Compare the overhead-ratios, which are less dependent on the machine than absolute times
+    regressions = []
+    for name, timings in results["results"].items():
+        for key in ("generic_overhead", "compiled_overhead"):
+            expected = baseline["results"].get(name, {}).get(key)
+            if expected is not None and timings[key] > expected * (1 + tolerance):
+                regressions.append(f"{name}.{key}: {timings[key]:.2f} (baseline: {expected:.2f})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter   # Keeps the usage-examples
+    )
+    parser.add_argument("--number", type=int, default=20_000, help="calls per measurement")
+    parser.add_argument("--output", help="write the results to this file instead of stdout")
+    parser.add_argument("--compare", help="baseline to compare the results against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative slowdown")
+    arguments = parser.parse_args()
+
+    results = run_benchmarks(arguments.number)
+    if arguments.output:
+        with open(arguments.output, "w") as file:
+            json.dump(results, file, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+    if arguments.compare:
+        with open(arguments.compare) as file:
+            regressions = compare(results, json.load(file), arguments.tolerance)
+        for regression in regressions:
+            print(f"Regression: {regression}", file=sys.stderr)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Fan-out of decorated functions over a process-pool, compared to the undecorated functions.
+
+    python benchmarks/bench_pool.py                            # print results as JSON
+    python benchmarks/bench_pool.py --output baseline.json     # store them as a baseline
+    python benchmarks/bench_pool.py --compare baseline.json    # fail if anything got slower
+"""
+import os
+import sys
+import json
+import time
+import pickle
+import argparse
+import platform
+from concurrent.futures import ProcessPoolExecutor
+
+from typing_exe.annotations import Assert, Modify, Sequence
+from typing_exe.decorators import execute_annotations
+
+
+def score(
+        values: Sequence[
+            Modify[lambda values: [abs(value) for value in values]],
+            Assert[lambda values: len(values) > 0]
+        ],
+        rounds: Assert[lambda rounds: rounds > 0] = 200
+):
+    # Enough work per call that it is worth sending to another process
+    total = 0
+    for _ in range(rounds):
+        total = sum(value * value for value in values) % 1_000_003
+    return total
+
+
+def cheap(a: Assert[lambda a: a >= 0], b: Modify[lambda b: b + 1]):
+    return a + b
+
+
+def decorate(fct, name, **options):
+    # A decorated copy of fct under its own module-level name, so that the processes can import it by that name
+    decorated = execute_annotations(level="full", **options)(fct)
+    decorated.__name__ = decorated.__qualname__ = name
+    return decorated
+
+
+score_generic = decorate(score, "score_generic")
+score_compiled = decorate(score, "score_compiled", compiled=True)
+cheap_generic = decorate(cheap, "cheap_generic")
+cheap_compiled = decorate(cheap, "cheap_compiled", compiled=True)
+
+CASES = {
+    "score": ({"plain": score, "generic": score_generic, "compiled": score_compiled}, lambda i: ([i, -i, i + 1],)),
+    "cheap": ({"plain": cheap, "generic": cheap_generic, "compiled": cheap_compiled}, lambda i: (i, i)),
+}
+
+
+def time_map(executor, fct, arguments, chunksize):
+    start = time.perf_counter()
+    for _ in executor.map(fct, *zip(*arguments), chunksize=chunksize):
+        pass
+    return time.perf_counter() - start
+
+
+def run_benchmarks(number, workers, chunksize):
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(abs, range(workers * 4)))   # Start the processes before measuring
+
+        for name, (variants, make_arguments) in CASES.items():
+            arguments = [make_arguments(i) for i in range(number)]
+            timings = {}
+            for variant, fct in variants.items():
+                time_map(executor, fct, arguments[:workers * chunksize], chunksize)   # The processes import fct
+                timings[variant] = min(
+                    time_map(executor, fct, arguments, chunksize) for _ in range(3)
+                ) / number * 1e6
+                timings[f"{variant}_pickled_bytes"] = len(pickle.dumps(fct))
+
+            serial = variants["generic"]
+            start = time.perf_counter()
+            for args in arguments:
+                serial(*args)
+            timings["generic_serial"] = (time.perf_counter() - start) / number * 1e6
+
+            timings["generic_overhead"] = timings["generic"] / timings["plain"]
+            timings["compiled_overhead"] = timings["compiled"] / timings["plain"]
+            timings["generic_speedup"] = timings["generic_serial"] / timings["generic"]
+            results[name] = timings
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "number": number,
+        "workers": workers,
+        "chunksize": chunksize,
+        "unit": "microseconds per call",
+        "results": results,
+    }
+
+
+def compare(results, baseline, tolerance):
+    # Compare the overhead-ratios, which are less dependent on the machine than absolute times
+    regressions = []
+    for name, timings in results["results"].items():
+        for key in ("generic_overhead", "compiled_overhead"):
+            expected = baseline["results"].get(name, {}).get(key)
+            if expected is not None and timings[key] > expected * (1 + tolerance):
+                regressions.append(f"{name}.{key}: {timings[key]:.2f} (baseline: {expected:.2f})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter   # Keeps the usage-examples
+    )
+    parser.add_argument("--number", type=int, default=5_000, help="calls per measurement")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="processes in the pool")
+    parser.add_argument("--chunksize", type=int, default=50, help="calls sent to a process at once")
+    parser.add_argument("--output", help="write the results to this file instead of stdout")
+    parser.add_argument("--compare", help="baseline to compare the results against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative slowdown")
+    arguments = parser.parse_args()
+
+    results = run_benchmarks(arguments.number, arguments.workers, arguments.chunksize)
+    if arguments.output:
+        with open(arguments.output, "w") as file:
+            json.dump(results, file, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+    if arguments.compare:
+        with open(arguments.compare) as file:
+            regressions = compare(results, json.load(file), arguments.tolerance)
+        for regression in regressions:
+            print(f"Regression: {regression}", file=sys.stderr)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
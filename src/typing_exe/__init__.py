@@ -1,5 +1,42 @@
-import typing_exe.decorators
-import typing_exe.annotations
-import typing_exe.early_return
-import typing_exe.util
-import typing_exe.parameter_data
+import importlib
+
+
+# Submodules are only imported when they are first used, to keep importing typing_exe fast
+_submodules = (
+    "decorators",
+    "annotations",
+    "early_return",
+    "util",
+    "parameter_data",
+    "codegen",
+    "enforcement",
+    "profiling",
+    "cache",
+    "typecheck",
+    "pools",
+    "errors",
+    "optimizer",
+    "arrays",
+    "events",
+    "metrics",
+    "plans",
+    "deferred",
+    "validation",
+    "pickling",
+)
+_attributes = {
+    "stats": "profiling",
+    "reset_stats": "profiling",
+}
+
+
+def __getattr__(name):
+    if name in _submodules:
+        return importlib.import_module(f"typing_exe.{name}")
+    if name in _attributes:
+        return getattr(importlib.import_module(f"typing_exe.{_attributes[name]}"), name)
+    raise AttributeError(f"module 'typing_exe' has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_submodules) | set(_attributes))
@@ -1,13 +1,121 @@
 import inspect
-from typing import Union, Type, Any
-from collections import OrderedDict
+import weakref
+from typing import Union, Type, Any, Optional
+from collections.abc import Mapping
 
 import typing_exe as texe
+from typing_exe import events, profiling
+from typing_exe.cache import LRUCache, CacheInfo
 from typing_exe.early_return import EarlyReturn
-from typing_exe.parameter_data import ParameterData
+from typing_exe.errors import AssertFailed, BindingError, TypehintViolated, ValidationError
+from typing_exe.parameter_data import ParameterData, ParameterBinding
 
 
-class _PreProcess:
+def _assert_failed(fct, parameter_name, item, parameter):
+    if events.enabled:
+        events.emit_failure(fct, parameter_name, item, parameter)
+    return AssertFailed(fct, parameter_name, item, parameter)
+
+
+def _typehint_violated(fct, parameter_name, typehint, value):
+    if events.enabled:
+        events.emit_failure(fct, parameter_name, typehint, value, typehint=True)
+    return TypehintViolated(fct, parameter_name, typehint, value)
+
+
+# Annotations with the same items are shared between functions; they are immutable, so that is safe
+_interned = weakref.WeakValueDictionary()
+
+
+class _Items(Mapping):
+    # {item: signature}, backed by a tuple of (item, signature, unary)-triples;
+    #   unary is True if the item only takes the annotated parameter
+    __slots__ = ("calls",)
+
+    def __init__(self, pairs):
+        self.calls = tuple(
+            (item, item_signature, len(item_signature.parameters) == 1) for item, item_signature in pairs
+        )
+
+    def __getitem__(self, item):
+        for key, item_signature, _ in self.calls:
+            if key is item or key == item:
+                return item_signature
+        raise KeyError(item)
+
+    def __iter__(self):
+        return (key for key, *_ in self.calls)
+
+    def __len__(self):
+        return len(self.calls)
+
+    def items(self):
+        return ((item, item_signature) for item, item_signature, _ in self.calls)
+
+    def __reduce__(self):
+        # The signatures are computed again where the items are unpickled
+        return texe.pickling.rebuild_items, (tuple(texe.pickling.reference(item) for item in self),)
+
+
+class _Annotation:
+    __slots__ = ()
+    _fields = ()
+    _defaults = {}
+
+    @classmethod
+    def create(cls, **values):
+        annotation = object.__new__(cls)
+        for name in cls._fields:
+            object.__setattr__(annotation, name, values.get(name, cls._defaults.get(name)))
+        return annotation
+
+    @classmethod
+    def interned(cls, typehint, items):
+        if items is not None and any(_never_shared(item) for item in items):
+            return cls.create(typehint=typehint, items=items)
+
+        key = (cls, typehint, None if items is None else tuple(items))
+        try:
+            annotation = _interned.get(key)
+        except TypeError:   # Unhashable typehint or items
+            return cls.create(typehint=typehint, items=items)
+
+        if annotation is None:
+            annotation = _interned.setdefault(key, cls.create(typehint=typehint, items=items))
+        return annotation
+
+    def replace(self, **changes):
+        return self.create(**{name: changes.get(name, getattr(self, name)) for name in self._fields})
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable; use .replace({name}=...) instead")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        # Lambdas in the items are pickled as references to the annotations they are defined in;
+        #   the checker is compiled again where the annotation is unpickled
+        values = {name: getattr(self, name) for name in self._fields if name != "checker"}
+        return texe.pickling.rebuild_annotation, (type(self), values, self.checker is not None)
+
+
+def _never_shared(item) -> bool:
+    # Lambdas are new with every definition, so annotations with them would only fill up _interned
+    if isinstance(item, _Annotation):
+        return any(_never_shared(sub_item) for sub_item in item.items or ())
+    return getattr(item, "__name__", None) == "<lambda>"
+
+
+class _PreProcess(_Annotation):
+    __slots__ = ()
+
     @staticmethod
     def parse_getitem(items):
         # Checks is never empty because this eventuality
@@ -17,23 +125,91 @@ class _PreProcess:
         if len(items) == 1 and texe.util.is_typehint(items[0]):
             return items[0], None
         if len(items) == 1 and callable(items[0]):
-            return None, {items[0]: inspect.signature(items[0])}
+            return None, _Items([(items[0], texe.util.item_signature(items[0]))])
         if len(items) > 1:
             typehint = None
             if texe.util.is_typehint(items[0]):
                 typehint = items[0]
                 items = items[1:]
 
-            new_items = OrderedDict()
+            new_items = {}
             for item in items:
                 if callable(item) and not texe.util.is_typehint(item):
-                    new_items[item] = inspect.signature(item)
-            items = new_items
-            items = None if not items else items   # Assume None or has entries in .enforce
+                    new_items[item] = texe.util.item_signature(item)
+            items = _Items(new_items.items()) if new_items else None   # Assume None or has entries in .enforce
             return typehint, items
 
         return None, None  # in case of complete nonsense
 
+    def bind(self, fct, parameter_name, pdata: ParameterData):
+        if self.items is None:
+            return
+
+        for item, item_signature in self.items.items():
+            if len(item_signature.parameters) > 1 and item not in pdata.bindings:
+                pdata.bindings[item] = self.bind_item(
+                    self.context, item, item_signature, fct, parameter_name, pdata
+                )
+
+    @staticmethod
+    def bind_item(
+            context: str,
+            item: callable,
+            item_signature: inspect.Signature,
+            fct,
+            parameter_name,
+            pdata: ParameterData
+    ) -> tuple:
+        # Assume that first parameter to item is annotated parameter
+        parameters = pdata.function_signature.parameters
+        accepts_var_keyword = any(
+            parameter.kind == inspect.Parameter.VAR_KEYWORD for parameter in parameters.values()
+        )
+
+        bindings = []
+        for idx, pname in enumerate(list(item_signature.parameters.keys())[1:]):
+            parameter = parameters.get(pname)
+            if pname == pdata.bound_parameter:   # self or cls is always the first positional argument
+                bindings.append(ParameterBinding(pname, 0, False, inspect.Parameter.empty))
+            elif parameter is None and accepts_var_keyword:
+                bindings.append(ParameterBinding(pname, None, True, inspect.Parameter.empty))
+            elif parameter is None:
+                raise BindingError(context, item, fct, parameter_name, idx, pname)
+            else:
+                positional = parameter.kind in (
+                    inspect.Parameter.POSITIONAL_ONLY,
+                    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                    inspect.Parameter.VAR_POSITIONAL
+                )
+                keyword = parameter.kind in (
+                    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                    inspect.Parameter.KEYWORD_ONLY
+                )
+                bindings.append(ParameterBinding(
+                    name=pname,
+                    index=pdata.index_from_argname.get(pname) if positional else None,
+                    keyword=keyword,
+                    default=parameter.default
+                ))
+
+        return tuple(bindings)
+
+    @staticmethod
+    def binding_error(context, item, fct, parameter_name, idx, pname, parameter=inspect.Parameter.empty) -> str:
+        value_str = "" if parameter is inspect.Parameter.empty else f"\t\t- Value: {parameter}\n"
+        return f"Error with comparing parameters:\n" \
+               f"\t- Callable: \n" \
+               f"\t\t- Name: {fct.__qualname__}\n" \
+               f"\t\t- Module: {fct.__module__}\n" \
+               f"\t{context}-statement:\n" \
+               f"\t\t- Name: {item.__qualname__}\n" \
+               f"\t\t- Module: {item.__module__}\n" \
+               f"\t- Annotated parameter: \n" \
+               f"\t\t- Name: {parameter_name}\n" \
+               f"{value_str}" \
+               f"\t- Parameter {idx} to function in {context} has non-existent name:\n" \
+               f"\t\t- Name: {pname}"
+
     @staticmethod
     def execute_item(
             context: str,
@@ -45,78 +221,291 @@ class _PreProcess:
             args,
             kwargs,
             pdata: ParameterData
+    ) -> Any:
+        if profiling.enabled and profiling.collects_stats():
+            return profiling.profile_item(
+                _PreProcess.call_item,
+                context, item, item_signature, fct, parameter, parameter_name, args, kwargs, pdata
+            )
+        return _PreProcess.call_item(
+            context, item, item_signature, fct, parameter, parameter_name, args, kwargs, pdata
+        )
+
+    @staticmethod
+    def call_item(
+            context: str,
+            item: callable,
+            item_signature: inspect.Signature,
+            fct,
+            parameter: Any,
+            parameter_name,
+            args,
+            kwargs,
+            pdata: ParameterData
     ) -> Any:
         if len(item_signature.parameters) == 1:
             return item(parameter)
 
         # More than one parameter to Assert- or Modify-item -> compare with other parameters
-        # Assume that first parameter to item is annotated parameter
-        other_parameter_names = list(item_signature.parameters.keys())[1:]
+        other_parameters = _PreProcess.resolve_item(
+            context, item, item_signature, fct, parameter, parameter_name, args, kwargs, pdata
+        )
+        return item(parameter, *other_parameters)
+
+    @staticmethod
+    def resolve_item(
+            context: str,
+            item: callable,
+            item_signature: inspect.Signature,
+            fct,
+            parameter: Any,
+            parameter_name,
+            args,
+            kwargs,
+            pdata: ParameterData
+    ) -> list:
+        bindings = pdata.bindings.get(item)
+        if bindings is None:   # pdata wasn't created by @execute_annotations
+            bindings = pdata.bindings[item] = _PreProcess.bind_item(
+                context, item, item_signature, fct, parameter_name, pdata
+            )
+
         other_parameters = []
-        for idx, pname in enumerate(other_parameter_names):
-            if pname in kwargs.keys():
-                other_parameters.append(kwargs.get(pname))
-            elif pname in pdata.index_from_argname.keys() and pdata.index_from_argname.get(pname) < len(args):
-                other_parameters.append(args[pdata.index_from_argname.get(pname)])
-            elif pname in pdata.defaultdata.keys():
-                other_parameters.append(pdata.defaultdata.get(pname).get("value"))
+        for idx, binding in enumerate(bindings):
+            if binding.keyword and binding.name in kwargs:
+                other_parameters.append(kwargs[binding.name])
+            elif binding.index is not None and binding.index < len(args):
+                other_parameters.append(args[binding.index])
+            elif binding.default is not inspect.Parameter.empty:
+                other_parameters.append(binding.default)
             else:
-                raise ValueError(
-                   f"Error with comparing parameters:\n"
-                   f"\t- Callable: \n" 
-                   f"\t\t- Name: {fct.__qualname__}\n" 
-                   f"\t\t- Module: {fct.__module__}\n" 
-                   f"\t{context}-statement:\n" 
-                   f"\t\t- Name: {item.__qualname__}\n" 
-                   f"\t\t- Module: {item.__module__}\n" 
-                   f"\t- Annotated parameter: \n" 
-                   f"\t\t- Name: {parameter_name}\n" 
-                   f"\t\t- Value: {parameter}\n"
-                   f"\t- Parameter {idx} to function in {context} has non-existent name:\n"
-                   f"\t\t- Name: {pname}"
-                )
+                raise BindingError(context, item, fct, parameter_name, idx, binding.name, parameter)
 
-        return item(parameter, *other_parameters)
+        return other_parameters
+
+    def callables(self):
+        for item, item_signature in (self.items or {}).items():
+            yield self.context, item, item_signature
+
+    def with_typechecks(self):
+        if self.typehint is None:
+            return self
 
+        return self.replace(checker=texe.typecheck.compile_typehint(self.typehint))
+
+
+class _Pure(_Annotation):
+    __slots__ = ()
+
+    def pure(self, maxsize: int = 128, ttl: Optional[float] = None):
+        return self.replace(cache=LRUCache(maxsize=maxsize, ttl=ttl))
+
+    def cache_info(self) -> Optional[CacheInfo]:
+        return None if self.cache is None else self.cache.info()
+
+    def cache_clear(self):
+        if self.cache is not None:
+            self.cache.clear()
+
+    def cache_key(self, fct, parameter, parameter_name, args, kwargs, pdata: ParameterData):
+        # The result of a pure annotation only depends on the parameter and the other parameters its items use;
+        #   like lru_cache(typed=True), equal values of different types (1, 1.0, True) get different entries
+        other_parameters = tuple(
+            (type(value), value)
+            for context, item, item_signature in self.callables()
+            if len(item_signature.parameters) > 1
+            for value in _PreProcess.resolve_item(
+                context, item, item_signature, fct, parameter, parameter_name, args, kwargs, pdata
+            )
+        )
+        key = (type(parameter), parameter, other_parameters)
+        try:
+            hash(key)
+        except TypeError:
+            return None   # Unhashable values are never cached
+        return key
+
+    @staticmethod
+    def emit(fct, parameter_name, value):
+        if isinstance(value, EarlyReturn):
+            events.emit(events.EARLY_RETURN, fct, parameter_name, value=value.returns)
+        else:
+            events.emit(events.MODIFY_APPLIED, fct, parameter_name, value=value)
+
+    def enforce(self, fct, parameter, parameter_name, args, kwargs, pdata: ParameterData):
+        key = None if self.cache is None else self.cache_key(fct, parameter, parameter_name, args, kwargs, pdata)
+        if key is None:
+            value = self.run_items(fct, parameter, parameter_name, args, kwargs, pdata)
+        else:
+            hit, value = self.cache.lookup(key)
+            if not hit:
+                value = self.run_items(fct, parameter, parameter_name, args, kwargs, pdata)
+                self.cache.store(key, value)
+
+        if self.checker is not None and not isinstance(value, EarlyReturn) and not self.checker(value):
+            raise _typehint_violated(fct, parameter_name, self.typehint, value)
+        if events.enabled and isinstance(self, _Modify):
+            self.emit(fct, parameter_name, value)
+        return value
+
+    async def enforce_async(self, fct, parameter, parameter_name, args, kwargs, pdata: ParameterData):
+        key = None if self.cache is None else self.cache_key(fct, parameter, parameter_name, args, kwargs, pdata)
+        if key is None:
+            value = await self.run_items_async(fct, parameter, parameter_name, args, kwargs, pdata)
+        else:
+            hit, value = self.cache.lookup(key)
+            if not hit:
+                value = await self.run_items_async(fct, parameter, parameter_name, args, kwargs, pdata)
+                self.cache.store(key, value)
+
+        if self.checker is not None and not isinstance(value, EarlyReturn) and not self.checker(value):
+            raise _typehint_violated(fct, parameter_name, self.typehint, value)
+        if events.enabled and isinstance(self, _Modify):
+            self.emit(fct, parameter_name, value)
+        return value
 
 
 class _Assert(_PreProcess):
+    __slots__ = ("typehint", "items", "checker", "process_pool", "__weakref__")
+    _fields = ("typehint", "items", "checker", "process_pool")
+    _defaults = {"process_pool": False}
+    context = "Assert"
+    modifies = False
+
     def __getitem__(self, items):
-        self.typehint, self.items = self.parse_getitem(items)
-        return self
+        typehint, items = self.parse_getitem(items)
+        return self.interned(typehint, items)
 
     def enforce(self, fct, parameter, parameter_name, args, kwargs, pdata: ParameterData):
-        if self.items is None or parameter is None:
+        if parameter is None:
+            return parameter
+        if self.checker is not None and not self.checker(parameter):
+            raise _typehint_violated(fct, parameter_name, self.typehint, parameter)
+        if self.items is None:
             return parameter
 
-        for item, item_signature in self.items.items():
-            if not self.execute_item(
+        for item, item_signature, unary in self.items.calls:
+            if not (item(parameter) if unary and not profiling.enabled else self.execute_item(
                     "Assert", item, item_signature, fct, parameter, parameter_name, args, kwargs, pdata
-            ):
-                err_str = f"\nAssert failed! \n" \
-                          f"\t- Callable: \n" \
-                          f"\t\t- Name: {fct.__qualname__}\n" \
-                          f"\t\t- Module: {fct.__module__}\n" \
-                          f"\tAssertion:\n" \
-                          f"\t\t- Name: {item.__qualname__}\n" \
-                          f"\t\t- Module: {item.__module__}\n" \
-                          f"\t- Parameter: \n" \
-                          f"\t\t- Name: {parameter_name}\n" \
-                          f"\t\t- Value: {parameter}\n"
-                raise ValueError(err_str)
+            )):
+                raise _assert_failed(fct, parameter_name, item, parameter)
 
         return parameter
 
+    async def enforce_async(self, fct, parameter, parameter_name, args, kwargs, pdata: ParameterData):
+        if parameter is None:
+            return parameter
+        if self.checker is not None and not self.checker(parameter):
+            raise _typehint_violated(fct, parameter_name, self.typehint, parameter)
+        if self.items is None:
+            return parameter
+
+        for item, item_signature, unary in self.items.calls:
+            result = item(parameter) if unary and not profiling.enabled else self.execute_item(
+                "Assert", item, item_signature, fct, parameter, parameter_name, args, kwargs, pdata
+            )
+            if inspect.isawaitable(result):
+                result = await result
+            if not result:
+                raise _assert_failed(fct, parameter_name, item, parameter)
+
+        return parameter
+
+    def without_asserts(self):
+        return None
+
+    def in_process_pool(self):
+        return self.replace(process_pool=True)
+
+    def deferred(self):
+        return _DeferredAssert.create(**{name: getattr(self, name) for name in self._fields})
+
+    @staticmethod
+    def failure_message(fct, item, parameter, parameter_name) -> str:
+        return f"\nAssert failed! \n" \
+               f"\t- Callable: \n" \
+               f"\t\t- Name: {fct.__qualname__}\n" \
+               f"\t\t- Module: {fct.__module__}\n" \
+               f"\tAssertion:\n" \
+               f"\t\t- Name: {item.__qualname__}\n" \
+               f"\t\t- Module: {item.__module__}\n" \
+               f"\t- Parameter: \n" \
+               f"\t\t- Name: {parameter_name}\n" \
+               f"\t\t- Value: {parameter}\n"
+
+
+class _DeferredAssert(_Assert):
+    # Checked by a background-thread after the function was called; failures are reported, not raised
+    __slots__ = ()
+
+    def enforce(self, fct, parameter, parameter_name, args, kwargs, pdata: ParameterData):
+        if parameter is None:
+            return parameter
+
+        # The other parameters are resolved now, because args and kwargs are changed later
+        texe.deferred.submit(self, fct, parameter, parameter_name, tuple(
+            (item, () if unary else self.resolve_item(
+                "Assert", item, item_signature, fct, parameter, parameter_name, args, kwargs, pdata
+            ))
+            for item, item_signature, unary in (self.items.calls if self.items is not None else ())
+        ))
+        return parameter
+
+    async def enforce_async(self, fct, parameter, parameter_name, args, kwargs, pdata: ParameterData):
+        return self.enforce(fct, parameter, parameter_name, args, kwargs, pdata)
+
+
+class _ArrayAssert(_PreProcess):
+    # The items are element-wise predicates that are evaluated over whole arrays at once
+    __slots__ = ("typehint", "items", "checker", "dtype", "shape", "contiguous", "__weakref__")
+    _fields = ("typehint", "items", "checker", "dtype", "shape", "contiguous")
+    _defaults = {"contiguous": False}
+    context = "ArrayAssert"
+    modifies = False
 
-class _Modify(_PreProcess):
     def __getitem__(self, items):
-        self.typehint, self.items = self.parse_getitem(items)
-        return self
+        typehint, items = self.parse_getitem(items)
+        return self.interned(typehint, items)
+
+    def requires(self, dtype=None, shape=None, contiguous: bool = False):
+        return self.replace(dtype=dtype, shape=None if shape is None else tuple(shape), contiguous=contiguous)
 
     def enforce(self, fct, parameter, parameter_name, args, kwargs, pdata: ParameterData):
+        if parameter is None:
+            return parameter
+        if self.checker is not None and not self.checker(parameter):
+            raise _typehint_violated(fct, parameter_name, self.typehint, parameter)
+
+        array = texe.arrays.as_array(parameter)
+        texe.arrays.check_requirements(self, fct, parameter, parameter_name, array)
+        for item, item_signature, unary in self.items.calls if self.items is not None else ():
+            texe.arrays.check_item(
+                self, item, item_signature, unary, fct, parameter, parameter_name, args, kwargs, pdata, array
+            )
+
+        return parameter
+
+    async def enforce_async(self, fct, parameter, parameter_name, args, kwargs, pdata: ParameterData):
+        return self.enforce(fct, parameter, parameter_name, args, kwargs, pdata)
+
+    def without_asserts(self):
+        return None
+
+
+class _Modify(_Pure, _PreProcess):
+    __slots__ = ("typehint", "items", "checker", "cache", "__weakref__")
+    _fields = ("typehint", "items", "checker", "cache")
+    context = "Modify"
+    modifies = True
+
+    def __getitem__(self, items):
+        typehint, items = self.parse_getitem(items)
+        return self.interned(typehint, items)
+
+    def run_items(self, fct, parameter, parameter_name, args, kwargs, pdata: ParameterData):
         if self.items is not None:
-            for item, signature in self.items.items():
-                parameter = self.execute_item(
+            for item, signature, unary in self.items.calls:
+                parameter = item(parameter) if unary and not profiling.enabled else self.execute_item(
                     "Modify", item, signature, fct, parameter, parameter_name, args, kwargs, pdata
                 )
                 if isinstance(parameter, EarlyReturn):
@@ -124,13 +513,36 @@ class _Modify(_PreProcess):
 
         return parameter
 
+    async def run_items_async(self, fct, parameter, parameter_name, args, kwargs, pdata: ParameterData):
+        if self.items is not None:
+            for item, signature, unary in self.items.calls:
+                parameter = item(parameter) if unary and not profiling.enabled else self.execute_item(
+                    "Modify", item, signature, fct, parameter, parameter_name, args, kwargs, pdata
+                )
+                if inspect.isawaitable(parameter):
+                    parameter = await parameter
+                if isinstance(parameter, EarlyReturn):
+                    return parameter   # Value unpacked in @execute_annotations
 
-class _Sequence:
-    def __getitem__(self, items):
-        self.typehint, self.items = self.parse(items)
+        return parameter
+
+    def without_asserts(self):
         return self
 
-    def enforce(self, fct, parameter, parameter_name, args, kwargs, pdata: ParameterData):
+
+class _Sequence(_Pure):
+    __slots__ = ("typehint", "items", "checker", "cache", "__weakref__")
+    _fields = ("typehint", "items", "checker", "cache")
+
+    def __getitem__(self, items):
+        typehint, items = self.parse(items)
+        return self.interned(typehint, items)
+
+    @property
+    def modifies(self):
+        return any(item.modifies for item in self.items or ())
+
+    def run_items(self, fct, parameter, parameter_name, args, kwargs, pdata: ParameterData):
         for item in self.items:
             parameter = item.enforce(fct, parameter, parameter_name, args, kwargs, pdata)
             if isinstance(parameter, EarlyReturn):
@@ -138,6 +550,40 @@ class _Sequence:
 
         return parameter
 
+    async def run_items_async(self, fct, parameter, parameter_name, args, kwargs, pdata: ParameterData):
+        for item in self.items:
+            parameter = await item.enforce_async(fct, parameter, parameter_name, args, kwargs, pdata)
+            if isinstance(parameter, EarlyReturn):
+                return parameter   # Value unpacked in @execute_annotations
+
+        return parameter
+
+    def bind(self, fct, parameter_name, pdata: ParameterData):
+        for item in self.items or ():
+            item.bind(fct, parameter_name, pdata)
+
+    def callables(self):
+        for item in self.items or ():
+            yield from item.callables()
+
+    def with_typechecks(self):
+        return self.replace(
+            items=None if self.items is None else tuple(item.with_typechecks() for item in self.items),
+            checker=None if self.typehint is None else texe.typecheck.compile_typehint(self.typehint)
+        )
+
+    def without_asserts(self):
+        items = tuple(item.without_asserts() for item in self.items or ())
+        items = tuple(item for item in items if item is not None)
+        if not items:
+            return None
+        if items == self.items:
+            return self
+
+        # Values cached without the Asserts must not be used with them
+        cache = None if self.cache is None else LRUCache(maxsize=self.cache.maxsize, ttl=self.cache.ttl)
+        return self.replace(items=items, cache=cache)
+
     def parse(self, items):
         # hints is never empty because this eventuality
         #   is caught by _HintsCreator
@@ -153,7 +599,7 @@ class _Sequence:
                 typehint = items[0]
                 items = items[1:]
 
-            items = [item for item in items if self.is_checks_or_hooks(item)]
+            items = tuple(item for item in items if self.is_checks_or_hooks(item))
             items = None if not items else items  # Assume None or has entries in .enforce
             return typehint, items
 
@@ -161,15 +607,100 @@ class _Sequence:
 
     @staticmethod
     def is_checks_or_hooks(item):
-        return isinstance(item, _Assert) or isinstance(item, _Modify)
+        return isinstance(item, (_Assert, _ArrayAssert, _Modify, _Sequence))
+
+
+class _Each(_Annotation):
+    # Applies its items to every element of an iterable while it is consumed, so nothing is materialized
+    __slots__ = ("typehint", "items", "checker", "skip", "__weakref__")
+    _fields = ("typehint", "items", "checker", "skip")
+    _defaults = {"skip": False}
+    modifies = True   # The parameter is replaced by an iterator
+
+    def __getitem__(self, items):
+        typehint, items = self.parse(items)
+        return self.interned(typehint, items)
+
+    def on_error(self, policy: str):
+        if policy not in ("raise", "skip"):
+            raise ValueError(f"The error-policy must be 'raise' or 'skip', not {policy!r}")
+        return self.replace(skip=policy == "skip")
+
+    def enforce(self, fct, parameter, parameter_name, args, kwargs, pdata: ParameterData):
+        if parameter is None:
+            return parameter
+        if hasattr(parameter, "__aiter__"):
+            return self.each_async(fct, parameter.__aiter__(), parameter_name, args, kwargs, pdata)
+        return self.each(fct, iter(parameter), parameter_name, args, kwargs, pdata)
+
+    async def enforce_async(self, fct, parameter, parameter_name, args, kwargs, pdata: ParameterData):
+        return self.enforce(fct, parameter, parameter_name, args, kwargs, pdata)
+
+    def each(self, fct, iterator, parameter_name, args, kwargs, pdata: ParameterData):
+        for element in iterator:
+            try:
+                element = self.run_items(fct, element, parameter_name, args, kwargs, pdata)
+            except ValidationError:
+                if self.skip:
+                    continue
+                raise
+            if isinstance(element, EarlyReturn):
+                return   # Ends the iteration
+            yield element
+
+    async def each_async(self, fct, iterator, parameter_name, args, kwargs, pdata: ParameterData):
+        async for element in iterator:
+            try:
+                element = await self.run_items_async(fct, element, parameter_name, args, kwargs, pdata)
+            except ValidationError:
+                if self.skip:
+                    continue
+                raise
+            if isinstance(element, EarlyReturn):
+                return   # Ends the iteration
+            yield element
+
+    def run_items(self, fct, element, parameter_name, args, kwargs, pdata: ParameterData):
+        if self.checker is not None and not self.checker(element):
+            raise _typehint_violated(fct, parameter_name, self.typehint, element)
+        for item in self.items or ():
+            element = item.enforce(fct, element, parameter_name, args, kwargs, pdata)
+            if isinstance(element, EarlyReturn):
+                return element
+        return element
+
+    async def run_items_async(self, fct, element, parameter_name, args, kwargs, pdata: ParameterData):
+        if self.checker is not None and not self.checker(element):
+            raise _typehint_violated(fct, parameter_name, self.typehint, element)
+        for item in self.items or ():
+            element = await item.enforce_async(fct, element, parameter_name, args, kwargs, pdata)
+            if isinstance(element, EarlyReturn):
+                return element
+        return element
+
+    def without_asserts(self):
+        items = tuple(item.without_asserts() for item in self.items or ())
+        items = tuple(item for item in items if item is not None)
+        if not items:
+            return None
+        return self if items == self.items else self.replace(items=items)
+
+    parse = _Sequence.parse
+    is_checks_or_hooks = staticmethod(_Sequence.is_checks_or_hooks)
+    bind = _Sequence.bind
+    callables = _Sequence.callables
+    with_typechecks = _Sequence.with_typechecks
 
 
 class _HintsCreator:
-    def __init__(self, _class: Union[Type[_Assert], Type[_Modify], Type[_Sequence]]):
+    def __init__(
+            self,
+            _class: Union[Type[_Assert], Type[_Modify], Type[_Sequence], Type[_Each], Type[_ArrayAssert]]
+    ):
         self._class = _class
 
     def __getitem__(self, item) -> Union[_Assert, _Modify]:
-        return self._class()[item]
+        return self._class.create()[item]
 
     @property
     def items(self):
@@ -201,3 +732,21 @@ Modify.__doc__ = \
 Sequence = _HintsCreator(_Sequence)
 Sequence.__doc__ = \
     """TODO"""
+
+Each = _HintsCreator(_Each)
+Each.__doc__ = \
+    """Apply Assert- and Modify-annotations to every element of an iterable while it is consumed.
+
+    Each[typehint, Assert[...], Modify[...], ...] replaces the parameter (or the return value) with a lazy iterator
+    (or async iterator), so the elements are checked and modified one at a time and the iterable is never
+    materialized. An EarlyReturn from an item ends the iteration. By default, a failing element raises;
+    .on_error("skip") drops it instead."""
+
+ArrayAssert = _HintsCreator(_ArrayAssert)
+ArrayAssert.__doc__ = \
+    """Assert element-wise predicates over a whole NumPy array (or array-like) at once.
+
+    ArrayAssert[typehint, predicate, ...] converts the parameter with np.asarray and calls every predicate once
+    with the whole array; the check fails unless all elements of the result are true. Like in Assert, predicates
+    can take other parameters by name. .requires(dtype=None, shape=None, contiguous=False) additionally checks
+    the array itself before its elements are looked at. The function-body still gets the original value."""
@@ -1,6 +1,8 @@
-from typing import Union, Type, Any
+from typing import Union, Type, Any, Optional
 from typing_extensions import TypeAlias
 
+from typing_exe.cache import CacheInfo
+
 
 def is_typehint(value) -> bool: ...
 
@@ -8,21 +10,48 @@ def is_typehint(value) -> bool: ...
 class _Assert:
     def __getitem__(self, callables): ...
     def enforce(self, fct: callable, parameter: Any, parameter_name: str): ...
+    async def enforce_async(self, fct: callable, parameter: Any, parameter_name: str): ...
+    def in_process_pool(self) -> "_Assert": ...
+    def deferred(self) -> "_Assert": ...
 
 
 class _Modify:
     def __getitem__(self, callables): ...
     def enforce(self, parameter: Any): ...
+    async def enforce_async(self, parameter: Any): ...
+    def pure(self, maxsize: int = 128, ttl: Optional[float] = None) -> "_Modify": ...
+    def cache_info(self) -> Optional[CacheInfo]: ...
+    def cache_clear(self) -> None: ...
 
 
 class _Sequence:
     def __getitem__(self, hints): ...
     def enforce(self, fct, parameter, parameter_name): ...
+    async def enforce_async(self, fct, parameter, parameter_name): ...
+    def pure(self, maxsize: int = 128, ttl: Optional[float] = None) -> "_Sequence": ...
+    def cache_info(self) -> Optional[CacheInfo]: ...
+    def cache_clear(self) -> None: ...
     def parse(self, hints): ...
     @staticmethod
     def is_checks_or_hooks(item): ...
 
 
+class _Each:
+    def __getitem__(self, hints): ...
+    def on_error(self, policy: str) -> "_Each": ...
+    def enforce(self, fct, parameter, parameter_name): ...
+    async def enforce_async(self, fct, parameter, parameter_name): ...
+
+
+class _ArrayAssert:
+    def __getitem__(self, callables): ...
+    def requires(
+            self, dtype: Optional[Any] = None, shape: Optional[tuple] = None, contiguous: bool = False
+    ) -> "_ArrayAssert": ...
+    def enforce(self, fct, parameter, parameter_name): ...
+    async def enforce_async(self, fct, parameter, parameter_name): ...
+
+
 class _HintsCreator:
     def __init__(self, _class: Union[Type[_Assert], Type[_Modify]]): ...
     def __getitem__(self, item) -> Union[_Assert, _Modify]: ...
@@ -30,4 +59,6 @@ class _HintsCreator:
 
 Assert: TypeAlias  = _HintsCreator(_Assert)
 Modify: TypeAlias = _HintsCreator(_Modify)
-Sequence: TypeAlias = _HintsCreator(_Sequence)
\ No newline at end of file
+Sequence: TypeAlias = _HintsCreator(_Sequence)
+Each: TypeAlias = _HintsCreator(_Each)
+ArrayAssert: TypeAlias = _HintsCreator(_ArrayAssert)
\ No newline at end of file
@@ -0,0 +1,145 @@
+import typing_exe as texe
+
+
+MAX_REPORTED = 10   # Offending elements that are reported when an ArrayAssert fails
+
+_numpy = None
+
+_PYTHON_DTYPES = {bool: "bool", int: "int64", float: "float64", complex: "complex128"}
+_SIGNED = "bhilqn"
+_UNSIGNED = "BHILQN"
+_FLOATS = "efd"
+
+
+def get_numpy():
+    # numpy is optional, and slow to import, so it is only imported when an ArrayAssert is used
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            _numpy = False
+        else:
+            _numpy = numpy
+    return _numpy or None
+
+
+def as_array(value):
+    numpy = get_numpy()
+    if numpy is not None:
+        return numpy.asarray(value)
+
+    # Without numpy, only objects that support the buffer-protocol can be checked
+    try:
+        return memoryview(value)
+    except TypeError:
+        raise TypeError(
+            f"ArrayAssert needs numpy to check values of type {type(value).__name__}; "
+            f"without it, only objects that support the buffer-protocol can be checked"
+        ) from None
+
+
+def dtype_name(array) -> str:
+    if not isinstance(array, memoryview):
+        return array.dtype.name
+
+    code = array.format.lstrip("@=<>!")
+    bits = array.itemsize * 8
+    if code == "?":
+        return "bool"
+    if code in _FLOATS:
+        return f"float{bits}"
+    if code in _SIGNED:
+        return f"int{bits}"
+    if code in _UNSIGNED:
+        return f"uint{bits}"
+    return array.format
+
+
+def expected_dtype_names(dtype) -> tuple:
+    dtypes = dtype if isinstance(dtype, tuple) else (dtype,)
+    numpy = get_numpy()
+    if numpy is not None:
+        return tuple(numpy.dtype(expected).name for expected in dtypes)
+    return tuple(_PYTHON_DTYPES.get(expected, getattr(expected, "name", expected)) for expected in dtypes)
+
+
+def is_contiguous(array) -> bool:
+    return array.c_contiguous if isinstance(array, memoryview) else bool(array.flags.c_contiguous)
+
+
+def check_requirements(annotation, fct, parameter, parameter_name, array):
+    # The cheap checks of the whole array come before any element is looked at
+    if annotation.dtype is not None:
+        expected, actual = expected_dtype_names(annotation.dtype), dtype_name(array)
+        if actual not in expected:
+            raise texe.errors.ArraySpecViolated(fct, parameter_name, parameter, "dtype", expected, actual)
+
+    if annotation.shape is not None:
+        shape = tuple(array.shape)
+        if len(shape) != len(annotation.shape) or any(
+                expected is not None and expected != actual for expected, actual in zip(annotation.shape, shape)
+        ):
+            raise texe.errors.ArraySpecViolated(fct, parameter_name, parameter, "shape", annotation.shape, shape)
+
+    if annotation.contiguous and not is_contiguous(array):
+        raise texe.errors.ArraySpecViolated(fct, parameter_name, parameter, "contiguous", True, False)
+
+
+def check_item(annotation, item, item_signature, unary, fct, parameter, parameter_name, args, kwargs, pdata, array):
+    if isinstance(array, memoryview):
+        other_parameters = [] if unary else annotation.resolve_item(
+            "ArrayAssert", item, item_signature, fct, array, parameter_name, args, kwargs, pdata
+        )
+        count, indices, values = _check_elements(item, other_parameters, array)
+    else:
+        result = annotation.execute_item(
+            "ArrayAssert", item, item_signature, fct, array, parameter_name, args, kwargs, pdata
+        )
+        count, indices, values = _check_vectorized(result, array)
+
+    if count:
+        if texe.events.enabled:
+            texe.events.emit_failure(fct, parameter_name, item, parameter)
+        raise texe.errors.ArrayAssertFailed(
+            fct, parameter_name, item, parameter, count, indices, values, tuple(array.shape), dtype_name(array)
+        )
+
+
+def _check_vectorized(result, array):
+    numpy = get_numpy()
+    failed = numpy.logical_not(numpy.asarray(result, dtype=bool))
+    if not failed.any():
+        return 0, [], []
+    if failed.shape != array.shape:   # The predicate didn't work element-wise, so no element can be blamed
+        return 1, [], []
+    if failed.ndim == 0:   # A scalar or 0-d array has a single element, at the index ()
+        return 1, [()], [array.item()]
+
+    flat = numpy.flatnonzero(failed)
+    indices = [
+        tuple(int(i) for i in index)
+        for index in zip(*numpy.unravel_index(flat[:MAX_REPORTED], failed.shape))
+    ]
+    values = [array[index].item() for index in indices]
+    return len(flat), indices, values
+
+
+def _check_elements(item, other_parameters, view):
+    # Without numpy, the item is called with every element on its own
+    count, indices, values = 0, [], []
+    for index, value in _elements(view.tolist(), (), view.ndim):
+        if not item(value, *other_parameters):
+            count += 1
+            if len(indices) < MAX_REPORTED:
+                indices.append(index)
+                values.append(value)
+    return count, indices, values
+
+
+def _elements(values, index, ndim):
+    if ndim == 0:
+        yield index, values
+        return
+    for i, value in enumerate(values):
+        yield from _elements(value, (*index, i), ndim - 1)
@@ -0,0 +1,352 @@
+import inspect
+import dataclasses
+from functools import lru_cache
+
+import typing_exe as texe
+from typing_exe import profiling
+from typing_exe.early_return import EarlyReturn
+from typing_exe.parameter_data import ParameterData
+
+
+def compile_wrapper(fct, pdata: ParameterData, variants=None):
+    namespace = {
+        "fct": fct,
+        "pdata": pdata,
+        "EarlyReturn": EarlyReturn,
+        "_profiling": profiling,
+        "_current": texe.enforcement.current,
+        "_run_scoped": texe.decorators._run_scoped,
+        "_variants": variants,
+    }
+    exec(texe.plans.get_code(fct, generate_source(pdata, namespace)), namespace)
+    return namespace["_run"], namespace["_execute"]
+
+
+@lru_cache(maxsize=1024)
+def _compile_source(source: str):
+    # Functions with the same parameters and annotated positions share the same code
+    return compile(source, "<typing_exe.codegen>", "exec")
+
+
+def generate_source(pdata: ParameterData, namespace: dict) -> str:
+    parameters = pdata.function_signature.parameters
+
+    # Positional-only defaults are appended to args, so all of them up to the
+    #   last annotated one have to be appended to keep the indices right
+    last_annotated_posonly = max(
+        (
+            idx for idx in pdata.arg_annotations.keys()
+            if parameters.get(pdata.argname_from_index[idx]).kind == inspect.Parameter.POSITIONAL_ONLY
+        ),
+        default=-1
+    )
+
+    lines = []
+
+    # Defaults
+    for pname, idx, value, is_posonly in pdata.defaultdata:
+
+        if isinstance(value, EarlyReturn):
+            namespace[f"_returns{idx}"] = value.returns
+            lines.append(f"    if {pname!r} not in kwargs and len(args) <= {idx}:")
+            lines.append("        if _current().active:")
+            lines.append("            _profiling.record_early_return(fct)")
+            lines.append(f"        return _returns{idx}")
+        elif is_posonly and idx <= last_annotated_posonly:
+            namespace[f"_default{idx}"] = value
+            lines.append(f"    if len(args) <= {idx}:")
+            lines.append(f"        args.append(_default{idx})")
+        elif not is_posonly and pname in pdata.kwarg_annotations:
+            namespace[f"_default{idx}"] = value
+            lines.append(f"    if {pname!r} not in kwargs and len(args) <= {idx}:")
+            lines.append(f"        kwargs[{pname!r}] = _default{idx}")
+
+    # Args
+    if pdata.arg_annotations:
+        lines.append("    nargs = len(args)")
+    for idx, annotation in pdata.arg_annotations.items():
+        pname = pdata.argname_from_index[idx]
+        namespace[f"_arg_annotation{idx}"] = annotation
+        lines.append(f"    if nargs > {idx}:")
+        lines.append(
+            f"        arg = _arg_annotation{idx}.enforce(fct, args[{idx}], {pname!r}, args, kwargs, pdata)"
+        )
+        lines.append("        if isinstance(arg, EarlyReturn):")
+        lines.append("            return arg.returns")
+        lines.append(f"        args[{idx}] = arg")
+
+    # Kwargs (in the order of the call, like the generic wrapper; a single one can be unrolled)
+    if len(pdata.kwarg_annotations) == 1:
+        (pname, annotation), = pdata.kwarg_annotations.items()
+        idx = pdata.index_from_argname[pname]
+        namespace[f"_kwarg_annotation{idx}"] = annotation
+        lines.append(f"    if {pname!r} in kwargs:")
+        lines.append(
+            f"        kwarg = _kwarg_annotation{idx}.enforce(fct, kwargs[{pname!r}], {pname!r}, args, kwargs, pdata)"
+        )
+        lines.append("        if isinstance(kwarg, EarlyReturn):")
+        lines.append("            return kwarg.returns")
+        lines.append(f"        kwargs[{pname!r}] = kwarg")
+    elif pdata.kwarg_annotations:
+        namespace["_kwarg_annotations"] = dict(pdata.kwarg_annotations)
+        lines.append("    for pname, kwarg in kwargs.items():")
+        lines.append("        annotation = _kwarg_annotations.get(pname)")
+        lines.append("        if annotation is not None:")
+        lines.append("            kwarg = annotation.enforce(fct, kwarg, pname, args, kwargs, pdata)")
+        lines.append("            if isinstance(kwarg, EarlyReturn):")
+        lines.append("                return kwarg.returns")
+        lines.append("            kwargs[pname] = kwarg")
+
+    # Return value
+    return_annotation = texe.decorators._get_return_annotation(pdata)
+    if return_annotation is None:
+        lines.append("    return fct(*args, **kwargs)")
+    else:
+        namespace["_return_annotation"] = return_annotation
+        lines.append("    returns = fct(*args, **kwargs)")
+        lines.append("    returns = _return_annotation.enforce(fct, returns, 'return', args, kwargs, pdata)")
+        lines.append("    return returns.returns if isinstance(returns, EarlyReturn) else returns")
+
+    # _run is called with the arguments of a call, _execute with an args-list and a kwargs-dict
+    run_header = [
+        "def _run(*args, **kwargs):",
+        "    if _current().active:",
+        "        return _run_scoped(fct, _execute, _variants, list(args), kwargs)"
+    ]
+    if pdata.arg_annotations or last_annotated_posonly >= 0:
+        run_header.append("    args = list(args)   # So that they can be changed")
+    execute_header = ["def _execute(args, kwargs):"]
+
+    return "\n".join(run_header + lines + [""] + execute_header + lines) + "\n"
+
+
+def compile_dataclass(cls, level, check_types: bool, validate_assignment: bool):
+    # Replaces __init__ (and __setattr__) of the dataclass with code that validates every field inline;
+    #   inside of scopes, and while profiling or events are enabled, the calls go through @execute_annotations
+    original_init = cls.__init__
+    parameters = list(inspect.signature(original_init).parameters.values())[1:]
+    fields = [field for field in dataclasses.fields(cls)]
+    frozen = cls.__dataclass_params__.frozen
+    annotations = {
+        parameter.name: texe.optimizer.optimize(parameter.annotation, parameter.name)
+        for parameter in parameters
+        if texe.util.is_package_annotation(parameter.annotation)
+    }
+
+    namespace = {
+        "_current": texe.enforcement.current,
+        "_assert_failed": texe.annotations._assert_failed,
+        "_typehint_violated": texe.annotations._typehint_violated,
+        "_setattr": object.__setattr__ if frozen else cls.__setattr__,
+        "_MISSING": dataclasses.MISSING,
+    }
+    signature = _dataclass_signature(parameters, namespace)
+    factories = _dataclass_factories(parameters, fields, namespace)
+    assignments = _dataclass_assignments(cls, parameters, fields, namespace, frozen or validate_assignment)
+
+    plain_init = _exec_dataclass_function(
+        cls, "__init__", signature, factories + assignments or ["    pass"], dict(namespace)
+    )
+    plain_init.__annotations__ = dict(original_init.__annotations__)
+    checked_init = texe.decorators.execute_annotations(
+        plain_init, method=True, level=level, check_types=check_types
+    )
+
+    # The default-factories are called first, so that the annotations check their values and not the placeholders
+    names = {name: name for name in ["self", *(parameter.name for parameter in parameters)]}
+    namespace.update(_checked_init=checked_init)
+    call_checked = f"return _checked_init(self, {', '.join(f'{name}={name}' for name in names if name != 'self')})"
+    if isinstance(level, texe.enforcement.Sampled) and 0. < level.rate < 1.:
+        lines = factories + [f"    {call_checked}"]   # Sampling needs the wrapper anyway
+        assignments = []
+    else:
+        namespace.update(_pdata=texe.decorators._get_data(plain_init, method=True))
+        lines = factories + ["    if _current().active:", f"        {call_checked}"]
+        for pname, annotation in annotations.items():
+            annotation = _inline_annotation(annotation, level, check_types)
+            if annotation is not None:
+                _emit_annotation(annotation, pname, names, original_init, namespace, lines, "    ")
+    cls.__init__ = _exec_dataclass_function(cls, "__init__", signature, lines + assignments, namespace)
+    cls.__init__.__annotations__ = dict(original_init.__annotations__)
+
+    if validate_assignment:
+        setters = {
+            field.name: _compile_dataclass_setter(cls, field.name, annotation, fields, level, check_types)
+            for field in fields
+            for annotation in [texe.optimizer.optimize(field.type, field.name)]
+            if texe.util.is_package_annotation(annotation)
+        }
+        cls.__setattr__ = _exec_dataclass_function(cls, "__setattr__", "self, name, value", [
+            "    setter = _setters.get(name)",
+            "    _setattr(self, name, value if setter is None else setter(self, value))",
+        ], {"_setters": setters, "_setattr": namespace["_setattr"]})
+
+    return cls
+
+
+def _compile_dataclass_setter(cls, pname, annotation, fields, level, check_types):
+    # Other fields that the items take are read from the instance
+    field_names = {field.name for field in fields}
+    references = []
+    for context, item, item_signature in annotation.callables():
+        for idx, name in enumerate(list(item_signature.parameters)[1:]):
+            if name != "self" and name != pname and name not in field_names:
+                raise texe.errors.BindingError(context, item, cls.__setattr__, pname, idx, name)
+            if name not in references and name not in ("self", pname):
+                references.append(name)
+
+    namespace = {
+        "_current": texe.enforcement.current,
+        "_assert_failed": texe.annotations._assert_failed,
+        "_typehint_violated": texe.annotations._typehint_violated,
+    }
+    parameters = ", ".join(["self", pname, *references])
+    plain_setter = _exec_dataclass_function(
+        cls, f"_set_{pname}", parameters, [f"    return {pname}"], {}, qualname="__setattr__"
+    )
+    plain_setter.__annotations__ = {pname: annotation}
+    checked_setter = texe.decorators.execute_annotations(
+        plain_setter, method=True, level=level, check_types=check_types
+    )
+    if isinstance(level, texe.enforcement.Sampled) and 0. < level.rate < 1.:
+        return lambda self, value: checked_setter(self, value, **{name: getattr(self, name) for name in references})
+
+    names = {"self": "self", pname: pname, **{name: f"self.{name}" for name in references}}
+    namespace.update(_checked_setter=checked_setter, _pdata=texe.decorators._get_data(plain_setter, method=True))
+    lines = [
+        "    if _current().active:",
+        f"        return _checked_setter(self, {', '.join([pname, *(f'{n}=self.{n}' for n in references)])})",
+    ]
+    annotation = _inline_annotation(annotation, level, check_types)
+    if annotation is not None:
+        _emit_annotation(annotation, pname, names, cls.__setattr__, namespace, lines, "    ")
+    lines.append(f"    return {pname}")
+    return _exec_dataclass_function(cls, f"_set_{pname}", f"self, {pname}", lines, namespace, qualname="__setattr__")
+
+
+def _inline_annotation(annotation, level, check_types):
+    if texe.enforcement.checks_types(level, check_types):
+        annotation = annotation.with_typechecks()
+    if isinstance(level, texe.enforcement.Sampled) and level.rate == 0.:
+        annotation = annotation.without_asserts()
+    return annotation
+
+
+def _dataclass_signature(parameters, namespace) -> str:
+    signature = ["self"]
+    for parameter in parameters:
+        if parameter.kind == inspect.Parameter.KEYWORD_ONLY and "*" not in signature:
+            signature.append("*")
+        if parameter.default is inspect.Parameter.empty:
+            signature.append(parameter.name)
+        else:
+            namespace[f"_default_{parameter.name}"] = parameter.default
+            signature.append(f"{parameter.name}=_default_{parameter.name}")
+    return ", ".join(signature)
+
+
+def _dataclass_factories(parameters, fields, namespace) -> list:
+    # Replaces the placeholder-defaults of the parameters that have a default-factory with new values
+    lines = []
+    pnames = {parameter.name for parameter in parameters}
+    for field in fields:
+        if field.default_factory is not dataclasses.MISSING and field.name in pnames:
+            namespace[f"_factory_{field.name}"] = field.default_factory
+            lines.append(f"    if {field.name} is _default_{field.name}:")
+            lines.append(f"        {field.name} = _factory_{field.name}()")
+    return lines
+
+
+def _dataclass_assignments(cls, parameters, fields, namespace, use_setattr) -> list:
+    # The same as the __init__ that dataclasses generates
+    lines = []
+    pnames = {parameter.name for parameter in parameters}
+    for field in fields:
+        name = field.name
+        if field.default_factory is not dataclasses.MISSING:
+            namespace[f"_factory_{name}"] = field.default_factory
+            value = name if name in pnames else f"_factory_{name}()"
+        elif name in pnames:
+            value = name
+        elif field.default is not dataclasses.MISSING:
+            namespace[f"_field_default_{name}"] = field.default
+            value = f"_field_default_{name}"
+        else:
+            continue
+
+        if use_setattr:
+            lines.append(f"    _setattr(self, {name!r}, {value})")
+        else:
+            lines.append(f"    self.{name} = {value}")
+
+    if hasattr(cls, "__post_init__"):
+        init_vars = [parameter.name for parameter in parameters if parameter.name not in {f.name for f in fields}]
+        lines.append(f"    self.__post_init__({', '.join(init_vars)})")
+    return lines
+
+
+def _emit_annotation(annotation, pname, names, fct, namespace, lines, indent):
+    # Appends the code that checks (and changes) the local variable pname
+    annotations = texe.annotations
+    if type(annotation) is annotations._Assert and not annotation.process_pool:
+        lines.append(f"{indent}if {pname} is not None:")
+        _emit_typecheck(annotation, pname, namespace, lines, indent + "    ")
+        for item, item_signature, _ in annotation.items.calls if annotation.items is not None else ():
+            call = _emit_call(annotation, item, item_signature, pname, names, fct, namespace)
+            lines.append(f"{indent}    if not {call}:")
+            item_name = _constant(namespace, item)
+            lines.append(f"{indent}        raise _assert_failed(_fct, {pname!r}, {item_name}, {pname})")
+        if lines[-1].endswith(":"):
+            lines.append(f"{indent}    pass")
+    elif isinstance(annotation, annotations._Modify) and annotation.cache is None:
+        for item, item_signature, _ in annotation.items.calls if annotation.items is not None else ():
+            call = _emit_call(annotation, item, item_signature, pname, names, fct, namespace)
+            lines.append(f"{indent}{pname} = {call}")
+        _emit_typecheck(annotation, pname, namespace, lines, indent)
+    elif isinstance(annotation, annotations._Sequence) and annotation.cache is None:
+        for item in annotation.items or ():
+            _emit_annotation(item, pname, names, fct, namespace, lines, indent)
+        _emit_typecheck(annotation, pname, namespace, lines, indent)
+    else:
+        # Everything else (like Each, ArrayAssert, or pure annotations) is enforced as usual
+        kwargs = ", ".join(f"{name!r}: {value}" for name, value in names.items() if name != "self")
+        lines.append(
+            f"{indent}{pname} = {_constant(namespace, annotation)}.enforce("
+            f"_fct, {pname}, {pname!r}, [self], {{{kwargs}}}, _pdata)"
+        )
+
+
+def _emit_typecheck(annotation, pname, namespace, lines, indent):
+    if annotation.checker is not None:
+        checker, typehint = _constant(namespace, annotation.checker), _constant(namespace, annotation.typehint)
+        lines.append(f"{indent}if not {checker}({pname}):")
+        lines.append(f"{indent}    raise _typehint_violated(_fct, {pname!r}, {typehint}, {pname})")
+
+
+def _emit_call(annotation, item, item_signature, pname, names, fct, namespace) -> str:
+    arguments = [pname]
+    for idx, name in enumerate(list(item_signature.parameters)[1:]):
+        if name not in names:
+            raise texe.errors.BindingError(annotation.context, item, fct, pname, idx, name)
+        arguments.append(names[name])
+    return f"{_constant(namespace, item)}({', '.join(arguments)})"
+
+
+def _constant(namespace, value) -> str:
+    for name, existing in namespace.items():
+        if name.startswith("_constant") and existing is value:
+            return name
+    name = f"_constant{sum(name.startswith('_constant') for name in namespace)}"
+    namespace[name] = value
+    return name
+
+
+def _exec_dataclass_function(cls, name, signature, lines, namespace, qualname=None):
+    # The function is also _fct in its namespace, for the error-messages
+    source = "\n".join([f"def {name}({signature}):", *lines]) + "\n"
+    exec(_compile_source(source), namespace)
+    function = namespace.pop(name)
+    function.__qualname__ = f"{cls.__qualname__}.{qualname or name}"
+    function.__module__ = cls.__module__
+    namespace["_fct"] = function
+    return function
@@ -1,37 +1,242 @@
 import inspect
-from functools import wraps
+import threading
+import dataclasses
+from functools import wraps, partial
+from itertools import islice
 import typing_exe as texe
+from typing_exe import profiling
 
 
-def execute_annotations(fct):
-    pdata = _get_data(fct)
+def execute_annotations(
+        fct=None,
+        *,
+        compiled=False,
+        level=None,
+        lazy=False,
+        check_types=False,
+        method=False,
+        process_pool=None,
+        thread_pool=None,
+        collect_all=False
+):
+    if fct is None:
+        return partial(
+            execute_annotations,
+            compiled=compiled,
+            level=level,
+            lazy=lazy,
+            check_types=check_types,
+            method=method,
+            process_pool=process_pool,
+            thread_pool=thread_pool,
+            collect_all=collect_all
+        )
 
-    @wraps(fct)
-    def _run(*args, **kwargs):
-        args = list(args)   # So that they can be changed
+    level = texe.enforcement.get_level() if level is None else texe.enforcement.parse_level(level)
+    if level == texe.enforcement.OFF:
+        return fct
 
-        # Defaults
-        for pname in pdata.defaultdata.keys():
-            # Don't touch anything that is in args or kwargs
-            if pname in kwargs:
-                continue
-            if pdata.defaultdata.get(pname).get("index") < len(args):   # in args
-                continue
+    if lazy and not texe.plans.precompiling:
+        _run, _execute = _make_lazy_wrapper(
+            fct,
+            partial(_build, fct, compiled, level, check_types, method, process_pool, thread_pool, collect_all)
+        )
+    else:
+        _run, _execute = _build(
+            fct, compiled, level, check_types, method, process_pool, thread_pool, collect_all
+        )
+
+    _run = wraps(fct)(_run)
+    validator = texe.validation.Validator(fct, texe.enforcement.checks_types(level, check_types), method)
+    if method:
+        # Attributes of a bound method can't get self, so methods are validated with texe.validation only
+        texe.validation._validators[_run] = validator
+    else:
+        _run.map = partial(_map, _run, _execute)
+        _run.starmap = partial(_starmap, _run, _execute)
+        _run.validate = validator
+        _run.validate_record = validator.record
+    _run.__typing_exe__ = True
+    return _run
+
+
+def execute_annotations_class(cls=None, *, compiled=False, level=None, lazy=False, check_types=False):
+    if cls is None:
+        return partial(
+            execute_annotations_class, compiled=compiled, level=level, lazy=lazy, check_types=check_types
+        )
+
+    decorate = partial(execute_annotations, compiled=compiled, level=level, lazy=lazy, check_types=check_types)
+
+    def decorate_method(fct, method=True):
+        if fct is None or getattr(fct, "__typing_exe__", False) or not _has_package_annotations(fct):
+            return fct
+        return decorate(fct, method=method)
+
+    for name, value in list(vars(cls).items()):
+        if isinstance(value, staticmethod):
+            decorated = staticmethod(decorate_method(value.__func__, method=False))
+        elif isinstance(value, classmethod):
+            decorated = classmethod(decorate_method(value.__func__))
+        elif isinstance(value, property):
+            decorated = value.getter(decorate_method(value.fget)) \
+                .setter(decorate_method(value.fset)) \
+                .deleter(decorate_method(value.fdel))
+        elif inspect.isfunction(value):
+            decorated = decorate_method(value)
+        else:
+            continue
+        setattr(cls, name, decorated)
+
+    return cls
+
+
+def execute_annotations_dataclass(cls=None, *, validate_assignment=False, level=None, check_types=False):
+    if cls is None:
+        return partial(
+            execute_annotations_dataclass,
+            validate_assignment=validate_assignment,
+            level=level,
+            check_types=check_types
+        )
+
+    if not dataclasses.is_dataclass(cls):
+        raise TypeError(f"{cls.__qualname__} is not a dataclass; apply @dataclass first")
+    if validate_assignment and cls.__dataclass_params__.frozen:
+        raise TypeError(f"The fields of the frozen dataclass {cls.__qualname__} can't be assigned to")
+
+    level = texe.enforcement.get_level() if level is None else texe.enforcement.parse_level(level)
+    if level == texe.enforcement.OFF:
+        return cls
+    return texe.codegen.compile_dataclass(cls, level, check_types, validate_assignment)
+
+
+def _has_package_annotations(fct):
+    return any(texe.util.is_package_annotation(annotation) for annotation in fct.__annotations__.values())
+
+
+def _build(fct, compiled, level, check_types, method, process_pool, thread_pool, collect_all):
+    if inspect.iscoroutinefunction(fct):
+        make_wrapper = _make_async_wrapper
+    elif compiled:
+        make_wrapper = texe.codegen.compile_wrapper
+    else:
+        make_wrapper = _make_wrapper
+    process_pool = None if process_pool is False else process_pool   # False is the same as no pool
+    thread_pool = None if thread_pool is False else thread_pool
+
+    def make(pdata, variants=None):
+        checked_fct = fct
+        if collect_all:
+            checked_fct = texe.errors.with_collected_errors(fct)
+            pdata = _collecting(pdata)
+
+        pooled = texe.pools.get_pooled_asserts(pdata, all_asserts=process_pool is not None)
+        if pooled:
+            executor = texe.pools.get_process_pool if process_pool is None or process_pool is True else process_pool
+            checked_fct = texe.pools.with_pooled_asserts(checked_fct, pdata, pooled, executor)
+            pdata = _without_parameters(pdata, {pname for pname, *_ in pooled})
+
+        pooled = texe.pools.get_independent_asserts(pdata) if thread_pool is not None else ()
+        if pooled:
+            executor = texe.pools.get_thread_pool if thread_pool is True else thread_pool
+            checked_fct = texe.pools.with_pooled_asserts(checked_fct, pdata, pooled, executor)
+            pdata = _without_parameters(pdata, {pname for pname, *_ in pooled})
+
+        if not collect_all:
+            return make_wrapper(checked_fct, pdata, variants)
+
+        _execute = texe.errors.collect_errors(fct, make_wrapper(checked_fct, pdata)[1])
+        return _make_run(fct, _execute, variants), _execute
+
+    pdata = _get_data(fct, method)
+    if texe.enforcement.checks_types(level, check_types):
+        pdata = _with_typechecks(pdata)
+    if texe.plans.precompiling:
+        texe.plans.record(fct, pdata, make_wrapper is texe.codegen.compile_wrapper)
+
+    # texe.enforcement.scope can switch the Asserts on or off for every call
+    variants = _Variants(lambda: make(pdata)[1], lambda: make(_without_asserts(pdata))[1])
+    if not isinstance(level, texe.enforcement.Sampled) or level.rate == 1.:
+        _run, _execute = make(pdata, variants)
+        variants.built[True] = _execute
+        return _run, _execute
+    if level.rate == 0.:
+        _run, _execute = make(_without_asserts(pdata), variants)
+        variants.built[False] = _execute
+        return _run, _execute
+
+    variants.built[True] = make(pdata)[1]
+    variants.built[False] = make(_without_asserts(pdata))[1]
+    return _make_sampled_wrapper(
+        fct,
+        variants.built[True],
+        variants.built[False],
+        texe.enforcement.make_sampler(level),
+        variants
+    )
+
+
+class _Variants:
+    # The wrappers with and without Asserts; the ones that a function doesn't use itself are built on demand
+    __slots__ = ("builders", "built", "lock")
+
+    def __init__(self, build_checked, build_unchecked):
+        self.builders = {True: build_checked, False: build_unchecked}
+        self.built = {}
+        self.lock = threading.Lock()
+
+    def get(self, asserts: bool):
+        _execute = self.built.get(asserts)
+        if _execute is None:
+            with self.lock:
+                if asserts not in self.built:
+                    self.built[asserts] = self.builders[asserts]()
+                _execute = self.built[asserts]
+        return _execute
+
+
+def _make_lazy_wrapper(fct, build):
+    # The wrappers are built on the first call; the lock makes sure that it happens only once
+    built = []
+    lock = threading.Lock()
 
-            # Handle EarlyReturn
-            if isinstance(pdata.defaultdata.get(pname).get("value"), texe.early_return.EarlyReturn):
-                return pdata.defaultdata.get(pname).get("value").returns
+    def _load():
+        with lock:
+            if not built:
+                built.append(build())
+        return built[0]
 
-            # If the default-value is not an instance of EarlyReturn,
-            #   add it to args or kwargs (depending on what fits better)
-            #   to have it checked below
-            if pdata.function_signature.parameters.get(pname).kind == inspect.Parameter.POSITIONAL_ONLY:
-                args.append(pdata.defaultdata.get(pname).get("value"))
-            else:
-                kwargs[pname] = pdata.defaultdata.get(pname).get("value")
+    def _execute(args, kwargs):
+        return (built[0] if built else _load())[1](args, kwargs)
+
+    if inspect.iscoroutinefunction(fct):
+        async def _run(*args, **kwargs):
+            return await (built[0] if built else _load())[0](*args, **kwargs)
+    else:
+        def _run(*args, **kwargs):
+            return (built[0] if built else _load())[0](*args, **kwargs)
+
+    return _run, _execute
+
+
+def _make_wrapper(fct, pdata, variants=None):
+    # Everything that doesn't depend on the call is looked up once
+    defaults = _get_defaults(pdata)
+    arg_annotations = tuple(pdata.arg_annotations.items())
+    kwarg_annotations = pdata.kwarg_annotations
+    return_annotation = _get_return_annotation(pdata)
+
+    def _execute(args, kwargs):
+        # Defaults
+        early_return = _fill_defaults(defaults, args, kwargs)
+        if early_return is not None:
+            if texe.enforcement.current().active:
+                profiling.record_early_return(fct)
+            return early_return.returns
 
         # Args
-        for idx, annotation in pdata.arg_annotations.items():
+        for idx, annotation in arg_annotations:
             if idx >= len(args):
                 break
             arg = annotation.enforce(
@@ -48,7 +253,7 @@ def execute_annotations(fct):
 
         # Kwargs
         for pname, parameter in kwargs.items():
-            annotation = pdata.kwarg_annotations.get(pname)
+            annotation = kwarg_annotations.get(pname)
             if annotation is not None:
                 kwarg = annotation.enforce(
                     fct=fct,
@@ -64,9 +269,95 @@ def execute_annotations(fct):
 
         # Return value
         returns = fct(*args, **kwargs)
-        if pdata.function_signature.return_annotation != inspect.Parameter.empty \
-                and texe.util.is_package_annotation(pdata.function_signature.return_annotation):
-            returns = pdata.function_signature.return_annotation.enforce(
+        if return_annotation is not None:
+            returns = return_annotation.enforce(
+                fct=fct,
+                parameter=returns,
+                parameter_name="return",
+                args=args,
+                kwargs=kwargs,
+                pdata=pdata
+            )
+            returns = returns.returns if isinstance(returns, texe.early_return.EarlyReturn) else returns
+
+        # Return
+        return returns
+
+    return _make_run(fct, _execute, variants), _execute
+
+
+def _make_async_wrapper(fct, pdata, variants=None):
+    defaults = _get_defaults(pdata)
+    arg_annotations = tuple(pdata.arg_annotations.items())
+    kwarg_annotations = pdata.kwarg_annotations
+    return_annotation = _get_return_annotation(pdata)
+
+    async def _execute(args, kwargs):
+        # Defaults
+        early_return = _fill_defaults(defaults, args, kwargs)
+        if early_return is not None:
+            if texe.enforcement.current().active:
+                profiling.record_early_return(fct)
+            return early_return.returns
+
+        # Consecutive annotations that only assert are awaited concurrently;
+        #   annotations that modify wait for them so that the order of execution is kept
+        #   (and are only started afterwards, so that they are never left unawaited when an Assert fails)
+        pending = []
+
+        # Args
+        for idx, annotation in arg_annotations:
+            if idx >= len(args):
+                break
+            if annotation.modifies:
+                await _gather(pending)
+            enforced = annotation.enforce_async(
+                fct=fct,
+                parameter=args[idx],
+                parameter_name=pdata.argname_from_index[idx],
+                args=args,
+                kwargs=kwargs,
+                pdata=pdata
+            )
+            if not annotation.modifies:
+                pending.append(enforced)
+                continue
+
+            arg = await enforced
+            if isinstance(arg, texe.early_return.EarlyReturn):
+                return arg.returns
+            args[idx] = arg
+
+        # Kwargs
+        for pname, parameter in kwargs.items():
+            annotation = kwarg_annotations.get(pname)
+            if annotation is None:
+                continue
+            if annotation.modifies:
+                await _gather(pending)
+            enforced = annotation.enforce_async(
+                fct=fct,
+                parameter=parameter,
+                parameter_name=pname,
+                args=args,
+                kwargs=kwargs,
+                pdata=pdata
+            )
+            if not annotation.modifies:
+                pending.append(enforced)
+                continue
+
+            kwarg = await enforced
+            if isinstance(kwarg, texe.early_return.EarlyReturn):
+                return kwarg.returns
+            kwargs[pname] = kwarg
+
+        await _gather(pending)
+
+        # Return value
+        returns = await fct(*args, **kwargs)
+        if return_annotation is not None:
+            returns = await return_annotation.enforce_async(
                 fct=fct,
                 parameter=returns,
                 parameter_name="return",
@@ -79,39 +370,210 @@ def execute_annotations(fct):
         # Return
         return returns
 
+    return _make_run(fct, _execute, variants), _execute
+
+
+def _make_sampled_wrapper(fct, execute_checked, execute_unchecked, sample, variants=None):
+    def _execute(args, kwargs):
+        return execute_checked(args, kwargs) if sample() else execute_unchecked(args, kwargs)
+
+    return _make_run(fct, _execute, variants), _execute
+
+
+def _make_run(fct, _execute, variants=None):
+    current = texe.enforcement.current
+
+    if inspect.iscoroutinefunction(fct):
+        async def _run(*args, **kwargs):
+            if current().active:
+                return await _run_scoped(fct, _execute, variants, list(args), kwargs)
+            return await _execute(list(args), kwargs)   # list so that they can be changed
+    else:
+        def _run(*args, **kwargs):
+            if current().active:
+                return _run_scoped(fct, _execute, variants, list(args), kwargs)
+            return _execute(list(args), kwargs)   # list so that they can be changed
+
     return _run
 
 
-def _get_data(fct):
+def _run_scoped(fct, _execute, variants, args, kwargs):
+    # Inside of texe.enforcement.scope, or while profiling or events are enabled;
+    #   returns an awaitable for coroutine functions
+    scope = texe.enforcement.current()
+    if scope.asserts is not None and variants is not None:
+        _execute = variants.get(scope.asserts)
+    if not profiling.instrumented and not scope.collect_stats:
+        return _execute(args, kwargs)
+    if inspect.iscoroutinefunction(fct):
+        return profiling.profile_call_async(fct, _execute, args, kwargs)
+    return profiling.profile_call(fct, _execute, args, kwargs)
+
+
+def _without_asserts(pdata):
+    # Modify-items always run because they change the values; only the Asserts are left out
+    return _map_annotations(pdata, lambda annotation: annotation.without_asserts())
+
+
+def _with_typechecks(pdata):
+    return _map_annotations(pdata, lambda annotation: annotation.with_typechecks())
+
+
+def _collecting(pdata):
+    # The return-annotation is left as it is, because it runs after the function-body
+    return dataclasses.replace(
+        pdata,
+        arg_annotations={
+            idx: texe.errors.collecting(annotation) for idx, annotation in pdata.arg_annotations.items()
+        },
+        kwarg_annotations={
+            pname: texe.errors.collecting(annotation) for pname, annotation in pdata.kwarg_annotations.items()
+        }
+    )
+
+
+def _without_parameters(pdata, pnames):
+    return dataclasses.replace(
+        pdata,
+        arg_annotations={
+            idx: annotation for idx, annotation in pdata.arg_annotations.items()
+            if pdata.argname_from_index[idx] not in pnames
+        },
+        kwarg_annotations={
+            pname: annotation for pname, annotation in pdata.kwarg_annotations.items() if pname not in pnames
+        }
+    )
+
+
+def _map_annotations(pdata, function):
+    # Returns a copy of pdata with function applied to its annotations; annotations mapped to None are dropped
+    def apply(annotations):
+        mapped = {key: function(annotation) for key, annotation in annotations.items()}
+        return {key: annotation for key, annotation in mapped.items() if annotation is not None}
+
+    return_annotation = _get_return_annotation(pdata)
+    return_annotation = None if return_annotation is None else function(return_annotation)
+    return dataclasses.replace(
+        pdata,
+        function_signature=pdata.function_signature.replace(
+            return_annotation=inspect.Parameter.empty if return_annotation is None else return_annotation
+        ),
+        arg_annotations=apply(pdata.arg_annotations),
+        kwarg_annotations=apply(pdata.kwarg_annotations)
+    )
+
+
+async def _gather(pending):
+    import asyncio   # Only imported when needed because it is slow to import
+
+    if len(pending) == 1:
+        await pending[0]
+    elif pending:
+        await asyncio.gather(*pending)
+    pending.clear()
+
+
+def _get_defaults(pdata):
+    return pdata.defaultdata
+
+
+def _fill_defaults(defaults, args, kwargs):
+    for pname, idx, value, positional_only in defaults:
+        # Don't touch anything that is in args or kwargs
+        if pname in kwargs or idx < len(args):
+            continue
+
+        # Handle EarlyReturn
+        if isinstance(value, texe.early_return.EarlyReturn):
+            return value
+
+        # If the default-value is not an instance of EarlyReturn,
+        #   add it to args or kwargs (depending on what fits better)
+        #   to have it checked below
+        if positional_only:
+            args.append(value)
+        else:
+            kwargs[pname] = value
+
+    return None
+
+
+def _get_return_annotation(pdata):
+    return_annotation = pdata.function_signature.return_annotation
+    if return_annotation is inspect.Parameter.empty or not texe.util.is_package_annotation(return_annotation):
+        return None
+    return return_annotation
+
+
+def _map(_run, _execute, iterable, chunksize=None):
+    call = _get_batch_call(_run, _execute)
+    return _batched((call([arg], {}) for arg in iterable), chunksize)
+
+
+def _starmap(_run, _execute, iterable, chunksize=None):
+    call = _get_batch_call(_run, _execute)
+    return _batched((call(list(args), {}) for args in iterable), chunksize)
+
+
+def _get_batch_call(_run, _execute):
+    # The scope is looked at once per batch, and only calls inside of a scope go through _run
+    if not texe.enforcement.current().active:
+        return _execute
+    return lambda args, kwargs: _run(*args, **kwargs)
+
+
+def _batched(results, chunksize):
+    if chunksize is None:
+        return results
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be at least 1, not {chunksize}")
+    return _chunks(results, chunksize)
+
+
+def _chunks(results, chunksize):
+    while True:
+        chunk = list(islice(results, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _get_data(fct, method=False):
     signature = inspect.signature(fct)
+    if texe.util.is_package_annotation(signature.return_annotation):
+        signature = signature.replace(
+            return_annotation=texe.optimizer.optimize(signature.return_annotation, "return")
+        )
+
+    annotations = {}
     arg_annotations = {}
     kwarg_annotations = {}
-    defaultdata = {}
-    argname_from_index = {}
-    index_from_argname = {}
-
-    for i, pname in enumerate(signature.parameters.keys()):
-        argname_from_index[i] = pname
-        index_from_argname[pname] = i
+    defaultdata = []
+    argname_from_index = tuple(signature.parameters.keys())
+    index_from_argname = {pname: i for i, pname in enumerate(argname_from_index)}
 
+    for i, (pname, parameter) in enumerate(signature.parameters.items()):
         # Always save all defaults for CompareWith
-        if signature.parameters.get(pname).default != inspect.Parameter.empty:
-            defaultdata[pname] = {
-                "index": i,
-                "value": signature.parameters.get(pname).default
-            }
+        if parameter.default is not inspect.Parameter.empty:
+            defaultdata.append(texe.parameter_data.DefaultData(
+                name=pname,
+                index=i,
+                value=parameter.default,
+                positional_only=parameter.kind == inspect.Parameter.POSITIONAL_ONLY
+            ))
 
-        annotation = signature.parameters.get(pname).annotation
+        annotation = parameter.annotation
 
         # Save other data only if it's an annotation
         if not texe.util.is_package_annotation(annotation):
             continue
+        annotation = annotations[pname] = texe.optimizer.optimize(annotation, pname)
 
         # Save arg_annotations and kwarg_annotations
-        if not signature.parameters.get(pname).kind == inspect.Parameter.POSITIONAL_ONLY:
+        if not parameter.kind == inspect.Parameter.POSITIONAL_ONLY:
             kwarg_annotations[pname] = annotation
 
-        if not signature.parameters.get(pname).kind == inspect.Parameter.KEYWORD_ONLY:
+        if not parameter.kind == inspect.Parameter.KEYWORD_ONLY:
             arg_annotations[i] = annotation
 
     pdata = texe.parameter_data.ParameterData(
@@ -120,8 +582,16 @@ def _get_data(fct):
         argname_from_index=argname_from_index,
         index_from_argname=index_from_argname,
         kwarg_annotations=kwarg_annotations,
-        defaultdata=defaultdata
+        defaultdata=tuple(defaultdata),
+        bound_parameter=argname_from_index[0] if method and argname_from_index else None
     )
+
+    # Resolve the names of other parameters in Assert- and Modify-items once
+    for pname, annotation in annotations.items():
+        annotation.bind(fct, pname, pdata)
+    if texe.util.is_package_annotation(signature.return_annotation):
+        signature.return_annotation.bind(fct, "return", pdata)
+
     return pdata
 
 
@@ -134,6 +604,7 @@ def cleanup_annotations(fct):
         if texe.util.is_typehint(typehint):
             new_annotations[parameter] = typehint
         elif texe.util.is_package_annotation(typehint) \
+                and not isinstance(typehint, texe.annotations._Each) \
                 and typehint.typehint is not None:   # if it's not None, parse made sure that it's a typehint!
             new_annotations[parameter] = typehint.typehint
 
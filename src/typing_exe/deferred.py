@@ -0,0 +1,138 @@
+import os
+import queue
+import inspect
+import logging
+import threading
+from typing import NamedTuple
+
+import typing_exe as texe
+
+
+DEFAULT_MAXSIZE = 1024   # Checks that can wait in the queue; more are dropped
+
+logger = logging.getLogger("typing_exe")
+
+_lock = threading.Lock()
+_queue = queue.Queue(maxsize=DEFAULT_MAXSIZE)
+_worker = None
+_callback = None
+_checked = 0
+_failed = 0
+_dropped = 0
+
+
+class DeferredStats(NamedTuple):
+    queued: int
+    checked: int
+    failed: int
+    dropped: int
+
+
+def set_callback(callback):
+    # Called with every error of a deferred check (in the worker-thread); None logs them instead
+    global _callback
+    _callback = callback
+
+
+def set_maxsize(maxsize: int):
+    if maxsize < 1:
+        raise ValueError(f"maxsize must be at least 1, not {maxsize}")
+    with _queue.mutex:
+        _queue.maxsize = maxsize
+
+
+def submit(annotation, fct, parameter, parameter_name, calls: tuple):
+    # Never blocks: if the worker can't keep up, the check is dropped
+    global _dropped
+    if _worker is None:
+        _start_worker()
+    try:
+        _queue.put_nowait((annotation, fct, parameter, parameter_name, calls))
+    except queue.Full:
+        with _lock:
+            _dropped += 1
+
+
+def flush(timeout=None) -> bool:
+    # Waits until every submitted check is done; False if the timeout ran out before that
+    with _queue.all_tasks_done:
+        return _queue.all_tasks_done.wait_for(lambda: _queue.unfinished_tasks == 0, timeout)
+
+
+def stats() -> DeferredStats:
+    with _lock:
+        return DeferredStats(queued=_queue.qsize(), checked=_checked, failed=_failed, dropped=_dropped)
+
+
+def reset_stats():
+    global _checked, _failed, _dropped
+    with _lock:
+        _checked = _failed = _dropped = 0
+
+
+def check(annotation, fct, parameter, parameter_name, calls: tuple):
+    # Returns the error instead of raising it
+    if annotation.checker is not None and not annotation.checker(parameter):
+        return texe.annotations._typehint_violated(fct, parameter_name, annotation.typehint, parameter)
+
+    for item, other_parameters in calls:
+        result = item(parameter, *other_parameters)
+        if inspect.isawaitable(result):
+            if inspect.iscoroutine(result):
+                result.close()
+            return TypeError(f"Deferred Assert-items can't be awaited: {item!r}")
+        if not result:
+            return texe.annotations._assert_failed(fct, parameter_name, item, parameter)
+    return None
+
+
+def _start_worker():
+    global _worker
+    with _lock:
+        if _worker is None:
+            _worker = threading.Thread(target=_work, name="typing_exe_deferred", daemon=True)
+            _worker.start()
+
+
+def _work():
+    global _checked, _failed
+    while True:
+        checked = _queue.get()
+        try:
+            error = check(*checked)
+        except Exception as exception:   # An item that raises counts as failed
+            error = exception
+        finally:
+            del checked
+
+        with _lock:
+            _checked += 1
+            _failed += error is not None
+        if error is not None:
+            _report(error)
+        _queue.task_done()
+
+
+def _after_fork_in_child():
+    # The worker-thread doesn't exist in a forked child, and the lock or queue may have been held by it;
+    #   the child starts over with its own, and the checks queued in the parent stay with the parent
+    global _lock, _queue, _worker, _checked, _failed, _dropped
+    _lock = threading.Lock()
+    _queue = queue.Queue(maxsize=_queue.maxsize)
+    _worker = None
+    _checked = _failed = _dropped = 0
+
+
+if hasattr(os, "register_at_fork"):   # Not on Windows
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def _report(error):
+    callback = _callback
+    if callback is None:
+        logger.error("Deferred check failed: %s", error)
+        return
+    try:
+        callback(error)
+    except Exception:
+        logger.exception("The callback for deferred checks raised an exception")
@@ -0,0 +1,121 @@
+import os
+import re
+import math
+import random
+import itertools
+import contextvars
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Optional
+
+
+OFF = "off"
+ASSERTS_ONLY = "asserts-only"
+FULL = "full"
+
+
+@dataclass(frozen=True)
+class Sampled:
+    rate: float
+    deterministic: bool = False
+
+    def __post_init__(self):
+        if not 0. <= self.rate <= 1.:
+            raise ValueError(f"The sampling-rate must be between 0 and 1, not {self.rate}")
+
+
+def sampled(rate: float, deterministic: bool = False) -> Sampled:
+    return Sampled(rate=rate, deterministic=deterministic)
+
+
+def parse_level(level):
+    if isinstance(level, Sampled) or level in (OFF, ASSERTS_ONLY, FULL):
+        return level
+
+    match = re.fullmatch(r"sampled\(\s*([^,\s]+)\s*(?:,\s*(deterministic)\s*)?\)", str(level).strip())
+    if match is not None:
+        return Sampled(rate=float(match.group(1)), deterministic=match.group(2) is not None)
+
+    raise ValueError(
+        f"Unknown enforcement-level: {level!r}; "
+        f"use '{OFF}', 'sampled(<rate>)', 'sampled(<rate>, deterministic)', '{ASSERTS_ONLY}', or '{FULL}'"
+    )
+
+
+def checks_types(level, check_types: bool) -> bool:
+    # Only FULL checks the typehints of functions decorated with check_types=True;
+    #   ASSERTS_ONLY runs nothing but the Assert- and Modify-items on every call
+    return check_types and level == FULL
+
+
+def make_sampler(level: Sampled):
+    # Returns a callable that says whether or not the Asserts are checked in the current call
+    if level.deterministic:
+        # Call n is checked whenever ceil((n + 1) * rate) grows, so exactly that fraction of calls is checked,
+        #   spread evenly and starting with the first call
+        rate = level.rate
+        counter = itertools.count()
+
+        def sample():
+            n = next(counter)
+            return math.ceil((n + 1) * rate) > math.ceil(n * rate)
+
+        return sample
+
+    rate = level.rate
+    return lambda: random.random() < rate
+
+
+def _default_level():
+    level = os.environ.get("TYPING_EXE_LEVEL")
+    if level:
+        return parse_level(level)
+
+    # Like assert-statements, Asserts are removed by python -O; Modify-items keep running
+    return FULL if __debug__ else Sampled(rate=0.)
+
+
+_level = _default_level()
+
+
+def set_level(level):
+    global _level
+    _level = parse_level(level)
+
+
+def get_level():
+    return _level
+
+
+class _Scope:
+    # active is True if the wrappers have to look at the scope (or at profiling and events) at all
+    __slots__ = ("asserts", "collect_stats", "active")
+
+    def __init__(self, asserts=None, collect_stats=None, active=True):
+        self.asserts = asserts
+        self.collect_stats = collect_stats
+        self.active = active
+
+
+_GLOBAL = _Scope(active=False)   # Outside of any scope; active is kept in sync by profiling.update_instrumented
+_scope = contextvars.ContextVar("typing_exe_scope", default=_GLOBAL)
+
+current = _scope.get   # The only thing that the wrappers read per call
+
+
+@contextmanager
+def scope(asserts: Optional[bool] = None, collect_stats: Optional[bool] = None):
+    # Changes the decorated functions for the current thread or asyncio-task only; None keeps the outer setting
+    outer = _scope.get()
+    if asserts is None and collect_stats is None:
+        yield
+        return
+
+    token = _scope.set(_Scope(
+        asserts=outer.asserts if asserts is None else asserts,
+        collect_stats=outer.collect_stats if collect_stats is None else collect_stats,
+    ))
+    try:
+        yield
+    finally:
+        _scope.reset(token)
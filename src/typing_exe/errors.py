@@ -0,0 +1,224 @@
+import inspect
+import contextvars
+from functools import wraps
+
+import typing_exe as texe
+from typing_exe.early_return import EarlyReturn
+
+
+# The messages are only formatted when the errors are rendered, because many of them are caught and never shown
+class ValidationError(Exception):
+    function = None
+    parameter = None
+    item = None
+    value = None
+
+    def __reduce__(self):
+        # The function and the item are pickled as references, so that the errors can be sent between processes
+        reference = texe.pickling.reference
+        return type(self), tuple(reference(arg) for arg in self.args), {
+            name: reference(value) for name, value in vars(self).items()
+        }
+
+
+class AssertFailed(ValidationError, ValueError):
+    def __init__(self, function, parameter, item, value):
+        super().__init__(function, parameter, item, value)
+        self.function = function
+        self.parameter = parameter
+        self.item = item
+        self.value = value
+
+    def __str__(self):
+        return texe.annotations._Assert.failure_message(self.function, self.item, self.value, self.parameter)
+
+
+class ArrayAssertFailed(AssertFailed):
+    # Only the first offending elements are reported, never the whole array
+    def __init__(self, function, parameter, item, value, count, indices, values, shape, dtype):
+        super().__init__(function, parameter, item, value)
+        self.args = (function, parameter, item, value, count, indices, values, shape, dtype)
+        self.count = count
+        self.indices = indices
+        self.values = values
+        self.shape = shape
+        self.dtype = dtype
+
+    def __str__(self):
+        return f"\nArrayAssert failed! \n" \
+               f"\t- Callable: \n" \
+               f"\t\t- Name: {self.function.__qualname__}\n" \
+               f"\t\t- Module: {self.function.__module__}\n" \
+               f"\tAssertion:\n" \
+               f"\t\t- Name: {self.item.__qualname__}\n" \
+               f"\t\t- Module: {self.item.__module__}\n" \
+               f"\t- Parameter: \n" \
+               f"\t\t- Name: {self.parameter}\n" \
+               f"\t\t- Shape: {self.shape}\n" \
+               f"\t\t- Dtype: {self.dtype}\n" \
+               f"\t\t- Failed elements: {self.count}\n" \
+               f"\t\t- First failed indices: {self.indices}\n" \
+               f"\t\t- First failed values: {self.values}\n"
+
+
+class ArraySpecViolated(ValidationError, TypeError):
+    # requirement is "dtype", "shape", or "contiguous"
+    def __init__(self, function, parameter, value, requirement, expected, actual):
+        super().__init__(function, parameter, value, requirement, expected, actual)
+        self.function = function
+        self.parameter = parameter
+        self.value = value
+        self.requirement = requirement
+        self.expected = expected
+        self.actual = actual
+
+    def __str__(self):
+        return f"\nArray requirement violated! \n" \
+               f"\t- Callable: \n" \
+               f"\t\t- Name: {self.function.__qualname__}\n" \
+               f"\t\t- Module: {self.function.__module__}\n" \
+               f"\t- Parameter: \n" \
+               f"\t\t- Name: {self.parameter}\n" \
+               f"\t- Requirement: {self.requirement}\n" \
+               f"\t\t- Expected: {self.expected}\n" \
+               f"\t\t- Actual: {self.actual}\n"
+
+
+class TypehintViolated(ValidationError, TypeError):
+    def __init__(self, function, parameter, typehint, value):
+        super().__init__(function, parameter, typehint, value)
+        self.function = function
+        self.parameter = parameter
+        self.typehint = typehint
+        self.value = value
+
+    def __str__(self):
+        return texe.typecheck.failure_message(self.function, self.value, self.parameter, self.typehint)
+
+
+class BindingError(ValidationError, ValueError):
+    # An item takes a parameter that the function doesn't have or that wasn't given
+    def __init__(self, context, item, function, parameter, index, name, value=inspect.Parameter.empty):
+        super().__init__(context, item, function, parameter, index, name, value)
+        self.context = context
+        self.item = item
+        self.function = function
+        self.parameter = parameter
+        self.index = index
+        self.name = name
+        self.value = value
+
+    def __str__(self):
+        return texe.annotations._PreProcess.binding_error(
+            self.context, self.item, self.function, self.parameter, self.index, self.name, self.value
+        )
+
+
+class ValidationErrors(ValidationError, ValueError):
+    def __init__(self, errors):
+        super().__init__(errors)
+        self.errors = list(errors)
+        self.function = self.errors[0].function if self.errors else None
+
+    def __str__(self):
+        return "".join(str(error) for error in self.errors)
+
+
+# The errors of the current call in collect-all mode
+_collected = contextvars.ContextVar("typing_exe_collected_errors")
+
+
+class _Collecting:
+    # Records the validation-errors of an annotation instead of raising them
+    def __init__(self, annotation):
+        self.annotation = annotation
+        self.modifies = annotation.modifies
+
+    def enforce(self, fct, parameter, parameter_name, args, kwargs, pdata):
+        errors = _collected.get()
+        try:
+            value = self.annotation.enforce(fct, parameter, parameter_name, args, kwargs, pdata)
+        except ValidationError as error:
+            errors.append(error)
+            return parameter
+        return self.check_early_return(value, errors)
+
+    async def enforce_async(self, fct, parameter, parameter_name, args, kwargs, pdata):
+        errors = _collected.get()
+        try:
+            value = await self.annotation.enforce_async(fct, parameter, parameter_name, args, kwargs, pdata)
+        except ValidationError as error:
+            errors.append(error)
+            return parameter
+        return self.check_early_return(value, errors)
+
+    @staticmethod
+    def check_early_return(value, errors):
+        # Returning early would hide the errors that were already collected
+        if errors and isinstance(value, EarlyReturn):
+            raise ValidationErrors(errors)
+        return value
+
+
+def collecting(annotation):
+    return _Collecting(annotation)
+
+
+def report(errors):
+    # Raises the errors, or records them in collect-all mode
+    collected = _collected.get(None)
+    if collected is not None:
+        collected.extend(errors)
+    elif len(errors) == 1:
+        raise errors[0]
+    elif errors:
+        raise ValidationErrors(errors)
+
+
+def with_collected_errors(fct):
+    # Returns fct wrapped so that the collected errors are raised right before fct is called;
+    #   the body itself (and the functions it calls) run without collecting
+    if inspect.iscoroutinefunction(fct):
+        @wraps(fct)
+        async def checked(*args, **kwargs):
+            errors = _collected.get()
+            if errors:
+                raise ValidationErrors(errors)
+            token = _collected.set(None)
+            try:
+                return await fct(*args, **kwargs)
+            finally:
+                _collected.reset(token)
+    else:
+        @wraps(fct)
+        def checked(*args, **kwargs):
+            errors = _collected.get()
+            if errors:
+                raise ValidationErrors(errors)
+            token = _collected.set(None)
+            try:
+                return fct(*args, **kwargs)
+            finally:
+                _collected.reset(token)
+
+    return checked
+
+
+def collect_errors(fct, _execute):
+    # Every call gets its own list of errors
+    if inspect.iscoroutinefunction(fct):
+        async def collecting_execute(args, kwargs):
+            token = _collected.set([])
+            try:
+                return await _execute(args, kwargs)
+            finally:
+                _collected.reset(token)
+    else:
+        def collecting_execute(args, kwargs):
+            token = _collected.set([])
+            try:
+                return _execute(args, kwargs)
+            finally:
+                _collected.reset(token)
+
+    return collecting_execute
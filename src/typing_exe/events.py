@@ -0,0 +1,68 @@
+import threading
+from typing import Any, Callable, NamedTuple, Optional
+
+import typing_exe as texe
+
+
+CALL = "call"
+ASSERT_FAILED = "assert_failed"
+TYPEHINT_VIOLATED = "typehint_violated"
+MODIFY_APPLIED = "modify_applied"
+EARLY_RETURN = "early_return"
+RETURN_REJECTED = "return_rejected"
+KINDS = (CALL, ASSERT_FAILED, TYPEHINT_VIOLATED, MODIFY_APPLIED, EARLY_RETURN, RETURN_REJECTED)
+
+enabled = False   # True while anything is subscribed; nothing is emitted otherwise
+
+_lock = threading.Lock()
+_subscribers = {kind: () for kind in KINDS}   # Replaced, never changed, so emitting needs no lock
+
+
+class Event(NamedTuple):
+    kind: str
+    function: Callable
+    parameter: Optional[str] = None
+    item: Optional[Callable] = None
+    value: Any = None
+    duration: Optional[float] = None   # Only for calls
+    failed: bool = False   # Only for calls
+
+
+def subscribe(callback: Callable[[Event], Any], kinds=KINDS):
+    global enabled
+    kinds = (kinds,) if isinstance(kinds, str) else tuple(kinds)
+    for kind in kinds:
+        if kind not in KINDS:
+            raise ValueError(f"Unknown kind of event: {kind!r}; must be one of {KINDS}")
+
+    with _lock:
+        for kind in kinds:
+            _subscribers[kind] = (*_subscribers[kind], callback)
+        enabled = True
+    texe.profiling.update_instrumented()
+    return callback
+
+
+def unsubscribe(callback: Callable[[Event], Any]):
+    global enabled
+    with _lock:
+        for kind, callbacks in _subscribers.items():
+            _subscribers[kind] = tuple(subscriber for subscriber in callbacks if subscriber != callback)
+        enabled = any(_subscribers.values())
+    texe.profiling.update_instrumented()
+
+
+def emit(kind, function, parameter=None, item=None, value=None, duration=None, failed=False):
+    callbacks = _subscribers[kind]
+    if callbacks:
+        event = Event(kind, function, parameter, item, value, duration, failed)
+        for callback in callbacks:
+            callback(event)
+
+
+def emit_failure(function, parameter, item, value, typehint=False):
+    # A failure of the return-annotation means that the return-value is rejected
+    if parameter == "return":
+        emit(RETURN_REJECTED, function, parameter, item, value)
+    else:
+        emit(TYPEHINT_VIOLATED if typehint else ASSERT_FAILED, function, parameter, item, value)
@@ -0,0 +1,137 @@
+import os
+import bisect
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler
+
+from typing_exe import events
+
+
+# Upper bounds of the latency-histogram in seconds
+DEFAULT_BUCKETS = (1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 5e-2, 0.1, 0.5, 1., 5.)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class PrometheusAggregator:
+    # Aggregates events into counters and latency-histograms, and renders them in the Prometheus text-format
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._calls = {}   # {function-name: [calls, failures, bucket-counts, sum]}
+        self._events = {}   # {(function-name, parameter-name, kind): count}
+
+    def subscribe(self):
+        events.subscribe(self.record)
+        return self
+
+    def unsubscribe(self):
+        events.unsubscribe(self.record)
+
+    def __enter__(self):
+        return self.subscribe()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.unsubscribe()
+
+    def record(self, event: events.Event):
+        name = _function_name(event.function)
+        with self._lock:
+            if event.kind == events.CALL:
+                call_stats = self._calls.get(name)
+                if call_stats is None:
+                    call_stats = self._calls[name] = [0, 0, [0] * (len(self.buckets) + 1), 0.]
+                call_stats[0] += 1
+                call_stats[1] += event.failed
+                call_stats[2][bisect.bisect_left(self.buckets, event.duration)] += 1
+                call_stats[3] += event.duration
+            else:
+                key = (name, event.parameter or "", event.kind)
+                self._events[key] = self._events.get(key, 0) + 1
+
+    def reset(self):
+        with self._lock:
+            self._calls.clear()
+            self._events.clear()
+
+    def render(self) -> str:
+        with self._lock:
+            calls = {name: (c, f, list(b), s) for name, (c, f, b, s) in self._calls.items()}
+            counted_events = dict(self._events)
+
+        lines = [
+            "# HELP typing_exe_calls_total Calls of functions decorated with execute_annotations.",
+            "# TYPE typing_exe_calls_total counter",
+        ]
+        lines += [f'typing_exe_calls_total{{function="{_escape(name)}"}} {c}' for name, (c, *_) in calls.items()]
+
+        lines += [
+            "# HELP typing_exe_call_failures_total Calls that raised an exception.",
+            "# TYPE typing_exe_call_failures_total counter",
+        ]
+        lines += [
+            f'typing_exe_call_failures_total{{function="{_escape(name)}"}} {f}' for name, (_, f, *_) in calls.items()
+        ]
+
+        lines += [
+            "# HELP typing_exe_events_total Failed checks, applied modifications, and early returns.",
+            "# TYPE typing_exe_events_total counter",
+        ]
+        lines += [
+            f'typing_exe_events_total{{function="{_escape(name)}",parameter="{_escape(parameter)}",kind="{kind}"}} '
+            f'{count}'
+            for (name, parameter, kind), count in counted_events.items()
+        ]
+
+        lines += [
+            "# HELP typing_exe_call_duration_seconds Duration of calls, including the function-body.",
+            "# TYPE typing_exe_call_duration_seconds histogram",
+        ]
+        for name, (c, _, bucket_counts, total) in calls.items():
+            label = f'function="{_escape(name)}"'
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), bucket_counts):
+                cumulative += count
+                lines.append(f'typing_exe_call_duration_seconds_bucket{{{label},le="{bound}"}} {cumulative}')
+            lines.append(f"typing_exe_call_duration_seconds_sum{{{label}}} {total}")
+            lines.append(f"typing_exe_call_duration_seconds_count{{{label}}} {c}")
+
+        return "\n".join(lines) + "\n"
+
+    def write(self, path):
+        # Written to a temporary file first, so that a scraper never reads half a file
+        directory = os.path.dirname(os.path.abspath(path))
+        descriptor, temporary = tempfile.mkstemp(dir=directory, prefix=".typing_exe_metrics")
+        try:
+            with os.fdopen(descriptor, "w") as file:
+                file.write(self.render())
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    def make_handler(self):
+        # A handler for http.server that serves the metrics on every GET-request
+        aggregator = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = aggregator.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return MetricsHandler
+
+
+def _function_name(fct):
+    return f"{fct.__module__}.{fct.__qualname__}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
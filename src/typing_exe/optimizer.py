@@ -0,0 +1,109 @@
+import inspect
+from typing import NamedTuple, Optional
+
+import typing_exe as texe
+
+
+class Optimization(NamedTuple):
+    parameter: str
+    description: str
+
+
+def optimize(annotation, parameter_name: str = "", report: Optional[list] = None):
+    # Returns an annotation that does the same with fewer steps; what was done is appended to report
+    annotations = texe.annotations
+    if not isinstance(annotation, (annotations._Sequence, annotations._Each)) or annotation.items is None:
+        return annotation
+
+    items = _merge(_flatten(annotation.items, parameter_name, report), parameter_name, report)
+    return annotation if items == annotation.items else annotation.replace(items=items)
+
+
+def report(fct) -> list:
+    # What optimize does to the annotations of fct (decorated or not)
+    fct = inspect.unwrap(fct)
+    signature = texe.util.signature(fct)
+
+    optimizations = []
+    for pname, parameter in signature.parameters.items():
+        optimize(parameter.annotation, pname, optimizations)
+    optimize(signature.return_annotation, "return", optimizations)
+    return optimizations
+
+
+def _flatten(items, parameter_name, report):
+    # Nested Sequences without a typehint or cache are the same as their items
+    flattened = []
+    for item in items:
+        item = optimize(item, parameter_name, report)
+        if isinstance(item, texe.annotations._Sequence) \
+                and item.typehint is None \
+                and item.cache is None \
+                and item.items is not None:
+            flattened.extend(item.items)
+            _record(report, parameter_name, f"Flattened a nested Sequence with {len(item.items)} items")
+        else:
+            flattened.append(item)
+    return tuple(flattened)
+
+
+def _merge(items, parameter_name, report):
+    merged = []
+    for item in items:
+        previous = merged[-1] if merged else None
+        if _can_merge_asserts(previous, item):
+            merged[-1] = _merge_asserts(previous, item, parameter_name, report)
+        elif _can_merge_modifies(previous, item):
+            merged[-1] = _merge_modifies(previous, item, parameter_name, report)
+        else:
+            merged.append(item)
+    return tuple(merged)
+
+
+def _can_merge_asserts(previous, item) -> bool:
+    # The typehint of the second Assert would be checked before the items of the first one
+    return isinstance(previous, texe.annotations._Assert) \
+        and type(item) is type(previous) \
+        and item.typehint is None \
+        and previous.items is not None \
+        and item.items is not None \
+        and previous.process_pool == item.process_pool
+
+
+def _can_merge_modifies(previous, item) -> bool:
+    # The typehint of the first Modify is checked on its result, so it has to stay separate
+    return isinstance(previous, texe.annotations._Modify) \
+        and isinstance(item, texe.annotations._Modify) \
+        and previous.typehint is None \
+        and previous.cache is None \
+        and item.cache is None \
+        and previous.items is not None \
+        and item.items is not None
+
+
+def _merge_asserts(previous, item, parameter_name, report):
+    # Asserts don't change the parameter, so checking the same item twice in a row can't fail the second time
+    items = dict(previous.items.items())
+    for assertion, item_signature in item.items.items():
+        if assertion in items:
+            _record(report, parameter_name, f"Removed duplicate Assert-item {_name(assertion)}")
+        else:
+            items[assertion] = item_signature
+
+    _record(report, parameter_name, "Merged adjacent Asserts")
+    return previous.replace(items=texe.annotations._Items(items.items()))
+
+
+def _merge_modifies(previous, item, parameter_name, report):
+    # Every item of a Modify changes the parameter, so duplicates must stay
+    _record(report, parameter_name, "Merged adjacent Modifies")
+    return item.replace(items=texe.annotations._Items([*previous.items.items(), *item.items.items()]))
+
+
+def _record(report, parameter_name, description):
+    if report is not None:
+        report.append(Optimization(parameter_name, description))
+
+
+def _name(item) -> str:
+    return getattr(item, "__qualname__", repr(item))
@@ -1,13 +1,59 @@
 import inspect
 from dataclasses import dataclass
+from typing import Any, NamedTuple, Optional
 
 
-@dataclass
+class ParameterBinding(NamedTuple):
+    name: str
+    index: Optional[int]   # None if the parameter cannot be given positionally
+    keyword: bool   # False if the parameter cannot be given as a keyword-argument
+    default: Any
+
+
+class DefaultData(NamedTuple):
+    name: str
+    index: int
+    value: Any
+    positional_only: bool
+
+
+@dataclass(init=False)
 class ParameterData:
+    __slots__ = (
+        "function_signature",
+        "arg_annotations",
+        "argname_from_index",
+        "index_from_argname",
+        "kwarg_annotations",
+        "defaultdata",
+        "bindings",
+        "bound_parameter",
+    )
     function_signature: inspect.Signature
     arg_annotations: dict
-    argname_from_index: dict
+    argname_from_index: tuple
     index_from_argname: dict
     kwarg_annotations: dict
-    defaultdata: dict
+    defaultdata: tuple
+    bindings: dict
+    bound_parameter: Optional[str]   # self or cls of methods
 
+    def __init__(
+            self,
+            function_signature: inspect.Signature,
+            arg_annotations: dict,
+            argname_from_index: tuple,
+            index_from_argname: dict,
+            kwarg_annotations: dict,
+            defaultdata: tuple,
+            bindings: Optional[dict] = None,
+            bound_parameter: Optional[str] = None
+    ):
+        self.function_signature = function_signature
+        self.arg_annotations = arg_annotations
+        self.argname_from_index = argname_from_index
+        self.index_from_argname = index_from_argname
+        self.kwarg_annotations = kwarg_annotations
+        self.defaultdata = defaultdata
+        self.bindings = {} if bindings is None else bindings
+        self.bound_parameter = bound_parameter
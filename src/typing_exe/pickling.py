@@ -0,0 +1,144 @@
+import sys
+import types
+import inspect
+import weakref
+import importlib
+from functools import reduce
+
+import typing_exe as texe
+
+
+_locations = weakref.WeakKeyDictionary()   # {function: location} of the functions that were found before
+
+
+class _Reference:
+    # Calls obj, and is pickled as the place where obj is defined, so that it is imported in the other process
+    __slots__ = ("obj",)
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __call__(self, *args, **kwargs):
+        return self.obj(*args, **kwargs)
+
+    def __reduce__(self):
+        location = locate(self.obj)
+        if location is None:
+            return _identity, (self.obj,)   # Pickled as usual
+        return resolve, location
+
+    def __repr__(self):
+        return f"reference({self.obj!r})"
+
+
+def reference(obj):
+    # obj, or a stand-in for it if obj is a function that pickle can't find by its qualified name,
+    #   like lambdas and decorated functions
+    if isinstance(obj, types.FunctionType) and not _importable(obj):
+        return _Reference(obj)
+    return obj
+
+
+def locate(fct):
+    # (module, names, unwrap, parameter, path) of a function that is defined in a module,
+    #   either decorated or in the annotations of a module-level function or method; None if there is none
+    if _importable(fct):
+        return None
+
+    location = _locations.get(fct)
+    if location is None:
+        location = _search(fct)
+        if location is None and getattr(fct, "__wrapped__", None) is not None:
+            return locate(fct.__wrapped__)   # Wrappers made while decorating stand for the function they wrap
+        if location is not None:
+            _locations[fct] = location
+    return location
+
+
+def resolve(module, names, unwrap, parameter, path):
+    # The inverse of locate; runs in the process that unpickles the function
+    obj = reduce(getattr, names, importlib.import_module(module))
+    obj = getattr(obj, "__func__", obj)
+    for _ in range(unwrap):
+        obj = obj.__wrapped__
+    if parameter is None:
+        return obj
+
+    annotation = obj.__annotations__[parameter]
+    for index in path:
+        annotation = list(annotation.items)[index]
+    return annotation
+
+
+def rebuild_annotation(cls, values, checked):
+    if checked:
+        values["checker"] = texe.typecheck.compile_typehint(values["typehint"])
+    return cls.create(**values)
+
+
+def rebuild_items(items):
+    return texe.annotations._Items([(item, texe.util.item_signature(item)) for item in items])
+
+
+def _identity(obj):
+    return obj
+
+
+def _importable(obj) -> bool:
+    module = sys.modules.get(getattr(obj, "__module__", None))
+    qualname = getattr(obj, "__qualname__", "<")
+    if module is None or "<" in qualname:
+        return False
+    try:
+        return reduce(getattr, qualname.split("."), module) is obj
+    except AttributeError:
+        return False
+
+
+def _search(fct):
+    module = sys.modules.get(getattr(fct, "__module__", None))
+    if module is None:
+        return None
+
+    for names, obj in _members(module, (), set()):
+        for unwrap, wrapped in enumerate(_unwrapped(obj)):
+            if wrapped is fct:
+                return module.__name__, names, unwrap, None, ()
+            for parameter, annotation in getattr(wrapped, "__annotations__", {}).items():
+                path = _find(annotation, fct) if texe.util.is_package_annotation(annotation) else None
+                if path is not None:
+                    return module.__name__, names, unwrap, parameter, path
+    return None
+
+
+def _members(namespace, names, visited):
+    # The functions of a module, and (recursively) of the classes that are defined in it
+    visited.add(id(namespace))
+    for name, obj in list(vars(namespace).items()):
+        if isinstance(obj, (staticmethod, classmethod)):
+            obj = obj.__func__
+        if inspect.isclass(obj) and obj.__module__ == getattr(namespace, "__module__", namespace.__name__) \
+                and id(obj) not in visited:
+            yield from _members(obj, names + (name,), visited)
+        elif callable(obj):
+            yield names + (name,), obj
+
+
+def _unwrapped(obj):
+    seen = set()
+    while obj is not None and id(obj) not in seen and len(seen) < 100:   # Like inspect.unwrap, never endless
+        seen.add(id(obj))
+        yield obj
+        obj = getattr(obj, "__wrapped__", None)
+
+
+def _find(annotation, fct):
+    # The indices that lead from annotation to fct through the items
+    for index, item in enumerate(annotation.items or ()):
+        if item is fct:
+            return (index,)
+        if texe.util.is_package_annotation(item):
+            path = _find(item, fct)
+            if path is not None:
+                return (index,) + path
+    return None
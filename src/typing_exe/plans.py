@@ -0,0 +1,218 @@
+import os
+import sys
+import inspect
+import marshal
+import importlib
+import importlib.util
+from typing import Callable, NamedTuple
+
+import typing_exe as texe
+
+
+FORMAT = 1   # Increased whenever the content of the cache-files changes
+MAGIC = importlib.util.MAGIC_NUMBER   # Code-objects only work with the Python-version that created them
+
+precompiling = False   # Lazy functions are built right away while precompiling
+
+_recorded = None   # {source-file: RecordedFile} while precompiling
+_codes = {}   # {wrapper-source: code} from all cache-files that were loaded
+_loaded = set()   # Source-files whose cache-file was looked for
+
+
+class PlannedFunction(NamedTuple):
+    function: Callable
+    pdata: texe.parameter_data.ParameterData
+    compiled: bool
+
+
+class PrecompiledModule(NamedTuple):
+    name: str
+    source: str
+    cache: str
+    functions: list
+    codes: int
+
+
+class _RecordedFile(NamedTuple):
+    functions: list
+    codes: dict
+
+
+def cache_path(source: str) -> str:
+    # Next to the .pyc-files of the source, in __pycache__
+    pyc = importlib.util.cache_from_source(source, optimization="")
+    return f"{os.path.splitext(pyc)[0]}.typing_exe-{FORMAT}.plans"
+
+
+def get_code(fct, source: str):
+    # The code of a generated wrapper; compiling it is the most expensive part of decorating a function
+    filename = _filename(fct)
+    if filename is not None and filename not in _loaded:
+        load(filename)
+
+    code = _codes.get(source)
+    if code is None:
+        code = texe.codegen._compile_source(source)
+    if _recorded is not None and filename is not None:
+        _recording(filename).codes[source] = code
+    return code
+
+
+def load(filename: str) -> bool:
+    # The cache-file is only used if the source is unchanged since it was written
+    _loaded.add(filename)
+    try:
+        stat = os.stat(filename)
+        with open(cache_path(filename), "rb") as file:
+            data = file.read()
+        magic, version, mtime, size, codes = marshal.loads(data)
+    except (OSError, EOFError, ValueError, TypeError, NotImplementedError):
+        return False
+
+    if (magic, version, mtime, size) != (MAGIC, FORMAT, stat.st_mtime_ns, stat.st_size):
+        return False
+    _codes.update(codes)
+    return True
+
+
+def write(filename: str, codes: dict) -> str:
+    stat = os.stat(filename)
+    path = cache_path(filename)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    # Written to a temporary file first, so that a half-written file is never loaded
+    temporary = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temporary, "wb") as file:
+            file.write(marshal.dumps((MAGIC, FORMAT, stat.st_mtime_ns, stat.st_size, codes)))
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.unlink(temporary)
+        raise
+    return path
+
+
+def record(fct, pdata, compiled: bool):
+    filename = _filename(fct)
+    if _recorded is not None and filename is not None:
+        _recording(filename).functions.append(PlannedFunction(fct, pdata, compiled))
+
+
+def precompile(*module_names: str) -> list:
+    # Imports the modules and writes the compiled wrappers of their decorated functions to the cache
+    global precompiling, _recorded
+    precompiling, _recorded = True, {}
+    try:
+        modules = [importlib.import_module(name) for name in module_names]
+        recorded = _recorded
+    finally:
+        precompiling, _recorded = False, None
+
+    precompiled = []
+    for module in modules:
+        source = getattr(module, "__file__", None)
+        if source is None or not source.endswith(".py"):
+            raise ValueError(f"Module {module.__name__} has no Python source-file")
+
+        recorded_file = recorded.get(os.path.realpath(source), _RecordedFile([], {}))
+        precompiled.append(PrecompiledModule(
+            name=module.__name__,
+            source=source,
+            cache=write(source, recorded_file.codes),
+            functions=recorded_file.functions,
+            codes=len(recorded_file.codes),
+        ))
+    return precompiled
+
+
+def format_report(precompiled: list) -> str:
+    lines = []
+    for module in precompiled:
+        lines.append(f"{module.name} ({module.source})")
+        lines.append(f"    cache: {module.cache} ({module.codes} compiled wrappers)")
+        for fct, pdata, compiled in module.functions:
+            lines.append(
+                f"    {fct.__qualname__} (line {fct.__code__.co_firstlineno}): "
+                f"{'compiled' if compiled else 'generic'} wrapper"
+            )
+            lines.extend(f"        {line}" for line in describe_plan(fct, pdata))
+    return "\n".join(lines)
+
+
+def describe_plan(fct, pdata) -> list:
+    annotations = {pname: annotation for pname, annotation in pdata.kwarg_annotations.items()}
+    annotations.update(
+        (pdata.argname_from_index[idx], annotation) for idx, annotation in pdata.arg_annotations.items()
+    )
+
+    lines = []
+    for pname in pdata.argname_from_index:
+        if pname in annotations:
+            lines.append(f"{pname}: {describe(annotations[pname])}")
+    for pname, _, value, _ in pdata.defaultdata:
+        if isinstance(value, texe.early_return.EarlyReturn):
+            lines.append(f"{pname} = EarlyReturn({value.returns!r})")
+
+    return_annotation = texe.decorators._get_return_annotation(pdata)
+    if return_annotation is not None:
+        lines.append(f"return: {describe(return_annotation)}")
+    for parameter, description in texe.optimizer.report(fct):
+        lines.append(f"optimized {parameter}: {description}")
+    return lines
+
+
+def describe(annotation) -> str:
+    entries = [] if annotation.typehint is None else [inspect.formatannotation(annotation.typehint)]
+    entries += [
+        describe(item) if texe.util.is_package_annotation(item) else getattr(item, "__qualname__", repr(item))
+        for item in annotation.items or ()
+    ]
+    options = [
+        f"{name}={_describe_option(getattr(annotation, name))}"
+        for name in annotation._fields
+        if name not in ("typehint", "items", "checker") and getattr(annotation, name) not in (None, False)
+    ]
+    description = f"{type(annotation).__name__.lstrip('_')}[{', '.join(entries)}]"
+    return f"{description} ({', '.join(options)})" if options else description
+
+
+def _describe_option(value) -> str:
+    return repr(value) if isinstance(value, (bool, int, float, str, tuple)) else type(value).__name__
+
+
+def _filename(fct):
+    code = getattr(inspect.unwrap(fct), "__code__", None)
+    if code is None:
+        return None
+    return os.path.realpath(code.co_filename) if _recorded is not None else code.co_filename
+
+
+def _recording(filename):
+    recorded_file = _recorded.get(filename)
+    if recorded_file is None:
+        recorded_file = _recorded[filename] = _RecordedFile([], {})
+    return recorded_file
+
+
+def main(arguments=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m typing_exe")
+    commands = parser.add_subparsers(dest="command", required=True)
+    precompile_parser = commands.add_parser(
+        "precompile", help="cache the compiled wrappers of the decorated functions in the modules"
+    )
+    precompile_parser.add_argument("modules", nargs="+", help="the modules to precompile, like package.module")
+    precompile_parser.add_argument("-q", "--quiet", action="store_true", help="don't print the report")
+    arguments = parser.parse_args(arguments)
+
+    try:
+        precompiled = precompile(*arguments.modules)
+    except (ImportError, ValueError, OSError) as error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 1
+
+    if not arguments.quiet:
+        print(format_report(precompiled))
+    return 0
@@ -0,0 +1,145 @@
+import inspect
+import threading
+from functools import wraps
+
+import typing_exe as texe
+from typing_exe.parameter_data import ParameterData
+
+
+_process_pool = None
+_thread_pool = None
+_lock = threading.Lock()
+
+
+def set_process_pool(executor):
+    global _process_pool
+    with _lock:
+        _process_pool = executor
+
+
+def get_process_pool():
+    global _process_pool
+    with _lock:
+        if _process_pool is None:
+            from concurrent.futures import ProcessPoolExecutor   # Only imported when needed because it is slow
+
+            _process_pool = ProcessPoolExecutor()
+        return _process_pool
+
+
+def set_thread_pool(executor):
+    global _thread_pool
+    with _lock:
+        _thread_pool = executor
+
+
+def get_thread_pool():
+    global _thread_pool
+    with _lock:
+        if _thread_pool is None:
+            from concurrent.futures import ThreadPoolExecutor   # Only imported when needed because it is slow
+
+            _thread_pool = ThreadPoolExecutor(thread_name_prefix="typing_exe")
+        return _thread_pool
+
+
+def get_pooled_asserts(pdata: ParameterData, all_asserts: bool) -> tuple:
+    # Asserts that run on the process-pool; those that depend on modified parameters are checked as usual
+    return tuple(
+        pooled for pooled in _get_independent_parameters(pdata)
+        if all_asserts or pooled[3].process_pool
+    )
+
+
+def get_independent_asserts(pdata: ParameterData) -> tuple:
+    independent = tuple(_get_independent_parameters(pdata))
+    return independent if len(independent) > 1 else ()
+
+
+def _get_independent_parameters(pdata: ParameterData):
+    # Asserts that only use parameters that aren't modified by any annotation;
+    #   they give the same result no matter when they run, so they can all run at once
+    modified = {
+        pname for pname, annotation in pdata.kwarg_annotations.items() if annotation.modifies
+    } | {
+        pdata.argname_from_index[idx] for idx, annotation in pdata.arg_annotations.items() if annotation.modifies
+    }
+
+    for pooled in _get_assert_parameters(pdata):
+        pname, annotation = pooled[0], pooled[3]
+        used = {pname} | {
+            binding.name for item in annotation.items for binding in pdata.bindings.get(item, ())
+        }
+        if not used & modified:
+            yield pooled
+
+
+def _get_assert_parameters(pdata: ParameterData):
+    # Parameters that are annotated directly by an Assert (not in a Sequence)
+    for idx, (pname, parameter) in enumerate(pdata.function_signature.parameters.items()):
+        annotation = pdata.kwarg_annotations.get(pname, pdata.arg_annotations.get(idx))
+        if type(annotation) is not texe.annotations._Assert or annotation.items is None:
+            continue
+        if parameter.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD):
+            continue
+
+        positional = parameter.kind != inspect.Parameter.KEYWORD_ONLY
+        yield pname, idx if positional else None, parameter.default, annotation
+
+
+def with_pooled_asserts(fct, pdata: ParameterData, pooled: tuple, executor):
+    # Returns fct wrapped so that the pooled Asserts are checked concurrently right before fct is called;
+    #   executor is either an Executor or a function that returns one
+    # Lambdas are sent to the processes as references to the annotations they are defined in
+    references = tuple(tuple(texe.pickling.reference(item) for item in annotation.items) for *_, annotation in pooled)
+
+    def submit(args, kwargs):
+        pool = executor if hasattr(executor, "submit") else executor()
+        submitted, failures = [], []
+        for (pname, idx, default, annotation), item_references in zip(pooled, references):
+            if pname in kwargs:
+                parameter = kwargs[pname]
+            elif idx is not None and idx < len(args):
+                parameter = args[idx]
+            else:
+                parameter = default
+            if parameter is None or parameter is inspect.Parameter.empty:
+                continue
+            if annotation.checker is not None and not annotation.checker(parameter):
+                failures.append(texe.annotations._typehint_violated(fct, pname, annotation.typehint, parameter))
+                continue
+
+            for (item, item_signature), item_reference in zip(annotation.items.items(), item_references):
+                other_parameters = [] if len(item_signature.parameters) == 1 else annotation.resolve_item(
+                    "Assert", item, item_signature, fct, parameter, pname, args, kwargs, pdata
+                )
+                future = pool.submit(item_reference, parameter, *other_parameters)
+                submitted.append((future, item, parameter, pname))
+        return submitted, failures
+
+    def raise_failures(results, failures):
+        failures.extend(
+            texe.annotations._assert_failed(fct, pname, item, parameter)
+            for result, (_, item, parameter, pname) in results
+            if not result
+        )
+        texe.errors.report(failures)
+
+    if inspect.iscoroutinefunction(fct):
+        @wraps(fct)
+        async def checked(*args, **kwargs):
+            import asyncio   # Only imported when needed because it is slow to import
+
+            submitted, failures = submit(args, kwargs)
+            results = await asyncio.gather(*(asyncio.wrap_future(future) for future, *_ in submitted))
+            raise_failures(zip(results, submitted), failures)
+            return await fct(*args, **kwargs)
+    else:
+        @wraps(fct)
+        def checked(*args, **kwargs):
+            submitted, failures = submit(args, kwargs)
+            results = [future.result() for future, *_ in submitted]
+            raise_failures(zip(results, submitted), failures)
+            return fct(*args, **kwargs)
+
+    return checked
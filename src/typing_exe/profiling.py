@@ -0,0 +1,166 @@
+import time
+import threading
+from dataclasses import dataclass, field, replace
+
+from typing_exe import enforcement, events
+from typing_exe.early_return import EarlyReturn
+
+
+enabled = False
+instrumented = False   # Profiling is enabled or events are subscribed to; checked once per call
+
+_lock = threading.Lock()
+_functions = {}   # {function-name: FunctionStats}
+_items = {}   # {(function-name, parameter-name, context, item): ItemStats}
+
+
+@dataclass
+class ItemStats:
+    parameter: str
+    context: str
+    name: str
+    calls: int = 0
+    failures: int = 0
+    early_returns: int = 0
+    time: float = 0.
+
+
+@dataclass
+class FunctionStats:
+    name: str
+    calls: int = 0
+    failures: int = 0
+    early_returns: int = 0
+    time: float = 0.
+    items: list = field(default_factory=list)
+
+
+def enable():
+    global enabled
+    enabled = True
+    update_instrumented()
+
+
+def disable():
+    global enabled
+    enabled = False
+    update_instrumented()
+
+
+def update_instrumented():
+    global instrumented
+    instrumented = enforcement._GLOBAL.active = enabled or events.enabled
+
+
+def collects_stats() -> bool:
+    # texe.enforcement.scope(collect_stats=...) overrides enable and disable
+    collect_stats = enforcement.current().collect_stats
+    return enabled if collect_stats is None else collect_stats
+
+
+def stats() -> dict:
+    with _lock:
+        functions = {name: replace(function_stats, items=[]) for name, function_stats in _functions.items()}
+        for (function_name, *_), item_stats in _items.items():
+            functions[function_name].items.append(replace(item_stats))
+    return functions
+
+
+def reset_stats():
+    with _lock:
+        _functions.clear()
+        _items.clear()
+
+
+def profile_call(fct, execute, args, kwargs):
+    failed = True
+    start = time.perf_counter()
+    try:
+        returns = execute(args, kwargs)
+        failed = False
+        return returns
+    finally:
+        _finish_call(fct, time.perf_counter() - start, failed)
+
+
+async def profile_call_async(fct, execute, args, kwargs):
+    failed = True
+    start = time.perf_counter()
+    try:
+        returns = await execute(args, kwargs)
+        failed = False
+        return returns
+    finally:
+        _finish_call(fct, time.perf_counter() - start, failed)
+
+
+def profile_item(execute_item, context, item, item_signature, fct, parameter, parameter_name, args, kwargs, pdata):
+    # The time of awaitable items only covers the call, not the await
+    result = None
+    failed = True
+    start = time.perf_counter()
+    try:
+        result = execute_item(
+            context, item, item_signature, fct, parameter, parameter_name, args, kwargs, pdata
+        )
+        failed = context == "Assert" and not result
+        return result
+    finally:
+        _record_item(
+            fct, parameter_name, context, item, time.perf_counter() - start, failed, isinstance(result, EarlyReturn)
+        )
+
+
+def record_early_return(fct):
+    # Early return through the default-value of a parameter
+    if events.enabled:
+        events.emit(events.EARLY_RETURN, fct)
+    if collects_stats():
+        with _lock:
+            _function_stats(fct).early_returns += 1
+
+
+def _finish_call(fct, elapsed, failed):
+    if events.enabled:
+        events.emit(events.CALL, fct, duration=elapsed, failed=failed)
+    if collects_stats():
+        _record_call(fct, elapsed, failed)
+
+
+def _record_call(fct, elapsed, failed):
+    with _lock:
+        function_stats = _function_stats(fct)
+        function_stats.calls += 1
+        function_stats.failures += failed
+        function_stats.time += elapsed
+
+
+def _record_item(fct, parameter_name, context, item, elapsed, failed, early_return):
+    with _lock:
+        function_stats = _function_stats(fct)
+        key = (function_stats.name, parameter_name, context, item)
+        item_stats = _items.get(key)
+        if item_stats is None:
+            item_stats = _items[key] = ItemStats(
+                parameter=parameter_name, context=context, name=_item_name(item)
+            )
+
+        item_stats.calls += 1
+        item_stats.failures += failed
+        item_stats.early_returns += early_return
+        item_stats.time += elapsed
+        function_stats.early_returns += early_return
+
+
+def _function_stats(fct):
+    name = f"{fct.__module__}.{fct.__qualname__}"
+    function_stats = _functions.get(name)
+    if function_stats is None:
+        function_stats = _functions[name] = FunctionStats(name=name)
+    return function_stats
+
+
+def _item_name(item):
+    name = getattr(item, "__qualname__", repr(item))
+    code = getattr(item, "__code__", None)
+    return name if code is None else f"{name} (line {code.co_firstlineno})"
@@ -0,0 +1,115 @@
+import types
+import typing
+import collections.abc
+
+
+_UnionType = getattr(types, "UnionType", None)   # int | str, Python 3.10+
+_Annotated = getattr(typing, "Annotated", None)   # Python 3.9+
+
+# Containers whose elements can be checked without consuming them
+_SEQUENCES = (list, set, frozenset, collections.abc.Sequence, collections.abc.MutableSequence,
+              collections.abc.Set, collections.abc.MutableSet, collections.abc.Collection)
+_MAPPINGS = (dict, collections.abc.Mapping, collections.abc.MutableMapping)
+
+_checkers = {}   # {typehint: checker}
+
+
+class TypeChecker:
+    # Decides by the type of the value only, so every verdict is cached by that type
+    __slots__ = ("types", "verdicts")
+
+    def __init__(self, types_: tuple):
+        self.types = types_
+        self.verdicts = {}
+
+    def __call__(self, value) -> bool:
+        cls = type(value)
+        try:
+            return self.verdicts[cls]
+        except KeyError:
+            verdict = self.verdicts[cls] = issubclass(cls, self.types)
+            return verdict
+
+
+def compile_typehint(typehint):
+    try:
+        return _checkers[typehint]
+    except KeyError:
+        checker = _checkers[typehint] = _compile(typehint)
+        return checker
+    except TypeError:   # unhashable typehint
+        return _compile(typehint)
+
+
+def _compile(typehint):
+    if typehint is typing.Any or typehint is object:
+        return _accept
+    if typehint is None or typehint is type(None):
+        return TypeChecker((type(None),))
+
+    origin, args = typing.get_origin(typehint), typing.get_args(typehint)
+    if origin is None and isinstance(typehint, type):
+        return TypeChecker((typehint,))
+
+    if origin is typing.Union or (_UnionType is not None and origin is _UnionType):
+        checkers = [compile_typehint(arg) for arg in args]
+        if all(isinstance(checker, TypeChecker) for checker in checkers):
+            return TypeChecker(tuple(cls for checker in checkers for cls in checker.types))
+        return lambda value: any(checker(value) for checker in checkers)
+
+    if origin is typing.Literal:
+        return lambda value: any(type(value) is type(arg) and value == arg for arg in args)
+
+    if _Annotated is not None and origin is _Annotated:
+        return compile_typehint(args[0])
+
+    if isinstance(typehint, typing.TypeVar):
+        if typehint.__bound__ is not None:
+            return compile_typehint(typehint.__bound__)
+        if typehint.__constraints__:
+            return compile_typehint(typing.Union[typehint.__constraints__])
+        return _accept
+
+    if not isinstance(origin, type):
+        return _accept   # Can't be checked, like Callable[..., int] or ClassVar
+
+    container = TypeChecker((origin,))
+    if not args:
+        return container
+
+    if origin is tuple:
+        if len(args) == 2 and args[1] is Ellipsis:
+            element = compile_typehint(args[0])
+            return lambda value: container(value) and all(element(item) for item in value)
+        if args == ((),):   # Tuple[()]
+            return lambda value: container(value) and len(value) == 0
+        elements = [compile_typehint(arg) for arg in args]
+        return lambda value: container(value) \
+            and len(value) == len(elements) \
+            and all(element(item) for element, item in zip(elements, value))
+
+    if origin in _MAPPINGS and len(args) == 2:
+        key, val = compile_typehint(args[0]), compile_typehint(args[1])
+        return lambda value: container(value) and all(key(k) and val(v) for k, v in value.items())
+
+    if origin in _SEQUENCES and len(args) == 1:
+        element = compile_typehint(args[0])
+        return lambda value: container(value) and all(element(item) for item in value)
+
+    return container   # Iterators, generators, etc. can't be checked without consuming them
+
+
+def _accept(value) -> bool:
+    return True
+
+
+def failure_message(fct, parameter, parameter_name, typehint) -> str:
+    return f"\nTypehint violated! \n" \
+           f"\t- Callable: \n" \
+           f"\t\t- Name: {fct.__qualname__}\n" \
+           f"\t\t- Module: {fct.__module__}\n" \
+           f"\t- Typehint: {typehint}\n" \
+           f"\t- Parameter: \n" \
+           f"\t\t- Name: {parameter_name}\n" \
+           f"\t\t- Value: {parameter}\n" \
+           f"\t\t- Type: {type(parameter)}\n"
@@ -1,13 +1,21 @@
 import typing
+import inspect
+import weakref
 import typing_exe as texe
 from abc import ABCMeta
 
 
+_signatures = weakref.WeakKeyDictionary()
+
+
 def is_package_annotation(annotation):
     annotations = [
         texe.annotations._Assert,
+        texe.annotations._DeferredAssert,
         texe.annotations._Modify,
-        texe.annotations._Sequence
+        texe.annotations._Sequence,
+        texe.annotations._Each,
+        texe.annotations._ArrayAssert
     ]
     return type(annotation) in annotations
 
@@ -17,7 +25,51 @@ def is_typehint(value) -> bool:
     if type(value) is type or type(value) is ABCMeta:
         return True
 
-    # Cover types from typing module:
-    name_with_brackets = str(value).split(".")[-1]  # Might be Union or Union[float, int]
-    name = name_with_brackets.split("[")[0]  # Now just Union (etc.)
-    return name in typing.__all__
+    # Cover parametrized generics like list[int], Union[int, float], or int | float:
+    if typing.get_origin(value) is not None:
+        return True
+
+    # Cover everything else from the typing module, like Any or TypeVars:
+    return type(value).__module__ in ("typing", "typing_extensions")
+
+
+def signature(fct) -> inspect.Signature:
+    # Callables are often shared between many annotations, so their signatures are cached
+    try:
+        return _signatures[fct]
+    except KeyError:
+        _signatures[fct] = fct_signature = _get_signature(fct)
+        return fct_signature
+    except TypeError:   # Not weakly referenceable, like many builtins
+        return _get_signature(fct)
+
+
+def item_signature(item) -> inspect.Signature:
+    # Items written in Python bind all their parameters to parameters of the function;
+    #   of builtins and numpy's ufuncs, only the positional ones without defaults are bound (not out or where)
+    item_signature = signature(item)
+    if _is_python(item):
+        return item_signature
+
+    parameters = list(item_signature.parameters.values())
+    bound = parameters[:1] + [
+        parameter for parameter in parameters[1:]
+        if parameter.default is inspect.Parameter.empty
+        and parameter.kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    ]
+    return item_signature if len(bound) == len(parameters) else item_signature.replace(parameters=bound)
+
+
+def _is_python(item) -> bool:
+    item = getattr(item, "__func__", item)   # Bound methods
+    return hasattr(item, "__code__") or hasattr(getattr(type(item), "__call__", None), "__code__")
+
+
+def _get_signature(fct) -> inspect.Signature:
+    try:
+        return inspect.signature(fct)
+    except ValueError:   # No signature available, like for numpy's ufuncs; they only get the annotated parameter
+        return _UNARY
+
+
+_UNARY = inspect.Signature([inspect.Parameter("parameter", inspect.Parameter.POSITIONAL_ONLY)])
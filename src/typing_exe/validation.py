@@ -0,0 +1,320 @@
+import os
+import inspect
+import threading
+import dataclasses
+import weakref
+from collections import deque
+from contextlib import ExitStack
+from functools import partial, wraps
+from itertools import islice
+from typing import Any, NamedTuple, Optional
+
+import typing_exe as texe
+
+
+PENDING_CHUNKS = 2 * (os.cpu_count() or 1)   # Chunks given to an executor at once; they bound the memory used
+
+_lock = threading.Lock()   # Validators are built rarely, so they share one lock
+_validators = weakref.WeakKeyDictionary()   # {function: Validator} for functions that aren't decorated
+
+
+class ValidationResult(NamedTuple):
+    arguments: Optional[dict]   # {parameter-name: value} after the Modify-items; None if something failed
+    errors: list
+    early_return: Any = None   # The EarlyReturn that the call would have returned, if any
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+class FileValidation(NamedTuple):
+    passed: int
+    failed: int
+
+
+class _Arguments(NamedTuple):
+    # What the body of the validated function returns instead of running
+    args: tuple
+    kwargs: dict
+
+
+class _Built(NamedTuple):
+    signature: inspect.Signature
+    positional_only: tuple
+    execute: Any
+
+
+class Validator:
+    # Runs the annotations of a function in collect-all mode, but never its body; built on first use
+    __slots__ = ("fct", "check_types", "method", "built", "__weakref__")
+
+    def __init__(self, fct, check_types=False, method=False):
+        self.fct = fct
+        self.check_types = check_types
+        self.method = method
+        self.built = None
+
+    def __call__(self, *args, **kwargs) -> ValidationResult:
+        built = self.built or self.build()
+        if inspect.iscoroutinefunction(self.fct):
+            return self._validate_async(built, list(args), kwargs)
+        try:
+            returns = built.execute(list(args), kwargs)
+        except texe.errors.ValidationError as error:
+            return _failed(error)
+        return _result(built.signature, returns)
+
+    def record(self, record: dict, *args) -> ValidationResult:
+        # Positional-only parameters after args are taken from the record by their names, too
+        built = self.built or self.build()
+        kwargs = dict(record)
+        args = list(args)
+        for pname in built.positional_only[len(args):]:
+            if pname not in kwargs:
+                break
+            args.append(kwargs.pop(pname))
+        return self(*args, **kwargs)
+
+    async def _validate_async(self, built, args, kwargs):
+        try:
+            returns = await built.execute(args, kwargs)
+        except texe.errors.ValidationError as error:
+            return _failed(error)
+        return _result(built.signature, returns)
+
+    def build(self) -> _Built:
+        with _lock:
+            if self.built is None:
+                pdata = texe.decorators._get_data(self.fct, self.method)
+                pdata = dataclasses.replace(   # The return-annotation would need the body
+                    pdata,
+                    function_signature=pdata.function_signature.replace(return_annotation=inspect.Parameter.empty)
+                )
+                if self.check_types:
+                    pdata = texe.decorators._with_typechecks(pdata)
+
+                if inspect.iscoroutinefunction(self.fct):
+                    make_wrapper = texe.decorators._make_async_wrapper
+                else:
+                    make_wrapper = texe.decorators._make_wrapper
+                body = texe.errors.with_collected_errors(_capture(self.fct))
+                _, _execute = make_wrapper(body, texe.decorators._collecting(pdata))
+
+                self.built = _Built(
+                    signature=pdata.function_signature,
+                    positional_only=tuple(
+                        pname for pname, parameter in pdata.function_signature.parameters.items()
+                        if parameter.kind == inspect.Parameter.POSITIONAL_ONLY
+                    ),
+                    execute=texe.errors.collect_errors(self.fct, _execute)
+                )
+        return self.built
+
+
+def get_validator(fct) -> Validator:
+    # The validator of a decorated function, or one that is made for an undecorated function
+    validator = getattr(fct, "validate", None)
+    if isinstance(validator, Validator):
+        return validator
+
+    validator = _validators.get(fct)
+    if validator is None:
+        validator = _validators.setdefault(fct, Validator(inspect.unwrap(fct)))
+    return validator
+
+
+def validate(fct, *args, **kwargs) -> ValidationResult:
+    if inspect.ismethod(fct):   # The instance (or class) that the method is bound to is the first argument
+        return get_validator(fct.__func__)(fct.__self__, *args, **kwargs)
+    return get_validator(fct)(*args, **kwargs)
+
+
+def validate_record(fct, record: dict) -> ValidationResult:
+    if inspect.ismethod(fct):
+        return get_validator(fct.__func__).record(record, fct.__self__)
+    return get_validator(fct).record(record)
+
+
+def describe_error(error) -> dict:
+    # A JSON-serializable description of an error
+    if not isinstance(error, texe.errors.ValidationError):
+        return {"error": type(error).__name__, "message": str(error)}
+
+    description = {"error": type(error).__name__, "parameter": error.parameter}
+    if error.item is not None:
+        description["item"] = getattr(error.item, "__qualname__", repr(error.item))
+    if isinstance(error, texe.errors.TypehintViolated):
+        description["typehint"] = inspect.formatannotation(error.typehint)
+    description["value"] = repr(error.value)
+    return description
+
+
+def validate_file(fct, source, passed, failed, *, file_format=None, chunksize=1000, executor=None) -> FileValidation:
+    # Streams the records of a JSONL- or CSV-file through the annotations of fct;
+    #   passing records are written to passed with their modified values, failing ones to failed with their errors
+    if inspect.iscoroutinefunction(inspect.unwrap(fct)):
+        raise TypeError(f"The records can't be validated with the coroutine function {fct.__qualname__}")
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be at least 1, not {chunksize}")
+    file_format = _get_format(source) if file_format is None else file_format
+    if file_format not in ("jsonl", "csv"):
+        raise ValueError(f"Unknown file_format {file_format!r}; use 'jsonl' or 'csv'")
+    if executor is True:
+        executor = texe.pools.get_process_pool()
+
+    newline = "" if file_format == "csv" else None
+    with ExitStack() as stack:
+        source = _open(stack, source, "r", newline)
+        writers = (
+            _make_writer(file_format, _open(stack, passed, "w", newline)),
+            _make_writer(file_format, _open(stack, failed, "w", newline)),
+        )
+
+        counts = [0, 0]
+        records = enumerate(_read_csv(source) if file_format == "csv" else _read_jsonl(source), start=1)
+        chunks = iter(lambda: list(islice(records, chunksize)), [])
+        for results in _map_chunks(partial(_validate_chunk, fct, file_format), chunks, executor):
+            for ok, output in results:
+                writers[not ok](output)
+                counts[not ok] += 1
+
+    return FileValidation(passed=counts[0], failed=counts[1])
+
+
+def _capture(fct):
+    if inspect.iscoroutinefunction(fct):
+        @wraps(fct)
+        async def body(*args, **kwargs):
+            return _Arguments(args, kwargs)
+    else:
+        @wraps(fct)
+        def body(*args, **kwargs):
+            return _Arguments(args, kwargs)
+
+    return body
+
+
+def _failed(error):
+    errors = error.errors if isinstance(error, texe.errors.ValidationErrors) else [error]
+    return ValidationResult(arguments=None, errors=errors)
+
+
+def _result(signature, returns):
+    if not isinstance(returns, _Arguments):
+        return ValidationResult(arguments=None, errors=[], early_return=texe.early_return.EarlyReturn(returns))
+    try:
+        bound = signature.bind(*returns.args, **returns.kwargs)
+    except TypeError as error:   # Missing or unexpected arguments
+        return ValidationResult(arguments=None, errors=[error])
+    bound.apply_defaults()
+    return ValidationResult(arguments=dict(bound.arguments), errors=[])
+
+
+class _Unreadable(NamedTuple):
+    line: str
+    error: Exception
+
+
+def _validate_chunk(fct, file_format, chunk):
+    # Runs in the executor; returns only what can be sent back from another process
+    results = []
+    for number, record in chunk:
+        if isinstance(record, _Unreadable):
+            result = ValidationResult(arguments=None, errors=[record.error])
+            record = record.line
+        elif not isinstance(record, dict):
+            result = ValidationResult(arguments=None, errors=[TypeError(f"The record is not an object: {record!r}")])
+        else:
+            try:
+                result = validate_record(fct, record)
+            except Exception as error:   # An item that raises fails the record, not the whole file
+                result = ValidationResult(arguments=None, errors=[error])
+
+        if result.ok:
+            results.append((True, record if result.arguments is None else result.arguments))
+        elif file_format == "csv":
+            results.append((False, {**record, "errors": _dumps([describe_error(error) for error in result.errors])}))
+        else:
+            results.append((False, {
+                "number": number, "record": record, "errors": [describe_error(error) for error in result.errors]
+            }))
+    return results
+
+
+def _map_chunks(function, chunks, executor):
+    # Keeps the order of the chunks, and never more than PENDING_CHUNKS of them in memory
+    if executor is None:
+        yield from map(function, chunks)
+        return
+
+    pending = deque()
+    for chunk in chunks:
+        pending.append(executor.submit(function, chunk))
+        if len(pending) >= PENDING_CHUNKS:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _get_format(source):
+    name = source if isinstance(source, (str, os.PathLike)) else getattr(source, "name", "")
+    extension = os.path.splitext(os.fspath(name))[1].lower() if isinstance(name, (str, os.PathLike)) else ""
+    if extension == ".csv":
+        return "csv"
+    if extension in (".jsonl", ".ndjson"):
+        return "jsonl"
+    raise ValueError(f"The format of {name!r} is unknown; give file_format='jsonl' or file_format='csv'")
+
+
+def _open(stack, file, mode, newline):
+    # Paths are opened (and closed again); file-objects are used as they are
+    if isinstance(file, (str, os.PathLike)):
+        return stack.enter_context(open(file, mode, encoding="utf-8", newline=newline))
+    return file
+
+
+def _read_jsonl(file):
+    import json
+
+    for line in file:
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError as error:
+            yield _Unreadable(line.rstrip("\n"), error)
+
+
+def _read_csv(file):
+    import csv
+
+    for row in csv.DictReader(file):
+        row.pop(None, None)   # The values of a row that has more of them than there are columns
+        # The columns that a shorter row is missing are None; leaving them out lets the defaults apply
+        yield {column: value for column, value in row.items() if value is not None}
+
+
+def _make_writer(file_format, file):
+    if file_format == "jsonl":
+        return lambda record: file.write(_dumps(record) + "\n")
+
+    import csv
+
+    writer = None
+
+    def write(record):
+        # The columns are those of the first record
+        nonlocal writer
+        if writer is None:
+            writer = csv.DictWriter(file, fieldnames=list(record), extrasaction="ignore")
+            writer.writeheader()
+        writer.writerow(record)
+
+    return write
+
+
+def _dumps(value):
+    import json
+
+    return json.dumps(value, default=str)
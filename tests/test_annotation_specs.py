@@ -0,0 +1,96 @@
+import copy
+import pytest
+
+import typing_exe as texe
+from typing_exe.decorators import execute_annotations
+from typing_exe.annotations import Assert, Modify, Sequence
+
+
+def is_positive(a):
+    return a > 0
+
+
+def double(a):
+    return a * 2
+
+
+class TestInterning:
+    def test_same_items_are_shared(self):
+        assert Assert[is_positive] is Assert[is_positive]
+        assert Assert[int, is_positive] is Assert[int, is_positive]
+        assert Modify[double] is Modify[double]
+        assert Sequence[Modify[double], Assert[is_positive]] is Sequence[Modify[double], Assert[is_positive]]
+
+    def test_different_items_are_not_shared(self):
+        assert Assert[is_positive] is not Assert[int, is_positive]
+        assert Assert[is_positive] is not Modify[is_positive]
+        assert Sequence[Modify[double], Assert[is_positive]] is not Sequence[Assert[is_positive], Modify[double]]
+
+    def test_lambdas_are_not_interned(self):
+        size = len(texe.annotations._interned)
+        Assert[lambda a: a > 0]
+        Sequence[Assert[lambda a: a > 0]]
+        assert len(texe.annotations._interned) == size
+
+    def test_shared_between_functions(self):
+        annotation = Assert[is_positive]
+
+        @execute_annotations
+        def fct1(a: annotation, b: annotation):
+            return a + b
+
+        @execute_annotations
+        def fct2(a, b: annotation = 1):
+            return a + b
+
+        assert fct1(1, 2) == 3
+        assert fct2(-1, 2) == 1
+
+        with pytest.raises(ValueError):
+            fct1(1, -2)
+        with pytest.raises(ValueError):
+            fct2(1, -2)
+
+
+class TestImmutable:
+    def test_setattr(self):
+        annotation = Assert[is_positive]
+        with pytest.raises(AttributeError):
+            annotation.items = None
+        with pytest.raises(AttributeError):
+            del annotation.typehint
+        with pytest.raises(AttributeError):
+            annotation.something = 1
+
+    def test_methods_return_new_annotations(self):
+        annotation = Modify[double]
+        assert annotation.pure() is not annotation
+        assert annotation.cache is None
+        assert Assert[is_positive].in_process_pool() is not Assert[is_positive]
+        assert not Assert[is_positive].process_pool
+
+    def test_copy(self):
+        annotation = Assert[is_positive]
+        assert copy.copy(annotation) is annotation
+        assert copy.deepcopy(annotation) is annotation
+
+    def test_items(self):
+        annotation = Assert[int, is_positive, double]
+        assert list(annotation.items) == [is_positive, double]
+        assert len(annotation.items) == 2
+        assert is_positive in annotation.items
+        with pytest.raises(KeyError):
+            annotation.items[abs]
+
+
+def test_parameter_data():
+    def fct(a, /, b: Assert[is_positive] = 1, *, c: Modify[double] = 2):
+        ...
+
+    pdata = texe.decorators._get_data(fct)
+    assert pdata.argname_from_index == ("a", "b", "c")
+    assert pdata.defaultdata == (
+        texe.parameter_data.DefaultData("b", 1, 1, False),
+        texe.parameter_data.DefaultData("c", 2, 2, False),
+    )
+    assert not hasattr(pdata, "__dict__")
@@ -0,0 +1,159 @@
+import array
+import pytest
+
+import typing_exe as texe
+from typing_exe.decorators import execute_annotations
+from typing_exe.annotations import ArrayAssert, Sequence, Modify
+from typing_exe.errors import ArrayAssertFailed, ArraySpecViolated
+
+
+@pytest.fixture
+def without_numpy(monkeypatch):
+    monkeypatch.setattr(texe.arrays, "_numpy", False)
+
+
+class TestBuffers:
+    def test_elements(self, without_numpy):
+        @execute_annotations
+        def fct(a: ArrayAssert[lambda x: x >= 0, lambda x: x < 10]):
+            return sum(a)
+
+        assert fct(array.array("d", [1., 2., 3.])) == 6.
+
+        with pytest.raises(ArrayAssertFailed) as error:
+            fct(array.array("d", [1., -2., 3., -4.]))
+        assert error.value.count == 2
+        assert error.value.indices == [(1,), (3,)]
+        assert error.value.values == [-2., -4.]
+        assert "First failed indices: [(1,), (3,)]" in str(error.value)
+        assert isinstance(error.value, ValueError)
+
+    def test_multidimensional(self, without_numpy):
+        @execute_annotations
+        def fct(a: ArrayAssert[lambda x: x != 0]):
+            return a
+
+        view = memoryview(array.array("i", [1, 2, 0, 4, 5, 0])).cast("B").cast("i", (2, 3))
+        with pytest.raises(ArrayAssertFailed) as error:
+            fct(view)
+        assert error.value.indices == [(0, 2), (1, 2)]
+        assert error.value.shape == (2, 3)
+
+    def test_reports_only_the_first_elements(self, without_numpy):
+        @execute_annotations
+        def fct(a: ArrayAssert[lambda x: x > 0]):
+            return a
+
+        with pytest.raises(ArrayAssertFailed) as error:
+            fct(array.array("i", [0] * 1000))
+        assert error.value.count == 1000
+        assert len(error.value.indices) == texe.arrays.MAX_REPORTED
+        assert "0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0" not in str(error.value)
+
+    def test_requirements(self, without_numpy):
+        @execute_annotations
+        def fct(a: ArrayAssert[lambda x: x > 0].requires(dtype=float, shape=(None,), contiguous=True)):
+            return a
+
+        assert fct(array.array("d", [1.])) is not None
+
+        with pytest.raises(ArraySpecViolated) as error:
+            fct(array.array("i", [1]))
+        assert error.value.requirement == "dtype"
+        assert error.value.actual == "int32"
+        assert isinstance(error.value, TypeError)
+
+        with pytest.raises(ArraySpecViolated) as error:
+            fct(memoryview(array.array("d", [1., 2.])).cast("B").cast("d", (1, 2)))
+        assert error.value.requirement == "shape"
+
+        with pytest.raises(ArraySpecViolated) as error:
+            fct(memoryview(array.array("d", [1., 2., 3.]))[::2])
+        assert error.value.requirement == "contiguous"
+
+    def test_other_parameters(self, without_numpy):
+        @execute_annotations
+        def fct(limit, a: ArrayAssert[lambda x, limit: x < limit]):
+            return a
+
+        assert fct(10, array.array("i", [1, 2])) is not None
+        with pytest.raises(ArrayAssertFailed):
+            fct(2, array.array("i", [1, 2]))
+
+    def test_not_a_buffer(self, without_numpy):
+        @execute_annotations
+        def fct(a: ArrayAssert[lambda x: x > 0]):
+            return a
+
+        with pytest.raises(TypeError):
+            fct([1, 2])
+
+    def test_in_sequence(self, without_numpy):
+        @execute_annotations
+        def fct(a: Sequence[Modify[lambda a: array.array("d", a)], ArrayAssert[lambda x: x > 0]]):
+            return a
+
+        assert list(fct([1., 2.])) == [1., 2.]
+        with pytest.raises(ArrayAssertFailed):
+            fct([1., -2.])
+
+    def test_asserts_only(self, without_numpy):
+        @execute_annotations(level="sampled(0)")
+        def fct(a: ArrayAssert[lambda x: x > 0]):
+            return a
+
+        assert fct(array.array("i", [-1])) is not None
+
+
+class TestNumpy:
+    def test_vectorized(self):
+        numpy = pytest.importorskip("numpy")
+
+        @execute_annotations
+        def fct(a: ArrayAssert[numpy.isfinite, lambda x: x >= 0].requires(dtype=numpy.float64, shape=(None, 2))):
+            return a.sum()
+
+        assert fct(numpy.ones((1000, 2))) == 2000.
+
+        values = numpy.ones((1000, 2))
+        values[3, 1] = -1.
+        values[500, 0] = -2.
+        with pytest.raises(ArrayAssertFailed) as error:
+            fct(values)
+        assert error.value.count == 2
+        assert error.value.indices == [(3, 1), (500, 0)]
+        assert error.value.values == [-1., -2.]
+
+        with pytest.raises(ArraySpecViolated):
+            fct(numpy.ones((2, 2), dtype=numpy.int64))
+
+        with pytest.raises(ArraySpecViolated):
+            fct(numpy.ones(2))
+
+    def test_array_likes(self):
+        numpy = pytest.importorskip("numpy")
+
+        @execute_annotations
+        def fct(a: ArrayAssert[lambda x: x > 0].requires(contiguous=True)):
+            return a
+
+        assert fct([1, 2, 3]) == [1, 2, 3]
+        with pytest.raises(ArraySpecViolated):
+            fct(numpy.ones((4, 4))[:, ::2])
+
+    def test_zero_dimensional(self):
+        numpy = pytest.importorskip("numpy")
+
+        @execute_annotations(collect_all=True)
+        def fct(a: ArrayAssert[lambda x: x > 0]):
+            return a
+
+        assert fct(1.5) == 1.5
+        with pytest.raises(texe.errors.ValidationErrors) as error:
+            fct(numpy.array(-1.5))
+        failed, = error.value.errors
+        assert isinstance(failed, ArrayAssertFailed)
+        assert (failed.count, failed.indices, failed.values, failed.shape) == (1, [()], [-1.5], ())
+
+        result = fct.validate(-2)
+        assert not result.ok and result.errors[0].values == [-2]
@@ -0,0 +1,88 @@
+import gc
+import asyncio
+import warnings
+
+import pytest
+
+from typing_exe.decorators import execute_annotations
+from typing_exe.annotations import Assert, Modify, Sequence
+from typing_exe.early_return import EarlyReturn
+
+
+class TestAsync:
+    def test_return_is_awaited(self):
+        @execute_annotations
+        async def fct(a: Modify[lambda a: a + 1]) -> Assert[lambda r: r > 0]:
+            return a
+
+        assert asyncio.run(fct(1)) == 2
+
+        with pytest.raises(ValueError):
+            asyncio.run(fct(-1))
+
+    def test_async_items(self):
+        async def is_known(a):
+            await asyncio.sleep(0)
+            return a in (1, 2)
+
+        async def double(a):
+            await asyncio.sleep(0)
+            return a * 2
+
+        @execute_annotations
+        async def fct(a: Sequence[Assert[is_known], Modify[double]], b: Assert[lambda b, a: b < a] = 0):
+            return a, b
+
+        assert asyncio.run(fct(1)) == (2, 0)
+        assert asyncio.run(fct(2, b=3)) == (4, 3)
+
+        with pytest.raises(ValueError):
+            asyncio.run(fct(3))
+
+        with pytest.raises(ValueError):
+            asyncio.run(fct(1, b=2))
+
+    def test_asserts_run_concurrently(self):
+        running = []
+        max_running = []
+
+        async def slow_check(p):
+            running.append(p)
+            await asyncio.sleep(0.01)
+            max_running.append(len(running))
+            running.remove(p)
+            return True
+
+        @execute_annotations
+        async def fct(a: Assert[slow_check], b: Assert[slow_check], *, c: Assert[slow_check]):
+            return a + b + c
+
+        assert asyncio.run(fct(1, 2, c=3)) == 6
+        assert max(max_running) == 3
+
+    def test_early_return(self):
+        async def hook(p):
+            return EarlyReturn("early") if p == 0 else p
+
+        @execute_annotations
+        async def fct(a: Assert[lambda a: a is not None], b: Modify[hook], c: Assert[lambda c: c > 0] = 1):
+            return a, b, c
+
+        assert asyncio.run(fct(1, 0, c=-1)) == "early"
+        assert asyncio.run(fct(1, 1)) == (1, 1, 1)
+
+        with pytest.raises(ValueError):   # c is checked after b
+            asyncio.run(fct(1, 1, -1))
+
+    def test_failed_assert_leaves_nothing_unawaited(self):
+        @execute_annotations
+        async def fct(a: Assert[lambda a: a > 0], b: Modify[lambda b: b + 1], *, c: Modify[lambda c: c + 1] = 1):
+            return a + b + c
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            for kwargs in ({}, {"c": 1}):
+                with pytest.raises(ValueError):
+                    asyncio.run(fct(-1, 1, **kwargs))
+            gc.collect()
+        assert not [warning for warning in caught if issubclass(warning.category, RuntimeWarning)]
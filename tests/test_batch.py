@@ -0,0 +1,46 @@
+import itertools
+import pytest
+
+from typing_exe.decorators import execute_annotations
+from typing_exe.annotations import Assert, Modify
+from typing_exe.early_return import EarlyReturn
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+class TestBatch:
+    def test_map(self, compiled):
+        @execute_annotations(compiled=compiled)
+        def fct(a: Modify[lambda a: a + 1], b: Assert[lambda b, a: b < a] = 1) -> Modify[lambda r: r * 2]:
+            return a
+
+        assert list(fct.map(range(1, 4))) == [4, 6, 8]
+
+        with pytest.raises(ValueError):
+            list(fct.map([1, 0]))
+
+    def test_starmap(self, compiled):
+        def hook(a):
+            return EarlyReturn("early") if a == 0 else a
+
+        @execute_annotations(compiled=compiled)
+        def fct(a: Modify[hook], b: Assert[lambda b: b != 0], /, c=3):
+            return a + b + c
+
+        assert list(fct.starmap([(1, 1), (0, 1), (1, 2, 0)])) == [5, "early", 3]
+
+        with pytest.raises(ValueError):
+            list(fct.starmap([(1, 0)]))
+
+    def test_chunksize(self, compiled):
+        @execute_annotations(compiled=compiled)
+        def fct(a: Assert[lambda a: a >= 0]):
+            return a
+
+        chunks = fct.map(itertools.count(), chunksize=3)   # must never be materialized
+        assert next(chunks) == [0, 1, 2]
+        assert next(chunks) == [3, 4, 5]
+
+        assert list(fct.map(range(5), chunksize=2)) == [[0, 1], [2, 3], [4]]
+
+        with pytest.raises(ValueError):
+            fct.map(range(5), chunksize=0)
@@ -0,0 +1,106 @@
+import pytest
+
+import typing_exe as texe
+from typing_exe.decorators import execute_annotations, execute_annotations_class
+from typing_exe.annotations import Assert, Modify
+
+
+@execute_annotations_class
+class Account:
+    limit = 100
+
+    def __init__(self, balance: Assert[lambda b: b >= 0] = 0):
+        self._balance = balance
+
+    def deposit(
+            self, amount: Assert[lambda amount, self: amount + self._balance <= self.limit]
+    ) -> Modify[lambda r: round(r)]:
+        self._balance += amount
+        return self._balance
+
+    @classmethod
+    def with_limit(cls, limit: Assert[lambda limit, cls: limit <= cls.limit]):
+        account = cls()
+        account.limit = limit
+        return account
+
+    @staticmethod
+    def fee(amount: Modify[abs]) -> Assert[lambda r: r >= 0]:
+        return amount * 0.01
+
+    @property
+    def balance(self):
+        return self._balance
+
+    @balance.setter
+    def balance(self, value: Assert[lambda v: v >= 0]):
+        self._balance = value
+
+    @execute_annotations(method=True)
+    def already_decorated(self, a: Modify[lambda a: a + 1]):
+        return a
+
+    def unannotated(self, a):
+        return a
+
+
+class TestClassDecorator:
+    def test_methods(self):
+        account = Account(10)
+        assert account.deposit(10.4) == 20
+
+        with pytest.raises(ValueError):
+            account.deposit(90)
+
+        with pytest.raises(ValueError):
+            Account(-1)
+
+    def test_classmethod_and_staticmethod(self):
+        assert Account.with_limit(50).limit == 50
+        assert Account.fee(-100) == 1.
+
+        with pytest.raises(ValueError):
+            Account.with_limit(200)
+
+    def test_property(self):
+        account = Account()
+        account.balance = 5
+        assert account.balance == 5
+
+        with pytest.raises(ValueError):
+            account.balance = -5
+
+    def test_not_decorated_twice(self):
+        assert Account().already_decorated(1) == 2
+        assert not hasattr(Account.unannotated, "__typing_exe__")
+
+    def test_options(self):
+        @execute_annotations_class(compiled=True, level="sampled(0)")
+        class Unchecked:
+            def method(self, a: Assert[lambda a: a > 0], b: Modify[lambda b: b * 2]):
+                return a, b
+
+        assert Unchecked().method(-1, 1) == (-1, 2)
+
+    def test_self_binding(self):
+        @execute_annotations(method=True)
+        def method(self, a: Assert[lambda a, self: a in self]):
+            return a
+
+        assert method([1], 1) == 1
+
+        with pytest.raises(ValueError):
+            method([1], 2)
+
+    def test_validate(self):
+        account = Account(10)
+        assert not hasattr(account.deposit, "map") and not hasattr(Account.deposit, "validate")
+
+        assert texe.validation.validate(account.deposit, 90.).arguments == {"self": account, "amount": 90.}
+        assert not texe.validation.validate(account.deposit, 91.).ok
+        assert texe.validation.validate_record(account.deposit, {"amount": 1}).ok
+        assert texe.validation.validate(Account.deposit, account, 91.).errors[0].parameter == "amount"
+        assert texe.validation.validate_record(Account.with_limit, {"limit": 101}).errors[0].parameter == "limit"
+        assert texe.validation.validate(Account.fee, -1).arguments == {"amount": 1}
+        assert Account.fee.validate(-1).ok
+        assert account.balance == 10
@@ -0,0 +1,94 @@
+import pytest
+
+from typing_exe.decorators import execute_annotations
+from typing_exe.annotations import Assert, Modify, Sequence
+from typing_exe.early_return import EarlyReturn
+
+
+class TestCompiled:
+    def test_basic(self):
+        @execute_annotations(compiled=True)
+        def fct(a: Assert[int, lambda a: a < 5], b, c: Modify[lambda c: c * 2] = 1):
+            return a, b, c
+
+        assert fct(1, 2) == (1, 2, 2)
+        assert fct(1, 2, 3) == (1, 2, 6)
+        assert fct(1, b=2, c=4) == (1, 2, 8)
+        assert fct.__name__ == "fct"
+
+        with pytest.raises(ValueError):
+            fct(5, 2)
+
+    def test_unannotated(self):
+        @execute_annotations(compiled=True)
+        def fct(a, b=2, *, c=3):
+            return a, b, c
+
+        assert fct(1) == (1, 2, 3)
+        assert fct(1, c=4) == (1, 2, 4)
+
+    def test_positional_and_keyword_only(self):
+        @execute_annotations(compiled=True)
+        def fct(
+                a,
+                b=10,
+                c: Modify[lambda c: c + 1] = 20,
+                /,
+                *,
+                d: Assert[lambda d: d > 0] = 1
+        ):
+            return a, b, c, d
+
+        assert fct(1) == (1, 10, 21, 1)
+        assert fct(1, 2) == (1, 2, 21, 1)
+        assert fct(1, 2, 3, d=4) == (1, 2, 4, 4)
+
+        with pytest.raises(ValueError):
+            fct(1, d=0)
+
+    def test_comparison_with_other_parameters(self):
+        @execute_annotations(compiled=True)
+        def fct(a, b: Assert[lambda b, a: b > a] = 1):
+            return a + b
+
+        assert fct(1, 2) == 3
+        assert fct(0) == 1
+        assert fct(a=0, b=2) == 2
+
+        with pytest.raises(ValueError):
+            fct(1, 1)
+
+    def test_keyword_arguments_in_call_order(self):
+        def fct(a: Modify[lambda a, b: a + b * 10], b: Modify[lambda b, a: b + a * 10]):
+            return a, b
+
+        generic, compiled = execute_annotations(fct), execute_annotations(compiled=True)(fct)
+        for kwargs in ({"a": 1, "b": 1}, {"b": 1, "a": 1}):
+            assert compiled(**kwargs) == generic(**kwargs)
+        assert compiled(b=1, a=1) == (111, 11)   # b is modified first
+
+    def test_early_return(self):
+        def hook(p):
+            if p == 0.:
+                return EarlyReturn(0.)
+            return p
+
+        @execute_annotations(compiled=True)
+        def foo(
+                a: Sequence[Modify[hook], Assert[lambda a: a != 0]] = EarlyReturn(-1.)
+        ) -> Modify[lambda r: r * 2]:
+            return a + 1.
+
+        assert foo() == -1.
+        assert foo(0.) == 0.
+        assert foo(1.) == 4.
+
+    def test_return(self):
+        @execute_annotations(compiled=True)
+        def faulty_abs(a: int) -> Assert[lambda r: r >= 0]:
+            return a
+
+        assert faulty_abs(1) == 1
+
+        with pytest.raises(ValueError):
+            faulty_abs(-1)
@@ -0,0 +1,212 @@
+import sys
+from dataclasses import dataclass, field, InitVar, FrozenInstanceError
+
+import pytest
+
+import typing_exe as texe
+from typing_exe.decorators import execute_annotations_dataclass
+from typing_exe.annotations import Assert, Modify, Sequence, Each
+
+
+def is_positive(a):
+    return a > 0
+
+
+def to_float(a):
+    return float(a)
+
+
+@execute_annotations_dataclass
+@dataclass
+class Point:
+    x: Sequence[Modify[to_float], Assert[lambda x: x >= 0]]
+    y: Assert[lambda y, x: y >= x] = 10.
+    tags: list = field(default_factory=list)
+    label: str = field(default="", init=False)
+
+
+class TestInit:
+    def test_valid(self):
+        point = Point(1)
+        assert point == Point(1., 10.)
+        assert isinstance(point.x, float)
+        assert point.tags == [] and point.tags is not Point(1).tags
+        assert point.label == ""
+
+    def test_invalid(self):
+        with pytest.raises(texe.errors.AssertFailed) as error:
+            Point(-1)
+        assert error.value.parameter == "x"
+        assert error.value.function.__qualname__ == "Point.__init__"
+
+        with pytest.raises(ValueError):
+            Point(2, 1)   # y compared with the modified x
+
+    def test_none_is_not_checked(self):
+        @execute_annotations_dataclass
+        @dataclass
+        class Optional:
+            a: Assert[is_positive] = None
+
+        assert Optional().a is None
+
+    @pytest.mark.parametrize("level", ["full", "sampled(0.5, deterministic)"])
+    def test_default_factory(self, level):
+        # The annotations get the value that the factory made, not the placeholder of dataclasses
+        @execute_annotations_dataclass(level=level)
+        @dataclass
+        class WithFactory:
+            items: Sequence[Modify[lambda items: items + [0]], Assert[lambda items: len(items) == 1]] = field(
+                default_factory=list
+            )
+
+        assert WithFactory().items == [0]   # The first call is checked when sampling, too
+        if level == "full":
+            assert WithFactory([]).items == [0]
+            with texe.enforcement.scope(asserts=True):
+                assert WithFactory().items == [0]
+            with pytest.raises(ValueError):
+                WithFactory([1])
+
+    def test_post_init(self):
+        @execute_annotations_dataclass
+        @dataclass
+        class WithPostInit:
+            a: Assert[is_positive]
+            factor: InitVar[int] = 2
+            b: int = field(init=False)
+
+            def __post_init__(self, factor):
+                self.b = self.a * factor
+
+        assert WithPostInit(2, 3).b == 6
+        with pytest.raises(ValueError):
+            WithPostInit(-2)
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slots and kw_only are new in Python 3.10")
+    def test_slots_frozen_kw_only(self):
+        @execute_annotations_dataclass
+        @dataclass(slots=True, frozen=True, kw_only=True)
+        class Frozen:
+            a: Modify[abs]
+            b: Assert[lambda b, a: b > a] = 5
+
+        frozen = Frozen(a=-3)
+        assert (frozen.a, frozen.b) == (3, 5)
+        with pytest.raises(FrozenInstanceError):
+            frozen.a = 1
+        with pytest.raises(ValueError):
+            Frozen(a=6)
+        with pytest.raises(TypeError):
+            Frozen(1)
+
+    def test_not_inlined(self):
+        @execute_annotations_dataclass
+        @dataclass
+        class Fallback:
+            values: Each[Assert[is_positive]]
+            cached: Modify[to_float].pure() = 1
+
+        fallback = Fallback([1, 2], 3)
+        assert fallback.cached == 3.
+        assert list(fallback.values) == [1, 2]
+        with pytest.raises(ValueError):
+            list(Fallback([1, -2]).values)
+
+    def test_check_types(self):
+        @execute_annotations_dataclass(check_types=True)
+        @dataclass
+        class Typed:
+            a: Assert[int, is_positive]
+            b: Modify[str, lambda b: b.strip()] = ""
+
+        assert Typed(1, " b ").b == "b"
+        with pytest.raises(texe.errors.TypehintViolated):
+            Typed(1.5)
+
+    def test_binding_error(self):
+        with pytest.raises(texe.errors.BindingError):
+            @execute_annotations_dataclass
+            @dataclass
+            class Unbound:
+                a: Assert[lambda a, c: a > c]
+
+
+class TestSetattr:
+    def test_validate_assignment(self):
+        @execute_annotations_dataclass(validate_assignment=True)
+        @dataclass
+        class Account:
+            balance: Sequence[Modify[lambda balance: round(balance)], Assert[lambda balance: balance >= 0]]
+            limit: Assert[lambda limit, balance: limit >= balance] = 100
+
+        account = Account(10.4)
+        assert account.balance == 10
+
+        account.balance = 20.6
+        assert account.balance == 21
+        with pytest.raises(ValueError):
+            account.balance = -1
+        with pytest.raises(ValueError):
+            account.limit = 5   # compared with the current balance
+        assert (account.balance, account.limit) == (21, 100)
+
+        account.other = 1   # not a field
+        assert account.other == 1
+
+    def test_frozen(self):
+        with pytest.raises(TypeError):
+            @execute_annotations_dataclass(validate_assignment=True)
+            @dataclass(frozen=True)
+            class Frozen:
+                a: Assert[is_positive]
+
+    def test_not_a_dataclass(self):
+        with pytest.raises(TypeError):
+            @execute_annotations_dataclass
+            class NotADataclass:
+                a: Assert[is_positive]
+
+
+class TestLevels:
+    def test_off(self):
+        @dataclass
+        class Off:
+            a: Assert[is_positive]
+
+        init = Off.__init__
+        assert execute_annotations_dataclass(level="off")(Off).__init__ is init
+
+    def test_sampled(self):
+        @execute_annotations_dataclass(level="sampled(0)", validate_assignment=True)
+        @dataclass
+        class Never:
+            a: Sequence[Modify[abs], Assert[lambda a: a > 10]]
+
+        never = Never(-1)
+        assert never.a == 1
+        never.a = -2
+        assert never.a == 2
+
+        @execute_annotations_dataclass(level=texe.enforcement.sampled(0.5, deterministic=True))
+        @dataclass
+        class Half:
+            a: Assert[is_positive]
+
+        with pytest.raises(ValueError):
+            Half(-1)
+        assert Half(-1).a == -1
+
+    def test_scope(self):
+        with texe.enforcement.scope(asserts=False):
+            assert Point(-1).x == -1.
+        with pytest.raises(ValueError):
+            Point(-1)
+
+    def test_stats(self):
+        texe.reset_stats()
+        with texe.enforcement.scope(collect_stats=True):
+            Point(1)
+            Point(2)
+        assert texe.stats()[f"{Point.__module__}.Point.__init__"].calls == 2
+        texe.reset_stats()
@@ -0,0 +1,164 @@
+import os
+import logging
+import threading
+import multiprocessing
+
+import pytest
+
+import typing_exe as texe
+from typing_exe.decorators import execute_annotations
+from typing_exe.annotations import Assert, Modify, Sequence
+
+
+@pytest.fixture
+def reported():
+    errors = []
+    texe.deferred.reset_stats()
+    texe.deferred.set_callback(errors.append)
+    yield errors
+    assert texe.deferred.flush(timeout=5)
+    texe.deferred.set_callback(None)
+    texe.deferred.set_maxsize(texe.deferred.DEFAULT_MAXSIZE)
+    texe.deferred.reset_stats()
+
+
+def is_positive(a):
+    return a > 0
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+class TestDeferred:
+    def test_reported_not_raised(self, reported, compiled):
+        calls = []
+
+        @execute_annotations(compiled=compiled)
+        def fct(a: Sequence[Modify[abs], Assert[lambda a: a < 10].deferred()], b: Assert[is_positive].deferred()):
+            calls.append((a, b))
+            return a + b
+
+        assert fct(-1, 2) == 3
+        assert fct(-20, -2) == 18   # called right away
+        assert texe.deferred.flush(timeout=5)
+
+        assert calls == [(1, 2), (20, -2)]
+        assert sorted(error.parameter for error in reported) == ["a", "b"]
+        assert all(isinstance(error, texe.errors.AssertFailed) for error in reported)
+        assert {error.value for error in reported} == {20, -2}   # a after the Modify
+        assert texe.deferred.stats()[1:] == (4, 2, 0)
+
+    def test_other_parameters(self, reported, compiled):
+        @execute_annotations(compiled=compiled)
+        def fct(a: Modify[lambda a: a * 2], b: Assert[lambda b, a: b > a].deferred()):
+            return a, b
+
+        assert fct(1, 3) == (2, 3)
+        assert fct(2, 3) == (4, 3)
+        assert texe.deferred.flush(timeout=5)
+        assert [(error.parameter, error.value) for error in reported] == [("b", 3)]
+
+    def test_raising_item(self, reported, compiled):
+        @execute_annotations(compiled=compiled)
+        def fct(a: Assert[lambda a: 1 / a].deferred()):
+            return a
+
+        assert fct(0) == 0
+        assert texe.deferred.flush(timeout=5)
+        assert isinstance(reported[0], ZeroDivisionError)
+
+    def test_scope(self, reported, compiled):
+        @execute_annotations(compiled=compiled)
+        def fct(a: Assert[is_positive].deferred()):
+            return a
+
+        with texe.enforcement.scope(asserts=False):
+            fct(-1)
+        assert texe.deferred.flush(timeout=5)
+        assert reported == []
+
+
+def test_drop_when_full(reported):
+    blocked, release = threading.Event(), threading.Event()
+
+    def block(a):
+        blocked.set()
+        release.wait(5)
+        return True
+
+    @execute_annotations
+    def fct(a: Assert[block].deferred()):
+        return a
+
+    texe.deferred.set_maxsize(2)
+    fct(1)
+    assert blocked.wait(5)   # The worker is busy with the first check
+    for _ in range(5):
+        fct(1)
+    release.set()
+    assert texe.deferred.flush(timeout=5)
+
+    assert texe.deferred.stats() == texe.deferred.DeferredStats(queued=0, checked=3, failed=0, dropped=3)
+
+
+def test_logged_without_callback(caplog):
+    @execute_annotations
+    def fct(a: Assert[is_positive].deferred()):
+        return a
+
+    with caplog.at_level(logging.ERROR, logger="typing_exe"):
+        fct(-1)
+        assert texe.deferred.flush(timeout=5)
+    assert "Deferred check failed" in caplog.text
+
+
+@execute_annotations
+def forked_fct(a: Assert[is_positive].deferred()):
+    return a
+
+
+def check_in_child(results):
+    errors = []
+    texe.deferred.set_callback(errors.append)
+    forked_fct(-1)
+    results.put((texe.deferred.flush(timeout=5), [error.value for error in errors], tuple(texe.deferred.stats())))
+
+
+@pytest.mark.skipif(not hasattr(os, "register_at_fork"), reason="fork is not available")
+def test_fork(reported):
+    blocked, release = threading.Event(), threading.Event()
+
+    def block(a):
+        blocked.set()
+        release.wait(5)
+        return True
+
+    @execute_annotations
+    def fct(a: Assert[block].deferred()):
+        return a
+
+    fct(1)
+    assert blocked.wait(5)   # The worker of the parent is busy and holds a check while forking
+    fct(1)
+
+    context = multiprocessing.get_context("fork")
+    results = context.Queue()
+    process = context.Process(target=check_in_child, args=(results,))
+    process.start()
+    try:
+        assert results.get(timeout=10) == (True, [-1], (0, 1, 1, 0))
+    finally:
+        release.set()
+        process.join(10)
+    assert process.exitcode == 0
+    assert texe.deferred.flush(timeout=5)
+    assert texe.deferred.stats()[1:] == (2, 0, 0)
+
+
+def test_annotation():
+    deferred = Assert[int, is_positive].deferred()
+    assert isinstance(deferred, texe.annotations._Assert)
+    assert texe.util.is_package_annotation(deferred)
+    assert (deferred.typehint, list(deferred.items)) == (int, [is_positive])
+    assert deferred.without_asserts() is None
+
+    with pytest.raises(ValueError):
+        texe.deferred.set_maxsize(0)
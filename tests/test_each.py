@@ -0,0 +1,155 @@
+import asyncio
+import pytest
+
+from typing_exe.decorators import execute_annotations, cleanup_annotations
+from typing_exe.annotations import Assert, Modify, Each
+from typing_exe.early_return import EarlyReturn
+from typing_exe.errors import AssertFailed, TypehintViolated
+
+
+def is_positive(a):
+    return a > 0
+
+
+class TestEachParameter:
+    def test_elements(self):
+        @execute_annotations
+        def fct(a: Each[Assert[is_positive], Modify[lambda a: a * 2]]):
+            return list(a)
+
+        assert fct([1, 2, 3]) == [2, 4, 6]
+        assert fct(x for x in range(1, 4)) == [2, 4, 6]
+
+        with pytest.raises(AssertFailed) as error:
+            fct([1, -2, 3])
+        assert error.value.parameter == "a"
+        assert error.value.value == -2
+
+    def test_lazy(self):
+        consumed = []
+
+        def numbers():
+            for x in range(1, 4):
+                consumed.append(x)
+                yield x
+
+        @execute_annotations
+        def fct(a: Each[Assert[is_positive]]):
+            return a
+
+        iterator = fct(numbers())
+        assert consumed == []
+        assert next(iterator) == 1
+        assert consumed == [1]
+
+    def test_infinite(self):
+        def naturals():
+            x = 1
+            while True:
+                yield x
+                x += 1
+
+        @execute_annotations
+        def fct(a: Each[Assert[is_positive]]):
+            return next(a) + next(a)
+
+        assert fct(naturals()) == 3
+
+    def test_skip(self):
+        @execute_annotations
+        def fct(a: Each[Assert[is_positive], Modify[lambda a: a * 2]].on_error("skip")):
+            return list(a)
+
+        assert fct([1, -2, 3, 0]) == [2, 6]
+
+        with pytest.raises(ValueError):
+            Each[Assert[is_positive]].on_error("ignore")
+
+    def test_other_parameters(self):
+        @execute_annotations
+        def fct(limit, values: Each[Assert[lambda v, limit: v < limit]]):
+            return list(values)
+
+        assert fct(10, [1, 2]) == [1, 2]
+        with pytest.raises(ValueError):
+            fct(2, [1, 2])
+
+    def test_typehint(self):
+        @execute_annotations(check_types=True, level="full")
+        def fct(a: Each[int, Assert[is_positive]]):
+            return list(a)
+
+        assert fct([1, 2]) == [1, 2]
+        with pytest.raises(TypehintViolated):
+            fct([1, "2"])
+
+    def test_early_return_ends_iteration(self):
+        @execute_annotations
+        def fct(a: Each[Modify[lambda a: EarlyReturn(None) if a is None else a]]):
+            return list(a)
+
+        assert fct([1, 2, None, 3]) == [1, 2]
+
+    def test_not_iterable(self):
+        @execute_annotations
+        def fct(a: Each[Assert[is_positive]]):
+            return a
+
+        with pytest.raises(TypeError):
+            fct(1)
+
+    def test_level(self):
+        @execute_annotations(level="sampled(0)")
+        def fct(a: Each[Assert[is_positive], Modify[lambda a: a * 2]], b: Each[Assert[is_positive]]):
+            return list(a), b
+
+        a, b = fct([-1], [-1])
+        assert a == [-2]
+        assert b == [-1]   # No items left, so it isn't wrapped
+
+    def test_cleanup(self):
+        @cleanup_annotations
+        def fct(a: Each[int, Assert[is_positive]]):
+            ...
+
+        assert "a" not in fct.__annotations__
+
+
+class TestEachReturn:
+    def test_generator(self):
+        @execute_annotations
+        def fct(n) -> Each[Assert[is_positive]]:
+            for x in range(n, -1, -1):
+                yield x
+
+        iterator = fct(2)
+        assert next(iterator) == 2
+        assert next(iterator) == 1
+        with pytest.raises(AssertFailed):
+            next(iterator)
+
+    def test_async_generator(self):
+        @execute_annotations
+        async def fct(n) -> Each[Assert[is_positive], Modify[lambda r: r * 10]].on_error("skip"):
+            for x in range(n, -2, -1):
+                yield x
+
+        async def consume():
+            return [x async for x in fct(2)]
+
+        assert asyncio.run(consume()) == [20, 10]
+
+    def test_async_parameter(self):
+        async def numbers():
+            for x in (1, -2):
+                yield x
+
+        async def is_positive_async(a):
+            return a > 0
+
+        @execute_annotations
+        async def fct(a: Each[Assert[is_positive_async]]):
+            return [x async for x in a]
+
+        with pytest.raises(AssertFailed):
+            asyncio.run(fct(numbers()))
@@ -0,0 +1,192 @@
+import pytest
+
+import typing_exe as texe
+from typing_exe.decorators import execute_annotations
+from typing_exe.annotations import Assert, Modify, Sequence
+
+
+def fct(
+        a: Sequence[Assert[lambda a: a > 0], Modify[lambda a: a * 2]],
+        b: Assert[lambda b: b > 0] = 1
+) -> Sequence[Modify[lambda r: r + 1], Assert[lambda r: r > 100]]:
+    return a + b
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+class TestLevels:
+    def test_off(self, compiled):
+        assert execute_annotations(compiled=compiled, level="off")(fct) is fct
+
+    def test_full(self, compiled):
+        checked = execute_annotations(compiled=compiled, level="full")(fct)
+        assert checked(50) == 102
+
+        with pytest.raises(ValueError):
+            checked(1)
+
+    def test_asserts_only(self, compiled):
+        def typed(a: Sequence[int, Assert[lambda a: a != 0]]):
+            return a
+
+        asserts_only = execute_annotations(compiled=compiled, level="asserts-only", check_types=True)(typed)
+        full = execute_annotations(compiled=compiled, level="full", check_types=True)(typed)
+        assert asserts_only(1.5) == 1.5   # The typehint is not checked
+        with pytest.raises(TypeError):
+            full(1.5)
+        for checked in (asserts_only, full):
+            with pytest.raises(ValueError):
+                checked(0)   # The Assert-items are checked on every call, like with "full"
+
+        assert execute_annotations(compiled=compiled, level="asserts-only")(fct)(50) == 102
+        assert not texe.enforcement.checks_types(texe.enforcement.ASSERTS_ONLY, True)
+        assert texe.enforcement.checks_types(texe.enforcement.FULL, True)
+
+    def test_sampled_never(self, compiled):
+        unchecked = execute_annotations(compiled=compiled, level="sampled(0)")(fct)
+        assert unchecked(-1, -1) == -2   # Modify-items still run
+        assert unchecked(1) == 4
+
+    def test_sampled_deterministic(self, compiled):
+        sampled = execute_annotations(compiled=compiled, level=texe.enforcement.sampled(0.5, deterministic=True))(fct)
+
+        with pytest.raises(ValueError):
+            sampled(-1)   # checked
+        assert sampled(-1) == 0   # not checked
+        with pytest.raises(ValueError):
+            sampled(-1)
+
+    @pytest.mark.parametrize("rate", [0.1, 0.34, 0.5, 0.6, 0.75, 0.99, 1.])
+    def test_sampled_deterministic_rate(self, compiled, rate):
+        sample = texe.enforcement.make_sampler(texe.enforcement.sampled(rate, deterministic=True))
+        checked = [sample() for _ in range(1000)]
+        assert checked[0]
+        assert sum(checked) == round(1000 * rate)
+
+
+class TestParseLevel:
+    def test_valid(self):
+        assert texe.enforcement.parse_level("off") == texe.enforcement.OFF
+        assert texe.enforcement.parse_level("asserts-only") == texe.enforcement.ASSERTS_ONLY
+        assert texe.enforcement.parse_level("sampled(0.25)") == texe.enforcement.sampled(0.25)
+        assert texe.enforcement.parse_level("sampled(0.5, deterministic)") \
+            == texe.enforcement.sampled(0.5, deterministic=True)
+
+    def test_invalid(self):
+        for level in ("sometimes", "sampled(2)", "sampled()"):
+            with pytest.raises(ValueError):
+                texe.enforcement.parse_level(level)
+
+    def test_environment(self, monkeypatch):
+        monkeypatch.setenv("TYPING_EXE_LEVEL", "sampled(0.1)")
+        assert texe.enforcement._default_level() == texe.enforcement.sampled(0.1)
+
+        monkeypatch.delenv("TYPING_EXE_LEVEL")
+        assert texe.enforcement._default_level() == texe.enforcement.FULL
+
+    def test_global_level(self):
+        texe.enforcement.set_level("off")
+        try:
+            assert execute_annotations(fct) is fct
+            assert execute_annotations(level="full")(fct) is not fct
+        finally:
+            texe.enforcement.set_level("full")
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+class TestScope:
+    def test_asserts_off(self, compiled):
+        checked = execute_annotations(compiled=compiled, level="full")(fct)
+
+        with texe.enforcement.scope(asserts=False):
+            assert checked(-1, -1) == -2   # Modify-items still run
+            assert list(checked.map([-1, 50])) == [0, 102]
+        with pytest.raises(ValueError):
+            checked(-1, -1)
+
+    def test_asserts_on(self, compiled):
+        unchecked = execute_annotations(compiled=compiled, level="sampled(0)")(fct)
+        assert unchecked(-1, -1) == -2
+
+        with texe.enforcement.scope(asserts=True):
+            with pytest.raises(ValueError):
+                unchecked(-1, -1)
+        assert unchecked(-1, -1) == -2
+
+    def test_nested(self, compiled):
+        checked = execute_annotations(compiled=compiled)(fct)
+
+        with texe.enforcement.scope(asserts=False):
+            with texe.enforcement.scope(collect_stats=True):
+                assert texe.enforcement.current().asserts is False
+                assert checked(-1, -1) == -2
+            with texe.enforcement.scope(asserts=True):
+                with pytest.raises(ValueError):
+                    checked(-1, -1)
+        assert texe.enforcement.current() is texe.enforcement._GLOBAL
+
+    def test_collect_stats(self, compiled):
+        checked = execute_annotations(compiled=compiled)(fct)
+        name = f"{fct.__module__}.{fct.__qualname__}"
+        texe.reset_stats()
+
+        checked(50)
+        with texe.enforcement.scope(collect_stats=True):
+            checked(50)
+            checked(51)
+        assert texe.stats()[name].calls == 2
+
+        texe.profiling.enable()
+        try:
+            with texe.enforcement.scope(collect_stats=False):
+                checked(50)
+            checked(50)
+        finally:
+            texe.profiling.disable()
+        assert texe.stats()[name].calls == 3
+        texe.reset_stats()
+
+    def test_threads(self, compiled):
+        import threading
+
+        checked = execute_annotations(compiled=compiled)(fct)
+        inside, outside = threading.Event(), threading.Event()
+        errors = []
+
+        def call_outside_of_scope():
+            inside.wait()
+            try:
+                checked(-1, -1)
+            except ValueError as error:
+                errors.append(error)
+            outside.set()
+
+        thread = threading.Thread(target=call_outside_of_scope)
+        thread.start()
+        with texe.enforcement.scope(asserts=False):
+            inside.set()
+            outside.wait()
+            assert checked(-1, -1) == -2
+        thread.join()
+        assert len(errors) == 1
+
+    def test_tasks(self, compiled):
+        import asyncio
+
+        @execute_annotations(compiled=compiled)
+        async def afct(a: Assert[lambda a: a > 0]):
+            return a
+
+        async def in_scope():
+            with texe.enforcement.scope(asserts=False):
+                await asyncio.sleep(0)
+                return await afct(-1)
+
+        async def out_of_scope():
+            await asyncio.sleep(0)
+            with pytest.raises(ValueError):
+                await afct(-1)
+
+        async def main():
+            return (await asyncio.gather(in_scope(), out_of_scope()))[0]
+
+        assert asyncio.run(main()) == -1
@@ -0,0 +1,131 @@
+import asyncio
+import pickle
+import pytest
+
+from typing_exe.decorators import execute_annotations
+from typing_exe.annotations import Assert, Modify, Sequence
+from typing_exe.early_return import EarlyReturn
+from typing_exe.errors import AssertFailed, BindingError, TypehintViolated, ValidationError, ValidationErrors
+
+
+def is_positive(a):
+    return a > 0
+
+
+class TestErrors:
+    def test_assert_failed(self):
+        @execute_annotations
+        def fct(a: Assert[is_positive]):
+            return a
+
+        with pytest.raises(AssertFailed) as error:
+            fct(-1)
+
+        assert isinstance(error.value, ValueError)
+        assert error.value.function.__qualname__ == fct.__qualname__
+        assert error.value.parameter == "a"
+        assert error.value.item is is_positive
+        assert error.value.value == -1
+        assert "Assert failed!" in str(error.value)
+        assert "- Name: is_positive" in str(error.value)
+
+    def test_typehint_violated(self):
+        @execute_annotations(check_types=True, level="full")
+        def fct(a: Assert[int, is_positive]):
+            return a
+
+        with pytest.raises(TypehintViolated) as error:
+            fct("1")
+
+        assert isinstance(error.value, TypeError)
+        assert error.value.parameter == "a"
+        assert error.value.typehint is int
+        assert error.value.value == "1"
+        assert "Typehint violated!" in str(error.value)
+
+    def test_binding_error(self):
+        with pytest.raises(BindingError) as error:
+            @execute_annotations
+            def fct(a: Assert[lambda a, c: a > c]):
+                return a
+
+        assert isinstance(error.value, ValueError)
+        assert error.value.name == "c"
+        assert "non-existent name" in str(error.value)
+
+    def test_pickle(self):
+        error = pickle.loads(pickle.dumps(AssertFailed(None, "a", None, -1)))
+        assert (error.parameter, error.value) == ("a", -1)
+
+
+class TestCollectAll:
+    def test_collects_every_parameter(self):
+        @execute_annotations(collect_all=True)
+        def fct(
+                a: Assert[is_positive],
+                b: Modify[lambda b: b * 2],
+                c: Sequence[Assert[is_positive], Modify[lambda c: c + 1]],
+                d: Assert[lambda d, b: d < b] = 0
+        ):
+            return a + b + c + d
+
+        assert fct(1, 1, 1) == 5
+
+        with pytest.raises(ValidationErrors) as error:
+            fct(-1, 1, -1, d=5)
+
+        assert [e.parameter for e in error.value.errors] == ["a", "c", "d"]
+        assert all(isinstance(e, AssertFailed) for e in error.value.errors)
+        assert str(error.value).count("Assert failed!") == 3
+
+        with pytest.raises(ValidationErrors) as error:
+            fct(-1, 1, 1)
+        assert len(error.value.errors) == 1
+
+    def test_compiled(self):
+        @execute_annotations(collect_all=True, compiled=True)
+        def fct(a: Assert[is_positive], *, b: Assert[is_positive]):
+            return a + b
+
+        assert fct(1, b=2) == 3
+
+        with pytest.raises(ValidationErrors) as error:
+            fct(-1, b=-2)
+        assert len(error.value.errors) == 2
+
+    def test_early_return_does_not_hide_errors(self):
+        @execute_annotations(collect_all=True)
+        def fct(a: Assert[is_positive], b: Modify[lambda b: EarlyReturn(b)]):
+            return a
+
+        assert fct(1, 2) == 2
+
+        with pytest.raises(ValidationErrors):
+            fct(-1, 2)
+
+    def test_nested_calls_raise_as_usual(self):
+        @execute_annotations
+        def inner(a: Assert[is_positive]):
+            return a
+
+        @execute_annotations(collect_all=True)
+        def outer(a: Assert[lambda a: a != 0]):
+            try:
+                inner(a)
+            except AssertFailed:
+                return "inner failed"
+            return a
+
+        assert outer(-1) == "inner failed"
+
+    def test_async(self):
+        @execute_annotations(collect_all=True)
+        async def fct(a: Assert[is_positive], b: Assert[is_positive]):
+            return a + b
+
+        assert asyncio.run(fct(1, 2)) == 3
+
+        with pytest.raises(ValidationErrors) as error:
+            asyncio.run(fct(-1, -2))
+        assert len(error.value.errors) == 2
+        assert isinstance(error.value, ValidationError)
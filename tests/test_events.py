@@ -0,0 +1,169 @@
+import threading
+import urllib.request
+from http.server import HTTPServer
+
+import pytest
+
+import typing_exe as texe
+from typing_exe.decorators import execute_annotations
+from typing_exe.annotations import Assert, Modify, Sequence
+from typing_exe.early_return import EarlyReturn
+
+
+@pytest.fixture
+def recorded():
+    recorded_events = []
+    texe.events.subscribe(recorded_events.append)
+    yield recorded_events
+    texe.events.unsubscribe(recorded_events.append)
+
+
+def hook(a):
+    return EarlyReturn(0) if a == 0 else a
+
+
+def is_positive(a):
+    return a > 0
+
+
+def kinds(recorded_events):
+    return [(event.kind, event.parameter) for event in recorded_events]
+
+
+class TestEvents:
+    @pytest.mark.parametrize("compiled", [False, True])
+    def test_kinds(self, recorded, compiled):
+        @execute_annotations(compiled=compiled, check_types=True)
+        def fct(
+                a: Sequence[Modify[hook], Assert[is_positive]], b: Assert[int] = EarlyReturn(-1)
+        ) -> Assert[is_positive]:
+            return a + b
+
+        assert fct(1, 2) == 3
+        assert kinds(recorded) == [("modify_applied", "a"), ("call", None)]
+        assert recorded[0].value == 1
+        assert recorded[1].duration > 0. and not recorded[1].failed
+
+        recorded.clear()
+        assert fct(0, 2) == 0
+        assert kinds(recorded) == [("early_return", "a"), ("call", None)]
+        assert recorded[0].value == 0
+
+        recorded.clear()
+        assert fct(1) == -1
+        assert ("early_return", None) in kinds(recorded)
+
+        recorded.clear()
+        with pytest.raises(texe.errors.AssertFailed):
+            fct(-1, 2)
+        assert kinds(recorded) == [("modify_applied", "a"), ("assert_failed", "a"), ("call", None)]
+        assert recorded[1].item is is_positive
+        assert recorded[1].value == -1
+        assert recorded[2].failed
+
+        recorded.clear()
+        with pytest.raises(texe.errors.TypehintViolated):
+            fct(1, 2.)
+        assert ("typehint_violated", "b") in kinds(recorded)
+
+        recorded.clear()
+        with pytest.raises(texe.errors.AssertFailed):
+            fct(1, -5)
+        assert ("return_rejected", "return") in kinds(recorded)
+
+    def test_filter_kinds(self):
+        failures = []
+        texe.events.subscribe(failures.append, kinds=texe.events.ASSERT_FAILED)
+        try:
+            @execute_annotations
+            def fct(a: Assert[is_positive]):
+                return a
+
+            fct(1)
+            with pytest.raises(ValueError):
+                fct(-1)
+        finally:
+            texe.events.unsubscribe(failures.append)
+
+        assert kinds(failures) == [("assert_failed", "a")]
+
+    def test_unknown_kind(self):
+        with pytest.raises(ValueError):
+            texe.events.subscribe(print, kinds="unknown")
+
+    def test_unsubscribe(self):
+        recorded_events = []
+
+        @execute_annotations
+        def fct(a: Modify[abs]):
+            return a
+
+        texe.events.subscribe(recorded_events.append)
+        assert texe.profiling.instrumented
+        texe.events.unsubscribe(recorded_events.append)
+        assert not texe.events.enabled
+        assert not texe.profiling.instrumented
+
+        fct(-1)
+        assert recorded_events == []
+
+
+class TestPrometheusAggregator:
+    @staticmethod
+    def run_functions():
+        @execute_annotations
+        def fct(a: Assert[is_positive]):
+            return a
+
+        fct(1)
+        fct(2)
+        with pytest.raises(ValueError):
+            fct(-1)
+        return f"{fct.__module__}.{fct.__qualname__}"
+
+    def test_render(self):
+        with texe.metrics.PrometheusAggregator(buckets=(1., 10.)) as aggregator:
+            name = self.run_functions()
+        self.run_functions()   # Not recorded anymore
+
+        text = aggregator.render()
+        assert "# TYPE typing_exe_calls_total counter" in text
+        assert f'typing_exe_calls_total{{function="{name}"}} 3' in text
+        assert f'typing_exe_call_failures_total{{function="{name}"}} 1' in text
+        assert f'typing_exe_events_total{{function="{name}",parameter="a",kind="assert_failed"}} 1' in text
+        assert "# TYPE typing_exe_call_duration_seconds histogram" in text
+        assert f'typing_exe_call_duration_seconds_bucket{{function="{name}",le="1.0"}} 3' in text
+        assert f'typing_exe_call_duration_seconds_bucket{{function="{name}",le="+Inf"}} 3' in text
+        assert f'typing_exe_call_duration_seconds_count{{function="{name}"}} 3' in text
+
+        aggregator.reset()
+        assert "typing_exe_calls_total{" not in aggregator.render()
+
+    def test_write(self, tmp_path):
+        with texe.metrics.PrometheusAggregator() as aggregator:
+            name = self.run_functions()
+
+        path = tmp_path / "metrics.prom"
+        aggregator.write(str(path))
+        assert f'typing_exe_calls_total{{function="{name}"}} 3' in path.read_text()
+        assert [file.name for file in tmp_path.iterdir()] == ["metrics.prom"]
+
+    def test_handler(self):
+        with texe.metrics.PrometheusAggregator() as aggregator:
+            name = self.run_functions()
+
+        server = HTTPServer(("127.0.0.1", 0), aggregator.make_handler())
+        thread = threading.Thread(target=server.handle_request)
+        thread.start()
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{server.server_port}/metrics") as response:
+                assert response.headers["Content-Type"].startswith("text/plain")
+                text = response.read().decode()
+        finally:
+            thread.join()
+            server.server_close()
+
+        assert f'typing_exe_calls_total{{function="{name}"}} 3' in text
+
+    def test_escape(self):
+        assert texe.metrics._escape('a"b\\c\nd') == 'a\\"b\\\\c\\nd'
@@ -107,12 +107,44 @@ class TestAssert:
             fct(1, 1)
 
     def test_comparison_with_other_parameters_false_names(self):
+        with pytest.raises(ValueError):   # raised at decoration
+            @execute_annotations
+            def fct(a, b: Assert[lambda b, notmyname: b > notmyname]):
+                return a + b
+
+    def test_comparison_with_keyword_only_and_var_keyword(self):
         @execute_annotations
-        def fct(a, b: Assert[lambda b, notmyname: b > notmyname]):
+        def fct(a: Assert[lambda a, b, c: a < b < c], /, *, b=2, **kwargs):
+            return a
+
+        assert fct(1, c=3) == 1
+
+        with pytest.raises(ValueError):
+            fct(1, b=5, c=3)
+
+        with pytest.raises(ValueError):   # c is only resolvable through **kwargs
+            fct(1)
+
+    def test_item_defaults_are_bound(self):
+        @execute_annotations
+        def fct(a, b: Assert[lambda b, a=0: b > a]):
             return a + b
 
+        assert fct(1, 2) == 3
         with pytest.raises(ValueError):
-            fct(1, 2)
+            fct(10, 5)   # a is taken from the arguments, not from the default of the item
+
+        with pytest.raises(ValueError):   # raised at decoration
+            @execute_annotations
+            def other(a: Assert[lambda a, *, high=10: a < high]):
+                return a
+
+    def test_builtin_item_defaults_not_bound(self):
+        @execute_annotations
+        def fct(a: Modify[round], ndigits=2):
+            return a
+
+        assert fct(1.26) == 1   # round is called without ndigits, like out and where of numpy's ufuncs
 
 
 class TestModify:
@@ -149,12 +181,10 @@ class TestModify:
         assert fct(a=3, b=1) == (3, 4)
 
     def test_comparison_with_other_parameters_false_names(self):
-        @execute_annotations
-        def fct(a, b: Modify[lambda b, notmyname: b + notmyname]):
-            return a, b
-
-        with pytest.raises(ValueError):
-            fct(1, 2)
+        with pytest.raises(ValueError):   # raised at decoration
+            @execute_annotations
+            def fct(a, b: Modify[lambda b, notmyname: b + notmyname]):
+                return a, b
 
 
 class TestSequence:
@@ -0,0 +1,63 @@
+import os
+import sys
+import asyncio
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+
+import typing_exe as texe
+from typing_exe.decorators import execute_annotations
+from typing_exe.annotations import Assert, Modify
+
+
+class TestLazy:
+    def test_built_on_first_call(self, monkeypatch):
+        built = []
+        get_data = texe.decorators._get_data
+        monkeypatch.setattr(texe.decorators, "_get_data", lambda fct, *args: built.append(fct) or get_data(fct, *args))
+
+        @execute_annotations(lazy=True)
+        def fct(a: Assert[lambda a: a > 0], b: Modify[lambda b: b * 2] = 1):
+            return a + b
+
+        assert built == []
+
+        with ThreadPoolExecutor(max_workers=30) as executor:
+            results = list(executor.map(fct, range(1, 31)))
+
+        assert results == [i + 2 for i in range(1, 31)]
+        assert len(built) == 1
+        assert list(fct.map([1, 2])) == [3, 4]
+
+        with pytest.raises(ValueError):
+            fct(0)
+
+    def test_errors_on_first_call(self):
+        @execute_annotations(lazy=True)
+        def fct(a, b: Assert[lambda b, notmyname: b > notmyname]):
+            return a + b
+
+        with pytest.raises(ValueError):
+            fct(1, 2)
+
+    def test_async(self):
+        @execute_annotations(lazy=True)
+        async def fct(a: Modify[lambda a: a + 1]):
+            return a
+
+        assert asyncio.iscoroutinefunction(fct)
+        assert asyncio.run(fct(1)) == 2
+
+
+def test_signatures_are_cached():
+    def check(a):
+        return a > 0
+
+    assert Assert[check].items[check] is Modify[check].items[check]
+    assert Assert[len].items[len] is not None   # builtins can't be weakly referenced
+
+
+def test_submodules_are_imported_lazily():
+    code = "import sys, typing_exe; assert 'typing_exe.codegen' not in sys.modules; typing_exe.codegen"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)
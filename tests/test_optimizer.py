@@ -0,0 +1,113 @@
+import pytest
+
+import typing_exe as texe
+from typing_exe.decorators import execute_annotations
+from typing_exe.annotations import Assert, Modify, Sequence, Each
+from typing_exe.optimizer import Optimization, optimize
+
+
+calls = []
+
+
+def is_positive(a):
+    calls.append("is_positive")
+    return a > 0
+
+
+def is_small(a):
+    return a < 100
+
+
+def double(a):
+    return a * 2
+
+
+POSITIVE = Sequence[Assert[is_positive]]
+DOUBLED = Sequence[Modify[double], Assert[is_positive]]
+
+
+class TestOptimize:
+    def test_flatten_and_merge(self):
+        annotation = Sequence[POSITIVE, Assert[is_small], DOUBLED, Modify[double]]
+        report = []
+        optimized = optimize(annotation, "a", report)
+
+        assert [type(item) for item in optimized.items] == [
+            texe.annotations._Assert, texe.annotations._Modify, texe.annotations._Assert, texe.annotations._Modify
+        ]
+        assert list(optimized.items[0].items) == [is_positive, is_small]
+        assert Optimization("a", "Flattened a nested Sequence with 1 items") in report
+        assert Optimization("a", "Merged adjacent Asserts") in report
+
+    def test_remove_duplicates(self):
+        annotation = Sequence[Assert[is_positive], POSITIVE, Assert[is_small, is_positive]]
+        report = []
+        optimized = optimize(annotation, "a", report)
+
+        assert len(optimized.items) == 1
+        assert list(optimized.items[0].items) == [is_positive, is_small]
+        assert report.count(Optimization("a", "Removed duplicate Assert-item is_positive")) == 2
+
+    def test_modifies_keep_duplicates(self):
+        optimized = optimize(Sequence[Modify[double], Modify[double]], "a")
+        assert len(optimized.items) == 1
+        assert len(optimized.items[0].items) == 2
+
+    def test_keeps_what_cannot_be_merged(self):
+        typed = Sequence[int, Assert[is_positive]]
+        pure = Sequence[Assert[is_positive]].pure()
+        annotation = Sequence[typed, pure, Assert[int, is_small], Modify[int, double], Modify[double]]
+        optimized = optimize(annotation, "a")
+
+        assert optimized.items == annotation.items
+
+    def test_nothing_to_do(self):
+        annotation = Sequence[Assert[is_positive], Modify[double]]
+        report = []
+        assert optimize(annotation, "a", report) is annotation
+        assert report == []
+
+        assert optimize(Assert[is_positive], "a") is Assert[is_positive]
+
+    def test_each(self):
+        optimized = optimize(Each[Assert[is_positive], Assert[is_small]], "a")
+        assert len(optimized.items) == 1
+
+
+class TestDecorated:
+    def test_duplicates_run_once(self):
+        @execute_annotations
+        def fct(a: Sequence[POSITIVE, Assert[is_positive], DOUBLED]):
+            return a
+
+        calls.clear()
+        assert fct(1) == 2
+        assert calls == ["is_positive", "is_positive"]   # Once before and once after double
+
+        with pytest.raises(ValueError):
+            fct(-1)
+
+    def test_nested_pure(self):
+        annotation = Sequence[Modify[double]].pure()
+
+        @execute_annotations
+        def fct(a: Sequence[annotation, Assert[is_positive]]):
+            return a
+
+        assert fct(1) == fct(1) == 2
+        assert annotation.cache_info().hits == 1
+
+    def test_asserts_only(self):
+        @execute_annotations(level="sampled(0)")
+        def fct(a: Sequence[Sequence[int, Modify[double], Assert[is_positive]], Assert[is_small]]):
+            return a
+
+        assert fct(-100) == -200
+
+    def test_report(self):
+        def fct(a: Sequence[POSITIVE, Assert[is_small]], b: Assert[is_positive]) -> Sequence[DOUBLED]:
+            ...
+
+        report = texe.optimizer.report(execute_annotations(fct))
+        assert {optimization.parameter for optimization in report} == {"a", "return"}
+        assert texe.optimizer.report(fct) == report
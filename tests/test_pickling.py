@@ -0,0 +1,109 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+import typing_exe as texe
+from typing_exe.decorators import execute_annotations, execute_annotations_class
+from typing_exe.annotations import Assert, Modify, Sequence, Each
+
+
+def is_positive(a):
+    return a > 0
+
+
+@execute_annotations
+def double(a: Sequence[Modify[lambda a: a * 2], Assert[lambda a: a < 100]], b: Assert[is_positive] = 1):
+    return a + b
+
+
+@execute_annotations(compiled=True, collect_all=True)
+def collected(a: Assert[lambda a: a > 0], b: Each[Assert[lambda b: b != 0]].on_error("skip")):
+    return a, list(b)
+
+
+@execute_annotations(process_pool=True)
+def pooled(a: Assert[lambda a: a > 0], b: Assert[lambda b, a: b > a]):
+    return a + b
+
+
+@execute_annotations_class
+class Account:
+    def deposit(self, amount: Assert[lambda amount: amount > 0]):
+        return amount
+
+    @staticmethod
+    def check(amount: Modify[lambda amount: abs(amount)]):
+        return amount
+
+
+def roundtrip(obj):
+    return pickle.loads(pickle.dumps(obj))
+
+
+class TestPickle:
+    def test_functions(self):
+        assert roundtrip(double) is double
+        assert roundtrip(Account.deposit) is Account.deposit
+        assert roundtrip(texe.pickling.reference(double.__wrapped__)) is double.__wrapped__
+
+    def test_annotations(self):
+        annotation = double.__wrapped__.__annotations__["a"]
+        unpickled = roundtrip(annotation)
+        assert type(unpickled) is type(annotation)
+        assert [list(item.items) for item in unpickled.items] == [list(item.items) for item in annotation.items]
+
+        annotation = collected.__wrapped__.__annotations__["b"]
+        each = roundtrip(annotation)
+        assert each.skip and list(each.items[0].items) == list(annotation.items[0].items)
+
+        assert roundtrip(Account.check.__annotations__["amount"]).items == Account.check.__annotations__["amount"].items
+
+    def test_checker_and_cache(self):
+        annotation = Assert[int, is_positive].with_typechecks()
+        unpickled = roundtrip(annotation)
+        assert unpickled.checker is not None and unpickled.checker(1) and not unpickled.checker(1.5)
+
+        cached = Modify[abs].pure(maxsize=3)
+        cached.cache.store(1, 1)
+        assert roundtrip(cached).cache.info() == texe.cache.CacheInfo(0, 0, 3, 0)
+
+    def test_errors(self):
+        with pytest.raises(texe.errors.AssertFailed) as error:
+            double(60)
+        unpickled = roundtrip(error.value)
+        assert (unpickled.parameter, unpickled.value) == ("a", 120)
+        assert unpickled.function is double.__wrapped__
+        assert unpickled.item is double.__wrapped__.__annotations__["a"].items[1].items.calls[0][0]
+        assert str(unpickled) == str(error.value)
+
+        with pytest.raises(texe.errors.ValidationErrors) as errors:
+            collected(-1, [])
+        assert [error.function for error in roundtrip(errors.value).errors] == [collected.__wrapped__]
+
+    def test_reference(self):
+        lambda_item = Account.deposit.__wrapped__.__annotations__["amount"].items.calls[0][0]
+        reference = texe.pickling.reference(lambda_item)
+        assert reference(1) and not reference(-1)
+        assert roundtrip(reference) is lambda_item
+        assert texe.pickling.reference(is_positive) is is_positive
+        assert texe.pickling.locate(is_positive) is None
+
+    def test_not_found(self):
+        local = lambda a: a > 0   # noqa: E731
+        assert texe.pickling.locate(local) is None
+        with pytest.raises((pickle.PicklingError, AttributeError)):
+            pickle.dumps(Assert[local])
+
+
+def test_process_pool():
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        assert list(executor.map(double, [1, 2], [1, 1])) == [3, 5]
+        assert list(executor.map(Account.check, [-1])) == [1]
+        with pytest.raises(texe.errors.AssertFailed) as error:
+            list(executor.map(double, [1, 60]))
+        assert error.value.function is double.__wrapped__
+
+        assert pooled(1, 2) == 3
+        with pytest.raises(texe.errors.AssertFailed):
+            pooled(1, 0)
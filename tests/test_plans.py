@@ -0,0 +1,122 @@
+import os
+import sys
+import importlib
+
+import pytest
+
+import typing_exe as texe
+import typing_exe.__main__
+
+
+SOURCE = '''
+from typing_exe.annotations import Assert, Modify, Sequence
+from typing_exe.decorators import execute_annotations
+from typing_exe.early_return import EarlyReturn
+
+
+def is_positive(a):
+    return a > 0
+
+
+def is_small(a):
+    return a < 100
+
+
+@execute_annotations(compiled=True)
+def compiled_fct(a: Sequence[Assert[is_positive], Assert[is_small]], b: Modify[abs] = EarlyReturn(0)) -> Assert[int]:
+    return a + b
+
+
+@execute_annotations(lazy=True)
+def lazy_fct(a: Assert[is_positive]):
+    return a
+'''
+
+
+@pytest.fixture
+def module(tmp_path, monkeypatch):
+    name = f"precompiled_{os.getpid()}_{id(tmp_path)}"
+    source = tmp_path / f"{name}.py"
+    source.write_text(SOURCE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(texe.plans, "_codes", {})
+    monkeypatch.setattr(texe.plans, "_loaded", set())
+    yield name, source
+    sys.modules.pop(name, None)
+
+
+def reimport(name):
+    # Like a new process: nothing compiled and no cache-file loaded yet
+    sys.modules.pop(name, None)
+    texe.plans._codes.clear()
+    texe.plans._loaded.clear()
+    texe.codegen._compile_source.cache_clear()
+    return importlib.import_module(name)
+
+
+class TestPrecompile:
+    def test_precompile(self, module):
+        name, source = module
+        precompiled, = texe.plans.precompile(name)
+
+        assert precompiled.cache == texe.plans.cache_path(str(source))
+        assert os.path.dirname(precompiled.cache) == str(source.parent / "__pycache__")
+        assert precompiled.cache.endswith(f".typing_exe-{texe.plans.FORMAT}.plans")
+        assert precompiled.codes == 1
+        assert [fct.__name__ for fct, *_ in precompiled.functions] == ["compiled_fct", "lazy_fct"]
+
+        reimported = reimport(name)
+        assert texe.codegen._compile_source.cache_info().misses == 0
+        assert reimported.compiled_fct(1, -2) == 3
+        assert reimported.compiled_fct(1) == 0
+        with pytest.raises(ValueError):
+            reimported.compiled_fct(-1, 2)
+
+    def test_changed_source(self, module):
+        name, source = module
+        texe.plans.precompile(name)
+        source.write_text(SOURCE + "\n# changed\n")
+
+        reimport(name)
+        assert texe.codegen._compile_source.cache_info().misses == 1
+
+    def test_broken_cache(self, module):
+        name, source = module
+        precompiled, = texe.plans.precompile(name)
+        with open(precompiled.cache, "wb") as file:
+            file.write(b"broken")
+
+        assert not texe.plans.load(str(source))
+        assert reimport(name).compiled_fct(1, 2) == 3
+
+    def test_report(self, module):
+        name, _ = module
+        report = texe.plans.format_report(texe.plans.precompile(name))
+
+        assert "(1 compiled wrappers)" in report
+        assert "compiled_fct (line 15): compiled wrapper" in report
+        assert "a: Sequence[Assert[is_positive, is_small]]" in report
+        assert "b: Modify[abs]" in report
+        assert "b = EarlyReturn(0)" in report
+        assert "return: Assert[int]" in report
+        assert "optimized a: Merged adjacent Asserts" in report
+        assert "lazy_fct (line 20): generic wrapper" in report
+
+    def test_main(self, module, capsys):
+        name, _ = module
+        assert typing_exe.__main__.main(["precompile", name]) == 0
+        assert "compiled_fct" in capsys.readouterr().out
+
+        assert typing_exe.__main__.main(["precompile", "--quiet", name]) == 0
+        assert capsys.readouterr().out == ""
+
+        assert typing_exe.__main__.main(["precompile", "module_that_does_not_exist"]) == 1
+        assert "module_that_does_not_exist" in capsys.readouterr().err
+
+
+def test_describe():
+    from typing_exe.annotations import Assert, Each, Modify, Sequence
+
+    annotation = Sequence[int, Modify[abs], Assert[callable]]
+    assert texe.plans.describe(annotation) == "Sequence[int, Modify[abs], Assert[callable]]"
+    assert texe.plans.describe(Each[Assert[abs]].on_error("skip")) == "Each[Assert[abs]] (skip=True)"
@@ -0,0 +1,185 @@
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import pytest
+
+import typing_exe as texe
+from typing_exe.decorators import execute_annotations
+from typing_exe.annotations import Assert, Modify, Sequence
+
+
+def is_positive(a):
+    return a > 0
+
+
+def is_smaller(b, a):
+    return b < a
+
+
+def is_smaller_than_b(a, b):
+    return a < b
+
+
+def times_ten(b):
+    return b * 10
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        yield executor
+
+
+class TestProcessPool:
+    def test_function_option(self, pool):
+        @execute_annotations(process_pool=pool)
+        def fct(
+                a: Modify[lambda a: a * 10],
+                b: Assert[is_positive, is_smaller],
+                c: Assert[is_positive] = 1,
+                d: Assert[is_positive] = 1
+        ):
+            return a + b + c + d
+
+        assert fct(1, 2) == 14   # is_smaller sees the modified value of a
+
+        with pytest.raises(ValueError) as error:
+            fct(1, 2, c=-1, d=-1)
+        assert str(error.value).count("Assert failed!") == 2   # failures of all parameters are collected
+        assert "- Name: is_positive" in str(error.value)
+
+        with pytest.raises(ValueError):
+            fct(1, 20)   # b depends on a, so it is checked as usual
+
+    def test_marked_items(self, pool):
+        texe.pools.set_process_pool(pool)
+        try:
+            @execute_annotations(compiled=True)
+            def fct(a: Assert[is_positive].in_process_pool(), b: Assert[lambda b: b != 0]):
+                return a / b
+
+            assert fct(1, 2) == .5
+
+            with pytest.raises(ValueError):
+                fct(-1, 2)
+
+            with pytest.raises(ValueError):
+                fct(1, 0)
+        finally:
+            texe.pools.set_process_pool(None)
+
+    def test_same_results_as_without_pool(self, pool):
+        # a is checked before b is modified, so it must not be sent to the pool, which runs after all Modifies
+        def fct(a: Assert[is_smaller_than_b], b: Modify[times_ten], c: Assert[is_positive] = 1):
+            return a + b + c
+
+        plain, pooled = execute_annotations(fct), execute_annotations(process_pool=pool)(fct)
+        assert [pname for pname, *_ in texe.pools.get_pooled_asserts(texe.decorators._get_data(fct), True)] == ["c"]
+        for args in ((1, 2), (5, 1), (0, 1, -1)):
+            results = []
+            for decorated in (plain, pooled):
+                try:
+                    results.append(decorated(*args))
+                except ValueError as error:
+                    results.append(type(error))
+            assert results[0] == results[1]
+        with pytest.raises(ValueError):
+            pooled(5, 1)
+
+    def test_async(self, pool):
+        @execute_annotations(process_pool=pool)
+        async def fct(a: Assert[is_positive], b: Assert[is_positive]):
+            return a + b
+
+        assert asyncio.run(fct(1, 2)) == 3
+
+        with pytest.raises(ValueError):
+            asyncio.run(fct(1, -2))
+
+    def test_false(self):
+        @execute_annotations(process_pool=False)
+        def fct(a: Assert[is_positive], b: Assert[is_positive]):
+            return a + b
+
+        assert fct(1, 2) == 3
+        with pytest.raises(ValueError):
+            fct(1, -2)
+
+
+class TestThreadPool:
+    def test_independent_asserts_overlap(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def waits(x):
+            barrier.wait()   # Only passes if both Asserts run at the same time
+            return x > 0
+
+        @execute_annotations(thread_pool=ThreadPoolExecutor(max_workers=2))
+        def fct(a: Assert[waits], b: Assert[waits]):
+            return a + b
+
+        assert fct(1, 2) == 3
+
+        with pytest.raises(ValueError) as error:
+            fct(-1, -2)
+        assert str(error.value).count("Assert failed!") == 2
+
+    def test_dependency_view(self):
+        def fct(
+                a: Modify[lambda a: a * 10],
+                b: Assert[lambda b, a: b < a],
+                c: Assert[is_positive],
+                d: Assert[lambda d, c: d != c],
+                e: Sequence[Assert[is_positive]]
+        ):
+            ...
+
+        pdata = texe.decorators._get_data(fct)
+        independent = texe.pools.get_independent_asserts(pdata)
+        assert [pname for pname, *_ in independent] == ["c", "d"]
+
+    def test_dependent_asserts_see_modified_values(self):
+        @execute_annotations(thread_pool=True, compiled=True)
+        def fct(
+                a: Modify[lambda a: a * 10],
+                b: Assert[lambda b, a: b < a],
+                c: Assert[is_positive],
+                d: Assert[lambda d, c: d != c] = 0
+        ):
+            return a + b + c + d
+
+        assert fct(1, 5, 1) == 16
+
+        with pytest.raises(ValueError):
+            fct(1, 5, 1, d=1)
+
+        with pytest.raises(ValueError):
+            fct(1, 50, 1)
+
+    def test_shared_pool(self):
+        executor = ThreadPoolExecutor(max_workers=2)
+        texe.pools.set_thread_pool(executor)
+        try:
+            assert texe.pools.get_thread_pool() is executor
+        finally:
+            texe.pools.set_thread_pool(None)
+            executor.shutdown()
+
+    def test_async(self):
+        @execute_annotations(thread_pool=True)
+        async def fct(a: Assert[is_positive], b: Assert[is_positive]):
+            return a + b
+
+        assert asyncio.run(fct(1, 2)) == 3
+
+        with pytest.raises(ValueError):
+            asyncio.run(fct(1, -2))
+
+    def test_false(self):
+        @execute_annotations(thread_pool=False)
+        def fct(a: Assert[is_positive], b: Assert[is_positive]):
+            return a + b
+
+        assert fct(1, 2) == 3
+        with pytest.raises(ValueError):
+            fct(1, -2)
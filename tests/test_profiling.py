@@ -0,0 +1,74 @@
+import pytest
+
+import typing_exe as texe
+from typing_exe.decorators import execute_annotations
+from typing_exe.annotations import Assert, Modify, Sequence
+from typing_exe.early_return import EarlyReturn
+
+
+@pytest.fixture
+def profiling():
+    texe.reset_stats()
+    texe.profiling.enable()
+    yield
+    texe.profiling.disable()
+    texe.reset_stats()
+
+
+def hook(a):
+    return EarlyReturn(0) if a == 0 else a
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_stats(profiling, compiled):
+    @execute_annotations(compiled=compiled)
+    def fct(
+            a: Sequence[Modify[hook], Assert[lambda a: a > 0], Assert[lambda a: a < 10]],
+            b: Assert[lambda b, a: b != a] = EarlyReturn(-1)
+    ):
+        return a + b
+
+    assert fct(1, 2) == 3
+    assert fct(0, 2) == 0
+    assert fct(1) == -1
+    with pytest.raises(ValueError):
+        fct(11, 2)
+
+    function_stats = texe.stats()[f"{fct.__module__}.{fct.__qualname__}"]
+    assert (function_stats.calls, function_stats.failures, function_stats.early_returns) == (4, 1, 2)
+    assert function_stats.time > 0.
+
+    assert len(function_stats.items) == 4
+
+    modify, = [item for item in function_stats.items if item.context == "Modify"]
+    assert modify.name.startswith("hook (line ")
+    assert (modify.calls, modify.failures, modify.early_returns) == (3, 0, 1)
+
+    a_asserts = [item for item in function_stats.items if item.parameter == "a" and item.context == "Assert"]
+    assert sorted((item.calls, item.failures) for item in a_asserts) == [(2, 0), (2, 1)]
+
+    b_assert, = [item for item in function_stats.items if item.parameter == "b"]
+    assert (b_assert.calls, b_assert.failures) == (1, 0)
+
+    texe.reset_stats()
+    assert texe.stats() == {}
+
+
+def test_disabled():
+    texe.reset_stats()
+
+    @execute_annotations
+    def fct(a: Assert[lambda a: a > 0]):
+        return a
+
+    fct(1)
+    assert texe.stats() == {}
+
+
+def test_map(profiling):
+    @execute_annotations
+    def fct(a: Assert[lambda a: a > 0]):
+        return a
+
+    assert list(fct.map([1, 2, 3])) == [1, 2, 3]
+    assert texe.stats()[f"{fct.__module__}.{fct.__qualname__}"].calls == 3
@@ -0,0 +1,110 @@
+import time
+import pytest
+
+from typing_exe.decorators import execute_annotations
+from typing_exe.annotations import Assert, Modify, Sequence
+from typing_exe.cache import LRUCache
+
+
+class TestPure:
+    def test_modify(self):
+        calls = []
+
+        def parse(a):
+            calls.append(a)
+            return int(a)
+
+        annotation = Modify[parse].pure(maxsize=2)
+
+        @execute_annotations
+        def fct(a: annotation):
+            return a
+
+        assert [fct("1"), fct("1"), fct("2"), fct("1")] == [1, 1, 2, 1]
+        assert calls == ["1", "2"]
+
+        info = annotation.cache_info()
+        assert (info.hits, info.misses, info.maxsize, info.currsize) == (2, 2, 2, 2)
+
+        fct("3")   # evicts "2", the least recently used
+        fct("2")
+        assert calls == ["1", "2", "3", "2"]
+
+        annotation.cache_clear()
+        assert annotation.cache_info().currsize == 0
+
+    def test_other_parameters_are_part_of_the_key(self):
+        calls = []
+
+        def scale(a, factor):
+            calls.append((a, factor))
+            return a * factor
+
+        @execute_annotations
+        def fct(a: Modify[scale].pure(), factor=2):
+            return a
+
+        assert [fct(1), fct(1), fct(1, 3), fct(1, factor=3)] == [2, 2, 3, 3]
+        assert calls == [(1, 2), (1, 3)]
+
+    def test_types_are_part_of_the_key(self):
+        @execute_annotations
+        def fct(a: Modify[repr].pure()):
+            return a
+
+        assert [fct(1), fct(True), fct(1.0)] == ["1", "True", "1.0"]
+
+        @execute_annotations
+        def scaled(a: Modify[lambda a, factor: repr(a * factor)].pure(), factor=1):
+            return a
+
+        assert [scaled(1, 1), scaled(1, 1.0), scaled(1, True)] == ["1", "1.0", "1"]
+
+    def test_sequence(self):
+        calls = []
+
+        def normalize(a):
+            calls.append(a)
+            return a.strip().lower()
+
+        @execute_annotations
+        def fct(a: Sequence[Modify[normalize], Assert[lambda a: a != ""]].pure()):
+            return a
+
+        assert fct(" A ") == "a"
+        assert fct(" A ") == "a"
+        assert calls == [" A "]
+
+        with pytest.raises(ValueError):   # failures are never cached
+            fct("  ")
+        with pytest.raises(ValueError):
+            fct("  ")
+
+    def test_unhashable(self):
+        @execute_annotations
+        def fct(a: Modify[lambda a: len(a)].pure()):
+            return a
+
+        assert fct([1, 2]) == 2
+        assert fct.__wrapped__.__annotations__["a"].cache_info().currsize == 0
+
+    def test_not_pure(self):
+        assert Modify[lambda a: a].cache_info() is None
+
+
+class TestLRUCache:
+    def test_ttl(self):
+        cache = LRUCache(maxsize=4, ttl=0.01)
+        cache.store("key", 1)
+        assert cache.lookup("key") == (True, 1)
+
+        time.sleep(0.02)
+        assert cache.lookup("key") == (False, None)
+        assert cache.info().currsize == 0
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            LRUCache(maxsize=0)
+
+        with pytest.raises(ValueError):
+            LRUCache(ttl=0)
@@ -0,0 +1,113 @@
+import sys
+import typing
+import collections.abc
+import pytest
+
+from typing_exe.decorators import execute_annotations
+from typing_exe.annotations import Assert, Modify, Sequence
+from typing_exe.typecheck import compile_typehint, TypeChecker
+
+
+class TestCompileTypehint:
+    def test_builtins(self):
+        check = compile_typehint(int)
+        assert check(1) and check(True) and not check(1.) and not check("1")
+        assert isinstance(check, TypeChecker)
+        assert check.verdicts == {int: True, bool: True, float: False, str: False}
+
+    def test_cached(self):
+        assert compile_typehint(typing.List[int]) is compile_typehint(typing.List[int])
+
+    def test_union_and_optional(self):
+        check = compile_typehint(typing.Union[int, str])
+        assert check(1) and check("a") and not check(None)
+        assert isinstance(check, TypeChecker)
+
+        check = compile_typehint(typing.Optional[typing.List[int]])
+        assert check(None) and check([1, 2]) and not check([1, "2"])
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="X | Y requires Python 3.10")
+    def test_union_type(self):
+        check = compile_typehint(eval("int | None"))
+        assert check(None) and check(1) and not check(1.)
+
+    @pytest.mark.skipif(sys.version_info < (3, 9), reason="list[int] requires Python 3.9")
+    def test_generics(self):
+        check = compile_typehint(eval("list[int]"))
+        assert check([]) and check([1, 2]) and not check([1, "a"]) and not check((1, 2))
+
+        check = compile_typehint(eval("dict[str, int]"))
+        assert check({"a": 1}) and not check({"a": "b"}) and not check({1: 1})
+
+        check = compile_typehint(eval("tuple[int, str]"))
+        assert check((1, "a")) and not check((1, 2)) and not check((1,))
+
+        check = compile_typehint(eval("tuple[int, ...]"))
+        assert check(()) and check((1, 2, 3)) and not check((1, "a"))
+
+    def test_abcs(self):
+        check = compile_typehint(collections.abc.Iterable)
+        assert check([]) and check(iter([])) and not check(1)
+
+        check = compile_typehint(typing.Iterator[int])
+        iterator = iter(["not an int"])
+        assert check(iterator)
+        assert next(iterator) == "not an int"   # not consumed
+
+    def test_other(self):
+        assert compile_typehint(typing.Any)(object())
+        assert compile_typehint(typing.Literal[1, "a"])("a")
+        assert not compile_typehint(typing.Literal[1])(True)
+        assert compile_typehint(typing.TypeVar("T", bound=int))(1)
+        assert not compile_typehint(typing.TypeVar("T", bound=int))("a")
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+class TestCheckTypes:
+    def test_assert(self, compiled):
+        @execute_annotations(compiled=compiled, check_types=True)
+        def fct(a: Assert[int, lambda a: a < 5], b: Assert[float] = None):
+            return a
+
+        assert fct(1) == 1
+        assert fct(1, 1.) == 1
+
+        with pytest.raises(TypeError):
+            fct("1")   # checked before the lambda, which would raise a different TypeError
+
+        with pytest.raises(TypeError):
+            fct(1, 1)
+
+    def test_modify_checks_result(self, compiled):
+        @execute_annotations(compiled=compiled, check_types=True)
+        def fct(a: Modify[float, lambda a: 1. if a is None else a] = None) -> Modify[str, lambda r: r]:
+            return str(a)
+
+        assert fct() == "1.0"
+
+        with pytest.raises(TypeError):
+            fct(1)
+
+    def test_sequence(self, compiled):
+        @execute_annotations(compiled=compiled, check_types=True)
+        def fct(a: Sequence[int, Assert[str, lambda a: a.isdigit()], Modify[lambda a: int(a)]]):
+            return a
+
+        assert fct("1") == 1
+
+        with pytest.raises(TypeError):
+            fct(1)
+
+    def test_only_with_level_full(self, compiled):
+        @execute_annotations(compiled=compiled, check_types=True, level="asserts-only")
+        def fct(a: Assert[int]):
+            return a
+
+        assert fct("1") == "1"
+
+    def test_not_by_default(self, compiled):
+        @execute_annotations(compiled=compiled)
+        def fct(a: Assert[int]):
+            return a
+
+        assert fct("1") == "1"
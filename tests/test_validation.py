@@ -0,0 +1,197 @@
+import io
+import csv
+import json
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import typing_exe as texe
+from typing_exe.decorators import execute_annotations
+from typing_exe.annotations import Assert, Modify, Sequence
+from typing_exe.early_return import EarlyReturn
+
+
+def is_positive(a):
+    return a > 0
+
+
+def to_int(a):
+    return int(a)
+
+
+calls = []
+
+
+@execute_annotations
+def person(name: Modify[lambda name: name.strip()], age: Sequence[Modify[to_int], Assert[is_positive]], city="") -> str:
+    calls.append(name)
+    return name
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+class TestValidate:
+    def test_passed(self, compiled):
+        @execute_annotations(compiled=compiled)
+        def fct(a: Modify[abs], b: Assert[lambda b, a: b > a] = 10) -> Assert[lambda r: False]:
+            calls.append(a)
+
+        calls.clear()
+        result = fct.validate(-2)
+        assert result.ok
+        assert result.arguments == {"a": 2, "b": 10}
+        assert texe.validation.validate(fct, a=-2, b=5) == result._replace(arguments={"a": 2, "b": 5})
+        assert calls == []
+
+    def test_failed(self, compiled):
+        @execute_annotations(compiled=compiled, check_types=True)
+        def fct(a: Assert[int, is_positive], b: Assert[is_positive], c: Assert[is_positive] = 1):
+            return a
+
+        result = fct.validate(-1, b=-2)
+        assert not result.ok and result.arguments is None
+        assert [(type(error), error.parameter) for error in result.errors] == [
+            (texe.errors.AssertFailed, "a"), (texe.errors.AssertFailed, "b")
+        ]
+        assert [error.parameter for error in fct.validate(1.5, 1).errors] == ["a"]
+        assert isinstance(fct.validate(1.5, 1).errors[0], texe.errors.TypehintViolated)
+
+        with pytest.raises(ValueError):
+            fct(-1, 1)   # The function itself isn't changed
+
+    def test_early_return(self, compiled):
+        @execute_annotations(compiled=compiled)
+        def fct(a: Modify[lambda a: EarlyReturn(a * 2) if a < 0 else a], b=EarlyReturn(0)):
+            return a
+
+        assert fct.validate(-1, 1) == texe.validation.ValidationResult(None, [], EarlyReturn(-2))
+        assert fct.validate(1).early_return == EarlyReturn(0)
+        assert fct.validate(1, 1).arguments == {"a": 1, "b": 1}
+
+    def test_arguments(self, compiled):
+        @execute_annotations(compiled=compiled)
+        def fct(a: Modify[abs], /, *args, b: Modify[abs], **kwargs):
+            return a
+
+        assert fct.validate(-1, 2, 3, b=-4, c=5).arguments == {"a": 1, "args": (2, 3), "b": 4, "kwargs": {"c": 5}}
+        assert fct.validate_record({"a": -1, "b": -2}).arguments == {"a": 1, "args": (), "b": 2, "kwargs": {}}
+        error, = fct.validate().errors
+        assert isinstance(error, TypeError)
+
+
+def test_validate_record():
+    calls.clear()
+    assert person.validate_record({"name": " Ann ", "age": "31"}).arguments == {"name": "Ann", "age": 31, "city": ""}
+    assert texe.validation.validate_record(person, {"name": "Bob", "age": "-1"}).errors[0].parameter == "age"
+    assert isinstance(person.validate_record({"name": "Bob", "age": "1", "other": 1}).errors[0], TypeError)
+    assert calls == []
+
+
+def test_undecorated():
+    def fct(a: Modify[abs], b: Assert[is_positive]):
+        return a
+
+    assert texe.validation.validate(fct, -1, 1).arguments == {"a": 1, "b": 1}
+    assert not texe.validation.validate(fct, 1, -1).ok
+    assert texe.validation.get_validator(fct) is texe.validation.get_validator(fct)
+
+
+def test_async():
+    @execute_annotations
+    async def fct(a: Modify[abs], b: Assert[is_positive]):
+        return a
+
+    assert asyncio.run(fct.validate(-1, 1)).arguments == {"a": 1, "b": 1}
+    assert not asyncio.run(fct.validate(-1, -1)).ok
+
+
+def test_describe_error():
+    error, = person.validate("Ann", "-1").errors
+    assert texe.validation.describe_error(error) == {
+        "error": "AssertFailed", "parameter": "age", "item": "is_positive", "value": "-1"
+    }
+    assert texe.validation.describe_error(ValueError("x")) == {"error": "ValueError", "message": "x"}
+
+
+RECORDS = [
+    {"name": " Ann ", "age": "31"},
+    {"name": "Bob", "age": "-1"},
+    {"name": "Cid", "age": "x"},
+    {"name": "Dan", "age": "40", "city": "Bern"},
+]
+
+
+@execute_annotations
+def resident(name: Modify[str.strip], age: Assert[lambda age: age != ""], city: Modify[str.strip] = "Zurich"):
+    return name
+
+
+class TestValidateFile:
+    @pytest.mark.parametrize("executor", [None, ThreadPoolExecutor(2)])
+    def test_jsonl(self, tmp_path, executor):
+        source = tmp_path / "people.jsonl"
+        source.write_text("\n".join(json.dumps(record) for record in RECORDS) + "\n\n[1]\n{broken\n")
+
+        result = texe.validation.validate_file(
+            person, source, tmp_path / "passed.jsonl", tmp_path / "failed.jsonl", chunksize=2, executor=executor
+        )
+        assert result == texe.validation.FileValidation(passed=2, failed=4)
+
+        passed = [json.loads(line) for line in (tmp_path / "passed.jsonl").read_text().splitlines()]
+        assert passed == [{"name": "Ann", "age": 31, "city": ""}, {"name": "Dan", "age": 40, "city": "Bern"}]
+
+        failed = [json.loads(line) for line in (tmp_path / "failed.jsonl").read_text().splitlines()]
+        assert [entry["number"] for entry in failed] == [2, 3, 5, 6]
+        assert failed[0]["record"] == RECORDS[1]
+        assert failed[0]["errors"] == [
+            {"error": "AssertFailed", "parameter": "age", "item": "is_positive", "value": "-1"}
+        ]
+        assert failed[1]["errors"][0]["error"] == "ValueError"   # int("x") raised
+        assert failed[2]["errors"][0]["error"] == "TypeError"
+        assert failed[3]["record"] == "{broken"
+
+    def test_csv(self):
+        source = io.StringIO()
+        writer = csv.DictWriter(source, fieldnames=["name", "age", "city"])
+        writer.writeheader()
+        writer.writerows(RECORDS)
+        source.seek(0)
+        passed, failed = io.StringIO(), io.StringIO()
+
+        result = texe.validation.validate_file(person, source, passed, failed, file_format="csv")
+        assert result == (2, 2)
+
+        assert list(csv.DictReader(io.StringIO(passed.getvalue()))) == [
+            {"name": "Ann", "age": "31", "city": ""}, {"name": "Dan", "age": "40", "city": "Bern"}
+        ]
+        failed = list(csv.DictReader(io.StringIO(failed.getvalue())))
+        assert [(row["name"], row["city"]) for row in failed] == [("Bob", ""), ("Cid", "")]
+        assert json.loads(failed[0]["errors"])[0]["parameter"] == "age"
+
+    def test_csv_short_rows(self):
+        source = io.StringIO("name,age,city\nAnn,31\nBob\nCid,40,Bern,extra\n")
+        passed, failed = io.StringIO(), io.StringIO()
+
+        assert texe.validation.validate_file(resident, source, passed, failed, file_format="csv") == (2, 1)
+        assert list(csv.DictReader(io.StringIO(passed.getvalue()))) == [
+            {"name": "Ann", "age": "31", "city": "Zurich"}, {"name": "Cid", "age": "40", "city": "Bern"}
+        ]
+        failed, = csv.DictReader(io.StringIO(failed.getvalue()))
+        assert json.loads(failed["errors"])[0]["error"] == "TypeError"   # Bob has no age, which has no default
+
+    def test_arguments(self, tmp_path):
+        with pytest.raises(ValueError):
+            texe.validation.validate_file(person, tmp_path / "people.txt", io.StringIO(), io.StringIO())
+        with pytest.raises(ValueError):
+            texe.validation.validate_file(person, io.StringIO(), io.StringIO(), io.StringIO(), file_format="xml")
+        with pytest.raises(ValueError):
+            texe.validation.validate_file(
+                person, io.StringIO(), io.StringIO(), io.StringIO(), file_format="csv", chunksize=0
+            )
+
+        @execute_annotations
+        async def fct(a: Assert[is_positive]):
+            return a
+
+        with pytest.raises(TypeError):
+            texe.validation.validate_file(fct, io.StringIO(), io.StringIO(), io.StringIO(), file_format="jsonl")